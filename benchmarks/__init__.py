@@ -0,0 +1 @@
+# Performance benchmarks (stdlib only; run as modules, not collected by pytest)
@@ -0,0 +1,144 @@
+"""
+Scaling benchmark for derived.consequence_extractor.extract_consequences.
+
+    python -m benchmarks.bench_extractor                    # run + compare to baseline
+    python -m benchmarks.bench_extractor --update-baseline  # record a new baseline
+    python -m benchmarks.bench_extractor --quick            # smallest grid only
+
+Writes machine-readable JSON results and exits non-zero when any case is
+slower than the stored baseline by more than --tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from derived.consequence_extractor import extract_consequences
+from tests.fixtures import synthetic_events
+
+BENCH_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = BENCH_DIR / "baseline_extractor.json"
+RESULTS_PATH = BENCH_DIR / "results" / "extractor.json"
+
+# (actors, turns, events_per_turn, window)
+GRID = {
+    "actors": [10, 100, 1000],
+    "turns": [20, 100],
+    "events_per_turn": [1, 4],
+    "window": [5, 20],
+}
+
+QUICK_GRID = {
+    "actors": [10, 100],
+    "turns": [20],
+    "events_per_turn": [1],
+    "window": [5],
+}
+
+DEFAULT_TOLERANCE = 0.25
+
+
+def case_id(actors: int, turns: int, events_per_turn: int, window: int) -> str:
+    return f"a{actors}_t{turns}_e{events_per_turn}_w{window}"
+
+
+def _time_case(events: List[Dict[str, Any]], current_turn: int, window: int, repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_consequences(events, current_turn=current_turn, window=window)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_grid(grid: Dict[str, List[int]], repeat: int) -> List[Dict[str, Any]]:
+    results = []
+    keys = ("actors", "turns", "events_per_turn", "window")
+    for actors, turns, per_turn, window in itertools.product(*(grid[k] for k in keys)):
+        events = synthetic_events(actors, turns, per_turn, seed=0)
+        timings = _time_case(events, turns, window, repeat)
+        best = min(timings)
+        results.append({
+            "case": case_id(actors, turns, per_turn, window),
+            "params": {"actors": actors, "turns": turns, "events_per_turn": per_turn, "window": window},
+            "events": len(events),
+            "repeat": repeat,
+            "best_s": best,
+            "median_s": statistics.median(timings),
+            "events_per_s": len(events) / best if best > 0 else float("inf"),
+        })
+        print(f"  {results[-1]['case']:<24} events={len(events):>8}  best={best * 1e3:9.2f} ms")
+    return results
+
+
+def compare(results: List[Dict[str, Any]], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """
+    Cases whose best time exceeds baseline * (1 + tolerance).
+    """
+    base = {r["case"]: r for r in baseline.get("results", [])}
+    regressions = []
+    for r in results:
+        ref = base.get(r["case"])
+        if not ref or ref["best_s"] <= 0:
+            continue
+        ratio = r["best_s"] / ref["best_s"]
+        r["baseline_ratio"] = ratio
+        if ratio > 1.0 + tolerance:
+            regressions.append({"case": r["case"], "ratio": ratio, "best_s": r["best_s"], "baseline_s": ref["best_s"]})
+    return regressions
+
+
+def _payload(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "benchmark": "extract_consequences",
+        "schema_version": "0.1",
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--quick", action="store_true", help="run the smallest grid only")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--out", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    print("BENCH: extract_consequences")
+    results = run_grid(QUICK_GRID if args.quick else GRID, args.repeat)
+
+    regressions: List[Dict[str, Any]] = []
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(_payload(results), indent=2) + "\n", encoding="utf-8")
+        print(f"[OK] baseline written: {args.baseline}")
+    elif args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.tolerance)
+    else:
+        print(f"[WARN] no baseline at {args.baseline}; skipping comparison")
+
+    payload = _payload(results)
+    payload["tolerance"] = args.tolerance
+    payload["regressions"] = regressions
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    print(f"[OK] results written: {args.out}")
+
+    for reg in regressions:
+        print(f"[REGRESSION] {reg['case']}: {reg['ratio']:.2f}x baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+"""
+Memory budget benchmark for derived ConsequenceState maps.
+
+    python -m benchmarks.bench_memory                 # 1k, 10k, 100k actors
+    python -m benchmarks.bench_memory --actors 1000   # single size
+
+For each size, builds the map with extract_consequences over synthetic
+events and measures, per actor:
+    retained_bytes   tracemalloc current after the build (map only)
+    peak_bytes       tracemalloc peak during the build
+    object_bytes     deep sys.getsizeof of the states (shared objects once)
+    json_bytes       json.dumps of {actor: state.to_dict()}
+
+Exits non-zero when any measurement exceeds its per-actor budget.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+from derived.consequence_extractor import extract_consequences
+from tests.fixtures import synthetic_events
+
+BENCH_DIR = Path(__file__).resolve().parent
+RESULTS_PATH = BENCH_DIR / "results" / "memory.json"
+
+SIZES = [1_000, 10_000, 100_000]
+WINDOW = 5
+EVENTS_PER_TURN = 2
+
+# Per-actor budgets (bytes), ~1.5x the measured v0.1 figures
+# (retained ~960, peak ~1350, objects ~700, json ~655 at 100k actors).
+# Raise deliberately, with the measurement that justifies it.
+BUDGETS = {
+    "retained_bytes": 1_536,
+    "peak_bytes": 2_048,
+    "object_bytes": 1_024,
+    "json_bytes": 1_024,
+}
+
+
+def deep_sizeof(obj: Any, seen: set | None = None) -> int:
+    """
+    sys.getsizeof over dataclasses, containers and their contents.
+    """
+    if seen is None:
+        seen = set()
+    stack = [obj]
+    total = 0
+    while stack:
+        o = stack.pop()
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        total += sys.getsizeof(o)
+        if is_dataclass(o) and not isinstance(o, type):
+            stack.extend(getattr(o, f.name) for f in fields(o))
+        elif isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+    return total
+
+
+def measure(actors: int) -> Dict[str, Any]:
+    events = synthetic_events(actors, WINDOW, EVENTS_PER_TURN, seed=0)
+    gc.collect()
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    states = extract_consequences(events, current_turn=WINDOW, window=WINDOW)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    object_bytes = deep_sizeof(states)
+    json_bytes = len(json.dumps({k: v.to_dict() for k, v in states.items()}))
+    tags = sum(len(s.tags) for s in states.values())
+    evidence = sum(len(s.evidence) for s in states.values())
+
+    n = len(states)
+    per_actor = {
+        "retained_bytes": (current - base) / n,
+        "peak_bytes": (peak - base) / n,
+        "object_bytes": object_bytes / n,
+        "json_bytes": json_bytes / n,
+    }
+    return {
+        "actors": n,
+        "events": len(events),
+        "tags_per_actor": tags / n,
+        "evidence_per_actor": evidence / n,
+        "per_actor": per_actor,
+        "over_budget": sorted(k for k, v in per_actor.items() if v > BUDGETS[k]),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actors", type=int, action="append", help="actor count (repeatable)")
+    parser.add_argument("--out", type=Path, default=RESULTS_PATH)
+    args = parser.parse_args(argv)
+
+    print("BENCH: ConsequenceState memory")
+    results = []
+    for actors in args.actors or SIZES:
+        r = measure(actors)
+        results.append(r)
+        pa = r["per_actor"]
+        print(
+            f"  actors={r['actors']:>7}  retained={pa['retained_bytes']:7.0f} B  peak={pa['peak_bytes']:7.0f} B"
+            f"  objects={pa['object_bytes']:7.0f} B  json={pa['json_bytes']:6.0f} B"
+            f"  evidence/actor={r['evidence_per_actor']:.2f}"
+        )
+
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps({"benchmark": "consequence_memory", "schema_version": "0.1",
+                                    "budgets": BUDGETS, "results": results}, indent=2) + "\n", encoding="utf-8")
+    print(f"[OK] results written: {args.out}")
+
+    failed = [r for r in results if r["over_budget"]]
+    for r in failed:
+        print(f"[OVER BUDGET] actors={r['actors']}: {', '.join(r['over_budget'])}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,11 +4,15 @@ from typing import Dict, List, Any, Tuple
 from dataclasses import replace
 import math
 
+from engine import metrics
+
 from .consequence_state import (
     EvidenceItem,
     ConsequenceSignals,
     ConsequenceIndices,
     ConsequenceState,
+    FiredRule,
+    LazyEvidence,
 )
 
 # -------------------------------------------------
@@ -33,14 +37,28 @@ def _variance(values: List[float]) -> float:
     return sum((v - mean) ** 2 for v in values) / len(values)
 
 
+def _evidence(rules: List[FiredRule], window: int, turns: List[int], lazy: bool) -> List[EvidenceItem]:
+    if lazy:
+        return LazyEvidence.deferred(rules, window, turns)
+    return [
+        EvidenceItem(signal=signal, value=value, threshold=threshold, window=window, turns=turns)
+        for signal, value, threshold in rules
+    ]
+
+
+@metrics.timed("extract_consequences")
 def extract_consequences(
     events: List[Dict[str, Any]],
     *,
     current_turn: int,
     window: int = 5,
+    lazy_evidence: bool = False,
 ) -> Dict[str, ConsequenceState]:
     """
     Deterministically derive consequence states from historical events.
+
+    With lazy_evidence=True only the fired rules are recorded; evidence
+    lists build their EvidenceItems on first read (identical to eager).
     """
 
     lo = current_turn - window + 1
@@ -62,6 +80,7 @@ def extract_consequences(
         by_actor.setdefault(actor, []).append(e)
 
     results: Dict[str, ConsequenceState] = {}
+    fired: Dict[str, List[FiredRule]] = {}
 
     # -------------------------
     # First pass: per-actor metrics
@@ -125,47 +144,25 @@ def extract_consequences(
         )
 
         tags: List[str] = []
-        evidence: List[EvidenceItem] = []
+        rules: List[FiredRule] = []
 
         if capacity_index >= 0.65 and stability_index >= 0.55:
             tags.append("STRONG")
-            evidence.append(EvidenceItem(
-                signal="capacity_index",
-                value=capacity_index,
-                threshold=0.65,
-                window=window,
-                turns=turns_used,
-            ))
+            rules.append(("capacity_index", capacity_index, 0.65))
 
         if attempts >= max(3, window // 2) and risk_index >= 0.45:
             tags.append("AGGRESSIVE")
-            evidence.append(EvidenceItem(
-                signal="risk_index",
-                value=risk_index,
-                threshold=0.45,
-                window=window,
-                turns=turns_used,
-            ))
+            rules.append(("risk_index", risk_index, 0.45))
 
         if momentum_index <= -0.5:
             tags.append("DECLINING")
-            evidence.append(EvidenceItem(
-                signal="momentum_index",
-                value=momentum_index,
-                threshold=-0.5,
-                window=window,
-                turns=turns_used,
-            ))
+            rules.append(("momentum_index", momentum_index, -0.5))
 
         if stability_index <= 0.35:
             tags.append("UNSTABLE")
-            evidence.append(EvidenceItem(
-                signal="stability_index",
-                value=stability_index,
-                threshold=0.35,
-                window=window,
-                turns=turns_used,
-            ))
+            rules.append(("stability_index", stability_index, 0.35))
+
+        fired[actor] = rules
 
         results[actor] = ConsequenceState(
             actor_id=actor,
@@ -174,7 +171,7 @@ def extract_consequences(
             signals=signals,
             indices=indices,
             tags=tags,
-            evidence=evidence,
+            evidence=_evidence(rules, window, turns_used, lazy_evidence),
         )
 
     # -------------------------
@@ -198,12 +195,24 @@ def extract_consequences(
             top = results[top_id]
             new_indices = replace(top.indices, dominance_index=margin)
             new_tags = list(top.tags)
-            new_evidence = list(top.evidence)
 
             if "DOMINANT" not in new_tags:
                 new_tags.append("DOMINANT")
 
-            new_evidence.append(EvidenceItem(
-                signal="dominance_margin",
-                value=margin,
-                threshold=DOMINANCE_MARGIN,
+            rules = fired[top_id] + [("dominance_margin", margin, DOMINANCE_MARGIN)]
+            new_evidence = _evidence(rules, window, turns_used, lazy_evidence)
+
+            results[top_id] = replace(
+                top,
+                indices=new_indices,
+                tags=new_tags,
+                evidence=new_evidence,
+            )
+
+    if metrics.enabled():
+        metrics.count("events_scanned", len(events))
+        metrics.count("events_in_window", sum(len(v) for v in by_actor.values()))
+        metrics.count("actors_evaluated", len(results))
+        metrics.count("evidence_items", sum(len(cs.evidence) for cs in results.values()))
+
+    return results
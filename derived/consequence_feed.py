@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, asdict
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from .consequence_index import INDEX_FIELDS
+from .consequence_state import ConsequenceState
+
+# -------------------------------------------------
+# Change feed (v0.1)
+#
+# publish(turn, results) diffs each turn's extraction output against
+# what subscribers have already been told and emits one FeedMessage:
+#   ACTOR_ADDED / ACTOR_REMOVED   actor entered / left the results
+#   TAG_ADDED / TAG_REMOVED       one message per tag
+#   INDEX_MOVED                   |new - last emitted| > epsilon
+#
+# Index moves are measured against the last *emitted* value, so slow
+# drift accumulates and a follower never strays more than epsilon.
+# Every `snapshot_every` turns (and on the first publish) the message is
+# a full snapshot instead, so consumers can resync from it alone.
+#
+# Feed views carry tags (sorted) and indices only; evidence stays with
+# the extraction output.
+# -------------------------------------------------
+
+ACTOR_ADDED = "ACTOR_ADDED"
+ACTOR_REMOVED = "ACTOR_REMOVED"
+TAG_ADDED = "TAG_ADDED"
+TAG_REMOVED = "TAG_REMOVED"
+INDEX_MOVED = "INDEX_MOVED"
+
+View = Dict[str, Any]  # {"tags": [...], "indices": {field: value}}
+
+
+@dataclass(frozen=True)
+class Change:
+    actor: str
+    kind: str
+    field: Optional[str] = None
+    old: Any = None
+    new: Any = None
+
+
+@dataclass(frozen=True)
+class FeedMessage:
+    turn: int
+    snapshot: bool
+    changes: List[Change] = field(default_factory=list)
+    # Full views, present only on snapshot messages
+    states: Optional[Dict[str, View]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def view_of(state: ConsequenceState) -> View:
+    return {
+        "tags": sorted(state.tags),
+        "indices": {f: getattr(state.indices, f) for f in INDEX_FIELDS},
+    }
+
+
+def apply_message(views: Dict[str, View], message: FeedMessage) -> Dict[str, View]:
+    """
+    Follower side: fold one message into a views map (returns the map).
+    """
+    if message.snapshot:
+        views.clear()
+        for actor, v in (message.states or {}).items():
+            views[actor] = {"tags": list(v["tags"]), "indices": dict(v["indices"])}
+        return views
+
+    for c in message.changes:
+        if c.kind == ACTOR_ADDED:
+            views[c.actor] = {"tags": list(c.new["tags"]), "indices": dict(c.new["indices"])}
+        elif c.kind == ACTOR_REMOVED:
+            views.pop(c.actor, None)
+        elif c.kind == TAG_ADDED:
+            views[c.actor]["tags"] = sorted(views[c.actor]["tags"] + [c.field])
+        elif c.kind == TAG_REMOVED:
+            views[c.actor]["tags"].remove(c.field)
+        elif c.kind == INDEX_MOVED:
+            views[c.actor]["indices"][c.field] = c.new
+        else:
+            raise ValueError(f"unknown change kind: {c.kind}")
+    return views
+
+
+class ConsequenceFeed:
+    """
+    Per-turn delta publisher over extraction results.
+    """
+
+    def __init__(self, *, epsilon: float = 1e-6, snapshot_every: int = 50) -> None:
+        if epsilon < 0:
+            raise ValueError("epsilon must be >= 0")
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be >= 1")
+        self.epsilon = epsilon
+        self.snapshot_every = snapshot_every
+        self._emitted: Dict[str, View] = {}
+        self._subscribers: List[Callable[[FeedMessage], None]] = []
+        self._since_snapshot: Optional[int] = None
+        self._last_turn: Optional[int] = None
+
+    def subscribe(self, callback: Callable[[FeedMessage], None]) -> None:
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[FeedMessage], None]) -> None:
+        self._subscribers.remove(callback)
+
+    def publish(self, turn: int, results: Mapping[str, ConsequenceState]) -> FeedMessage:
+        if self._last_turn is not None and turn <= self._last_turn:
+            raise ValueError(f"turns must increase: {turn} after {self._last_turn}")
+        self._last_turn = turn
+
+        if self._since_snapshot is None or self._since_snapshot + 1 >= self.snapshot_every:
+            message = self._snapshot(turn, results)
+            self._since_snapshot = 0
+        else:
+            message = FeedMessage(turn=turn, snapshot=False, changes=self._diff(results))
+            self._since_snapshot += 1
+
+        for callback in list(self._subscribers):
+            callback(message)
+        return message
+
+    def _snapshot(self, turn: int, results: Mapping[str, ConsequenceState]) -> FeedMessage:
+        states = {actor: view_of(results[actor]) for actor in sorted(results)}
+        self._emitted = {a: {"tags": list(v["tags"]), "indices": dict(v["indices"])} for a, v in states.items()}
+        return FeedMessage(turn=turn, snapshot=True, states=states)
+
+    def _diff(self, results: Mapping[str, ConsequenceState]) -> List[Change]:
+        eps = self.epsilon
+        emitted = self._emitted
+        changes: List[Change] = []
+
+        for actor in sorted(set(emitted) | set(results)):
+            old = emitted.get(actor)
+            state = results.get(actor)
+            if state is None:
+                changes.append(Change(actor, ACTOR_REMOVED))
+                del emitted[actor]
+                continue
+            if old is None:
+                new = view_of(state)
+                changes.append(Change(actor, ACTOR_ADDED, new=new))
+                emitted[actor] = {"tags": list(new["tags"]), "indices": dict(new["indices"])}
+                continue
+
+            old_tags, new_tags = set(old["tags"]), set(state.tags)
+            if old_tags != new_tags:
+                changes.extend(Change(actor, TAG_REMOVED, field=t) for t in sorted(old_tags - new_tags))
+                changes.extend(Change(actor, TAG_ADDED, field=t) for t in sorted(new_tags - old_tags))
+                old["tags"] = sorted(new_tags)
+
+            indices = old["indices"]
+            for f in INDEX_FIELDS:
+                value = getattr(state.indices, f)
+                if abs(value - indices[f]) > eps:
+                    changes.append(Change(actor, INDEX_MOVED, field=f, old=indices[f], new=value))
+                    indices[f] = value
+        return changes
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Deque, Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
+
+from .consequence_state import ConsequenceState
+
+# -------------------------------------------------
+# Query index (v0.1)
+#
+# Built incrementally from extract_consequences output, one turn at a
+# time (turns strictly increasing). Per turn it keeps:
+#   tag   -> frozenset(actor ids)                     inverted index
+#   field -> (sorted values, actor ids in same order) per numeric index
+#
+# Tag queries intersect the smallest sets first; range queries bisect.
+# Neither scans every actor. Results are observational and read-only.
+# -------------------------------------------------
+
+INDEX_FIELDS: Tuple[str, ...] = (
+    "capacity_index",
+    "stability_index",
+    "momentum_index",
+    "risk_index",
+    "dominance_index",
+)
+
+
+class TurnIndex:
+    """
+    Inverted tag index and sorted per-field indexes for one turn.
+    """
+
+    __slots__ = ("turn", "tags", "fields")
+
+    def __init__(self, turn: int, results: Mapping[str, ConsequenceState]) -> None:
+        self.turn = turn
+        tags: Dict[str, Set[str]] = {}
+        columns: Dict[str, List[Tuple[float, str]]] = {f: [] for f in INDEX_FIELDS}
+        for actor, state in results.items():
+            for tag in state.tags:
+                tags.setdefault(tag, set()).add(actor)
+            indices = state.indices
+            for f in INDEX_FIELDS:
+                columns[f].append((getattr(indices, f), actor))
+
+        self.tags: Dict[str, FrozenSet[str]] = {t: frozenset(a) for t, a in tags.items()}
+        self.fields: Dict[str, Tuple[List[float], List[str]]] = {}
+        for f, pairs in columns.items():
+            pairs.sort()
+            self.fields[f] = ([v for v, _ in pairs], [a for _, a in pairs])
+
+    def with_tags(self, tags: Tuple[str, ...]) -> Set[str]:
+        sets = sorted((self.tags.get(t, frozenset()) for t in tags), key=len)
+        if not sets:
+            return set()
+        out = set(sets[0])
+        for s in sets[1:]:
+            if not out:
+                break
+            out &= s
+        return out
+
+    def in_range(
+        self,
+        field: str,
+        lo: Optional[float],
+        hi: Optional[float],
+        lo_inclusive: bool,
+        hi_inclusive: bool,
+    ) -> List[str]:
+        if field not in self.fields:
+            raise ValueError(f"unknown index field: {field}")
+        values, actors = self.fields[field]
+        start = 0 if lo is None else (bisect_left if lo_inclusive else bisect_right)(values, lo)
+        end = len(values) if hi is None else (bisect_right if hi_inclusive else bisect_left)(values, hi)
+        return actors[start:end]
+
+
+class ConsequenceIndex:
+    """
+    Rolling query index over the most recent `retain` turns of results.
+    """
+
+    def __init__(self, retain: Optional[int] = None) -> None:
+        if retain is not None and retain < 1:
+            raise ValueError("retain must be >= 1")
+        self.retain = retain
+        self._turns: Deque[TurnIndex] = deque()
+        self._by_turn: Dict[int, TurnIndex] = {}
+
+    def add_turn(self, turn: int, results: Mapping[str, ConsequenceState]) -> None:
+        if self._turns and turn <= self._turns[-1].turn:
+            raise ValueError(f"turns must increase: {turn} after {self._turns[-1].turn}")
+        index = TurnIndex(turn, results)
+        self._turns.append(index)
+        self._by_turn[turn] = index
+        if self.retain is not None:
+            while len(self._turns) > self.retain:
+                del self._by_turn[self._turns.popleft().turn]
+
+    def turns(self) -> List[int]:
+        return [t.turn for t in self._turns]
+
+    def _at(self, turn: Optional[int]) -> TurnIndex:
+        if not self._turns:
+            raise ValueError("index is empty")
+        if turn is None:
+            return self._turns[-1]
+        if turn not in self._by_turn:
+            raise ValueError(f"turn not indexed: {turn}")
+        return self._by_turn[turn]
+
+    def _recent(self, last: Optional[int]) -> List[TurnIndex]:
+        if last is not None and last < 1:
+            raise ValueError("last must be >= 1")
+        turns = list(self._turns)
+        return turns if last is None else turns[-last:]
+
+    # -------------------------
+    # Single-turn queries
+    # -------------------------
+
+    def with_tags(self, *tags: str, turn: Optional[int] = None) -> Set[str]:
+        """
+        Actors carrying every one of `tags` at `turn` (default: latest).
+        """
+        return self._at(turn).with_tags(tags)
+
+    def in_range(
+        self,
+        field: str,
+        lo: Optional[float] = None,
+        hi: Optional[float] = None,
+        *,
+        turn: Optional[int] = None,
+        lo_inclusive: bool = True,
+        hi_inclusive: bool = True,
+    ) -> List[str]:
+        """
+        Actors with lo <= field <= hi at `turn`, in ascending value order.
+        """
+        return self._at(turn).in_range(field, lo, hi, lo_inclusive, hi_inclusive)
+
+    # -------------------------
+    # Multi-turn queries
+    # -------------------------
+
+    def with_tags_over(self, *tags: str, last: Optional[int] = None, every: bool = False) -> Set[str]:
+        """
+        Actors carrying all `tags` in any (or, with every=True, each) of
+        the last `last` indexed turns.
+        """
+        return _combine((t.with_tags(tags) for t in self._recent(last)), every)
+
+    def in_range_over(
+        self,
+        field: str,
+        lo: Optional[float] = None,
+        hi: Optional[float] = None,
+        *,
+        last: Optional[int] = None,
+        every: bool = False,
+        lo_inclusive: bool = True,
+        hi_inclusive: bool = True,
+    ) -> Set[str]:
+        """
+        Actors within the range in any (or each) of the last `last` turns.
+        """
+        return _combine(
+            (set(t.in_range(field, lo, hi, lo_inclusive, hi_inclusive)) for t in self._recent(last)),
+            every,
+        )
+
+
+def _combine(sets, every: bool) -> Set[str]:
+    out: Optional[Set[str]] = None
+    for s in sets:
+        if out is None:
+            out = s
+        elif every:
+            out &= s
+            if not out:
+                break
+        else:
+            out |= s
+    return out or set()
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, asdict, replace
+from collections.abc import Sequence as SequenceABC
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 
 
 # -----------------------------
@@ -18,6 +19,74 @@ class EvidenceItem:
     note: Optional[str] = None
 
 
+# -----------------------------
+# Lazy evidence (materialized on first read)
+# -----------------------------
+
+# (signal, value, threshold) for one fired rule
+FiredRule = Tuple[str, float, float]
+
+
+class LazyEvidence(SequenceABC):
+    """
+    Read-only evidence sequence that builds its EvidenceItems on first read.
+
+    Holds only the fired rules plus the shared window / turns. len() does
+    not materialize; indexing, iteration and comparison do, and yield the
+    exact items eager extraction would have built. Compares equal to a
+    list with the same items; pickles as a plain list.
+    """
+
+    __slots__ = ("_items", "_pending")
+
+    def __init__(self, rules: Sequence[FiredRule], window: int, turns: List[int]) -> None:
+        self._items: Optional[List[EvidenceItem]] = None
+        self._pending: Optional[Tuple[Tuple[FiredRule, ...], int, List[int]]] = (tuple(rules), window, turns)
+
+    @classmethod
+    def deferred(cls, rules: Sequence[FiredRule], window: int, turns: List[int]) -> "LazyEvidence":
+        return cls(rules, window, turns)
+
+    @property
+    def materialized(self) -> bool:
+        return self._items is not None
+
+    def _list(self) -> List[EvidenceItem]:
+        items = self._items
+        if items is None:
+            rules, window, turns = self._pending
+            items = self._items = [
+                EvidenceItem(signal=signal, value=value, threshold=threshold, window=window, turns=turns)
+                for signal, value, threshold in rules
+            ]
+            self._pending = None
+        return items
+
+    def __len__(self) -> int:
+        return len(self._items) if self._items is not None else len(self._pending[0])
+
+    def __getitem__(self, index):
+        return self._list()[index]
+
+    def __iter__(self):
+        return iter(self._list())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyEvidence):
+            return self._list() == other._list()
+        if isinstance(other, list):
+            return self._list() == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self._list())
+
+    def __reduce__(self):
+        return (list, (self._list(),))
+
+
 # -----------------------------
 # Raw signals (measured, windowed)
 # -----------------------------
@@ -64,8 +133,11 @@ class ConsequenceState:
     # Human-readable labels (derived only, never authored)
     tags: List[str] = field(default_factory=list)
 
-    # Receipts for explainability / audits
-    evidence: List[EvidenceItem] = field(default_factory=list)
+    # Receipts for explainability / audits (a LazyEvidence when deferred)
+    evidence: Sequence[EvidenceItem] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # asdict() only recurses into lists, so evidence is rendered here
+        out = asdict(replace(self, evidence=[]))
+        out["evidence"] = [asdict(e) for e in self.evidence]
+        return out
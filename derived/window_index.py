@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from engine.interning import SymbolTable
+
+from .consequence_state import ConsequenceSignals
+
+# -------------------------------------------------
+# Window index (v0.1)
+#
+# Per actor, over the distinct turns it has events in (ascending):
+#   turns[k]                       k-th turn with events
+#   P_x[k + 1] = sum of x for turns[0..k]
+# for x in attempts, successes, cost, delta, magnitude, magnitude^2,
+# plus the per-turn delta sum (for momentum endpoints).
+#
+# signals(actor, lo, hi) bisects turns and differences the prefixes:
+# O(log n) per actor for any window, no rescans. Values are resolved
+# exactly as the extractor reads them.
+#
+# Numerical compatibility with extract_consequences:
+#   attempts / successes / failures      exact
+#   net_delta, avg_cost                  |err| <= TOLERANCE * (1 + prefix magnitude)
+#   outcome_variance                     E[m^2] - E[m]^2, clamped at 0;
+#                                        |err| <= TOLERANCE * (1 + prefix m^2 / n)
+# where "prefix" is the running total up to hi (rounding grows with
+# campaign length, not window size).
+# -------------------------------------------------
+
+TOLERANCE = 1e-9
+
+_NO_TURN = -10**9
+
+
+class _Series:
+    __slots__ = ("turns", "attempts", "successes", "cost", "delta", "mag", "mag2", "turn_delta")
+
+    def __init__(self) -> None:
+        self.turns = array("i")
+        self.attempts = array("q", [0])
+        self.successes = array("q", [0])
+        self.cost = array("d", [0.0])
+        self.delta = array("d", [0.0])
+        self.mag = array("d", [0.0])
+        self.mag2 = array("d", [0.0])
+        self.turn_delta = array("d")
+
+    def add(self, turn: int, ok: bool, cost: float, delta: float, mag: float) -> None:
+        turns = self.turns
+        if not turns or turn > turns[-1]:
+            turns.append(turn)
+            self.attempts.append(self.attempts[-1] + 1)
+            self.successes.append(self.successes[-1] + (1 if ok else 0))
+            self.cost.append(self.cost[-1] + cost)
+            self.delta.append(self.delta[-1] + delta)
+            self.mag.append(self.mag[-1] + mag)
+            self.mag2.append(self.mag2[-1] + mag * mag)
+            self.turn_delta.append(delta)
+        elif turn == turns[-1]:
+            self.attempts[-1] += 1
+            self.successes[-1] += 1 if ok else 0
+            self.cost[-1] += cost
+            self.delta[-1] += delta
+            self.mag[-1] += mag
+            self.mag2[-1] += mag * mag
+            self.turn_delta[-1] += delta
+        else:
+            raise ValueError(f"turn {turn} is older than indexed turn {turns[-1]}")
+
+
+class WindowIndex:
+    """
+    Cumulative per-actor sums; ConsequenceSignals for any (lo, hi).
+    """
+
+    def __init__(self, symbols: Optional[SymbolTable] = None) -> None:
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self._series: Dict[int, _Series] = {}
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict[str, Any]], symbols: Optional[SymbolTable] = None) -> "WindowIndex":
+        """
+        Build from an event stream in any order (stably sorted by turn).
+        """
+        index = cls(symbols)
+        keyed = []
+        for e in events:
+            turn = int(e.get("turn", _NO_TURN))
+            if turn != _NO_TURN:
+                keyed.append((turn, e))
+        keyed.sort(key=lambda te: te[0])
+        index.add(e for _, e in keyed)
+        return index
+
+    def add(self, events: Iterable[Dict[str, Any]]) -> None:
+        """
+        Append events; per actor, turns must not go backwards.
+        """
+        intern = self.symbols.intern
+        series = self._series
+        for e in events:
+            turn = int(e.get("turn", _NO_TURN))
+            actor = str(e.get("actor", "")).strip()
+            if turn == _NO_TURN or not actor:
+                continue
+            aid = intern(actor)
+            s = series.get(aid)
+            if s is None:
+                s = series[aid] = _Series()
+            s.add(
+                turn,
+                bool(e.get("ok", False)),
+                float(e.get("cost", 0.0) or 0.0),
+                float(e.get("delta", 0.0) or 0.0),
+                float(e.get("magnitude", e.get("delta", 0.0)) or 0.0),
+            )
+
+    def actors(self) -> List[str]:
+        return [self.symbols.name_of(aid) for aid in self._series]
+
+    def _bounds(self, s: _Series, lo: int, hi: int) -> Tuple[int, int]:
+        return bisect_left(s.turns, lo), bisect_right(s.turns, hi)
+
+    def signals(self, actor: str, lo: int, hi: int) -> Optional[ConsequenceSignals]:
+        """
+        Signals over turns [lo, hi]; None if the actor has no events there.
+        """
+        aid = self.symbols.get(actor)
+        s = self._series.get(aid) if aid is not None else None
+        if s is None:
+            return None
+        a, b = self._bounds(s, lo, hi)
+        return _signals(s, a, b)
+
+    def turn_delta(self, actor: str, turn: int) -> float:
+        """
+        Sum of deltas for one actor at one turn (0.0 if none).
+        """
+        aid = self.symbols.get(actor)
+        s = self._series.get(aid) if aid is not None else None
+        if s is None:
+            return 0.0
+        k = bisect_left(s.turns, turn)
+        return s.turn_delta[k] if k < len(s.turns) and s.turns[k] == turn else 0.0
+
+    def signals_window(self, current_turn: int, window: int) -> Dict[str, ConsequenceSignals]:
+        """
+        Signals for every actor with events in the extractor's window.
+        """
+        lo, hi = current_turn - window + 1, current_turn
+        name_of = self.symbols.name_of
+        out: Dict[str, ConsequenceSignals] = {}
+        for aid, s in self._series.items():
+            a, b = self._bounds(s, lo, hi)
+            sig = _signals(s, a, b)
+            if sig is not None:
+                out[name_of(aid)] = sig
+        return out
+
+
+def _signals(s: _Series, a: int, b: int) -> Optional[ConsequenceSignals]:
+    attempts = s.attempts[b] - s.attempts[a]
+    if attempts <= 0:
+        return None
+    successes = s.successes[b] - s.successes[a]
+    mean = (s.mag[b] - s.mag[a]) / attempts
+    variance = (s.mag2[b] - s.mag2[a]) / attempts - mean * mean
+    return ConsequenceSignals(
+        attempts=attempts,
+        successes=successes,
+        failures=attempts - successes,
+        net_delta=s.delta[b] - s.delta[a],
+        avg_cost=(s.cost[b] - s.cost[a]) / attempts,
+        outcome_variance=variance if variance > 0.0 else 0.0,
+    )
@@ -0,0 +1 @@
+# Engine services: deterministic state stores, resolution and RNG
@@ -0,0 +1,65 @@
+# Closed canon (v0.1): verbs and resource kinds known to Resolution
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+# -------------------------------------------------
+# The canon is closed. Modules and scenarios may not add to it
+# (FREEZE_v0_1.md, TIER_1_MCI_v1_0.md). Order is significant:
+# positions are the integer codes used by array-backed stores.
+# -------------------------------------------------
+
+# Wallet columns, matching the Phase 3 wallet dict keys
+RESOURCE_KINDS: Tuple[str, ...] = ("budget", "units", "influence")
+
+# HOLD      - no effect
+# SPEND     - debit own wallet
+# TRANSFER  - debit own wallet, credit target seat
+VERBS: Tuple[str, ...] = ("HOLD", "SPEND", "TRANSFER")
+
+RESOURCE_INDEX: Dict[str, int] = {k: i for i, k in enumerate(RESOURCE_KINDS)}
+VERB_INDEX: Dict[str, int] = {v: i for i, v in enumerate(VERBS)}
+
+# -------------------------------------------------
+# Legality canon (v0.1)
+#
+# Actor classes follow players.json ("humans" / "ais").
+# Object classes are the resource kinds plus NONE (verb takes no object).
+# A verb is legal for (actor class, object class) iff the actor class
+# may use the verb AND the verb accepts that object class.
+# -------------------------------------------------
+
+ACTOR_CLASSES: Tuple[str, ...] = ("HUMAN", "AI")
+
+OBJECT_NONE = "NONE"
+OBJECT_CLASSES: Tuple[str, ...] = RESOURCE_KINDS + (OBJECT_NONE,)
+
+VERB_OBJECTS: Dict[str, Tuple[str, ...]] = {
+    "HOLD": (OBJECT_NONE,),
+    "SPEND": RESOURCE_KINDS,
+    "TRANSFER": RESOURCE_KINDS,
+}
+
+ACTOR_VERBS: Dict[str, Tuple[str, ...]] = {
+    "HUMAN": VERBS,
+    "AI": VERBS,
+}
+
+ACTOR_CLASS_INDEX: Dict[str, int] = {c: i for i, c in enumerate(ACTOR_CLASSES)}
+
+# -------------------------------------------------
+# Structural pillars (README, "The core model")
+# Column order of the seats x pillars state matrix.
+# -------------------------------------------------
+
+PILLARS: Tuple[str, ...] = (
+    "legitimacy",
+    "force",
+    "resources",
+    "administration",
+    "territory",
+    "information",
+    "elites",
+)
+
+PILLAR_INDEX: Dict[str, int] = {p: i for i, p in enumerate(PILLARS)}
@@ -0,0 +1,260 @@
+# Prebuilt country catalog with a CSR territory adjacency graph
+from __future__ import annotations
+
+import argparse
+import json
+from array import array
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# -------------------------------------------------
+# Catalog (v0.1)
+#
+# engine/data/country_catalog.json is generated once and shipped:
+#   countries: [{"id", "name", "region"}]   ids are dense, 0-based,
+#                                           in Phase 2 pool order
+#   adjacency: {"indptr", "indices"}       CSR over land borders
+#
+# Neighbours of country c are indices[indptr[c]:indptr[c + 1]],
+# sorted ascending. The graph is undirected (stored both ways).
+#
+# The catalog is loaded once per process and cached.
+# -------------------------------------------------
+
+CATALOG_PATH = Path(__file__).resolve().parent / "data" / "country_catalog.json"
+
+REGIONS: Tuple[str, ...] = ("AFRICA", "AMERICAS", "ASIA", "EUROPE", "OCEANIA")
+
+
+class CountryCatalog:
+    """
+    Integer-keyed country metadata and adjacency (read-only).
+    """
+
+    __slots__ = ("names", "regions", "by_name", "indptr", "indices")
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        regions: Sequence[str],
+        indptr: Sequence[int],
+        indices: Sequence[int],
+    ) -> None:
+        if len(names) != len(regions) or len(indptr) != len(names) + 1:
+            raise ValueError("catalog arrays are inconsistent")
+        self.names: Tuple[str, ...] = tuple(names)
+        self.regions: Tuple[str, ...] = tuple(regions)
+        self.by_name: Dict[str, int] = {n: i for i, n in enumerate(self.names)}
+        self.indptr = array("i", indptr)
+        self.indices = array("i", indices)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # -------------------------
+    # Metadata
+    # -------------------------
+
+    def id_of(self, name: str) -> int:
+        return self.by_name[name.strip().upper()]
+
+    def name_of(self, cid: int) -> str:
+        return self.names[cid]
+
+    def region_of(self, cid: int) -> str:
+        return self.regions[cid]
+
+    def in_region(self, region: str) -> List[int]:
+        return [i for i, r in enumerate(self.regions) if r == region]
+
+    # -------------------------
+    # Graph queries
+    # -------------------------
+
+    def neighbors(self, cid: int) -> array:
+        return self.indices[self.indptr[cid]:self.indptr[cid + 1]]
+
+    def degree(self, cid: int) -> int:
+        return self.indptr[cid + 1] - self.indptr[cid]
+
+    def edges(self) -> List[Tuple[int, int]]:
+        indptr, indices = self.indptr, self.indices
+        return [
+            (a, indices[k])
+            for a in range(len(self.names))
+            for k in range(indptr[a], indptr[a + 1])
+            if a < indices[k]
+        ]
+
+    def _mask(self, allowed: Optional[Iterable[int]]) -> Optional[bytearray]:
+        if allowed is None:
+            return None
+        mask = bytearray(len(self.names))
+        for cid in allowed:
+            mask[cid] = 1
+        return mask
+
+    def distances_from(self, src: int, allowed: Optional[Iterable[int]] = None) -> array:
+        """
+        BFS hop counts from src; -1 where unreachable.
+
+        When `allowed` is given, paths may only pass through those ids
+        (e.g. territory controlled by one seat).
+        """
+        indptr, indices = self.indptr, self.indices
+        mask = self._mask(allowed)
+        dist = array("i", [-1]) * len(self.names)
+        if mask is not None and not mask[src]:
+            return dist
+
+        dist[src] = 0
+        queue = deque([src])
+        while queue:
+            a = queue.popleft()
+            nd = dist[a] + 1
+            for k in range(indptr[a], indptr[a + 1]):
+                b = indices[k]
+                if dist[b] < 0 and (mask is None or mask[b]):
+                    dist[b] = nd
+                    queue.append(b)
+        return dist
+
+    def bfs_distance(self, src: int, dst: int, allowed: Optional[Iterable[int]] = None) -> int:
+        """
+        Hop count from src to dst (-1 if not connected), stopping early.
+        """
+        if src == dst:
+            return 0
+        indptr, indices = self.indptr, self.indices
+        mask = self._mask(allowed)
+        if mask is not None and not (mask[src] and mask[dst]):
+            return -1
+
+        seen = bytearray(len(self.names))
+        seen[src] = 1
+        frontier = [src]
+        depth = 0
+        while frontier:
+            depth += 1
+            nxt = []
+            for a in frontier:
+                for k in range(indptr[a], indptr[a + 1]):
+                    b = indices[k]
+                    if seen[b] or (mask is not None and not mask[b]):
+                        continue
+                    if b == dst:
+                        return depth
+                    seen[b] = 1
+                    nxt.append(b)
+            frontier = nxt
+        return -1
+
+    def components(self, ids: Iterable[int]) -> List[List[int]]:
+        """
+        Connected components of the subgraph induced by `ids`.
+
+        Components are sorted internally and ordered by smallest id.
+        """
+        ids = sorted(set(ids))
+        indptr, indices = self.indptr, self.indices
+        mask = self._mask(ids)
+        seen = bytearray(len(self.names))
+        out: List[List[int]] = []
+        for start in ids:
+            if seen[start]:
+                continue
+            seen[start] = 1
+            comp = [start]
+            stack = [start]
+            while stack:
+                a = stack.pop()
+                for k in range(indptr[a], indptr[a + 1]):
+                    b = indices[k]
+                    if mask[b] and not seen[b]:
+                        seen[b] = 1
+                        comp.append(b)
+                        stack.append(b)
+            comp.sort()
+            out.append(comp)
+        return out
+
+    def is_contiguous(self, ids: Iterable[int]) -> bool:
+        return len(self.components(ids)) <= 1
+
+
+# -------------------------
+# Build / load
+# -------------------------
+
+def build_payload(
+    countries: Sequence[Tuple[str, str]],
+    borders: Iterable[Tuple[str, str]],
+) -> Dict[str, Any]:
+    """
+    Compile (name, region) rows and name-pair borders into catalog JSON.
+    """
+    names = [n for n, _ in countries]
+    index = {n: i for i, n in enumerate(names)}
+    if len(index) != len(names):
+        raise ValueError("duplicate country names")
+    for _, region in countries:
+        if region not in REGIONS:
+            raise ValueError(f"unknown region: {region}")
+
+    adj: List[set] = [set() for _ in names]
+    for a, b in borders:
+        ia, ib = index[a], index[b]
+        if ia == ib:
+            raise ValueError(f"self border: {a}")
+        adj[ia].add(ib)
+        adj[ib].add(ia)
+
+    indptr = [0]
+    indices: List[int] = []
+    for nbrs in adj:
+        indices.extend(sorted(nbrs))
+        indptr.append(len(indices))
+
+    return {
+        "schema_version": "0.1",
+        "regions": list(REGIONS),
+        "countries": [{"id": i, "name": n, "region": r} for i, (n, r) in enumerate(countries)],
+        "adjacency": {"indptr": indptr, "indices": indices},
+    }
+
+
+def catalog_from_payload(payload: Dict[str, Any]) -> CountryCatalog:
+    rows = sorted(payload["countries"], key=lambda r: r["id"])
+    if [r["id"] for r in rows] != list(range(len(rows))):
+        raise ValueError("catalog ids must be dense and 0-based")
+    adjacency = payload["adjacency"]
+    return CountryCatalog(
+        [r["name"] for r in rows],
+        [r["region"] for r in rows],
+        adjacency["indptr"],
+        adjacency["indices"],
+    )
+
+
+@lru_cache(maxsize=None)
+def load_catalog(path: str = str(CATALOG_PATH)) -> CountryCatalog:
+    payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    return catalog_from_payload(payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Validate and summarize the country catalog.")
+    parser.add_argument("--path", type=Path, default=CATALOG_PATH)
+    args = parser.parse_args()
+
+    catalog = load_catalog(str(args.path))
+    for a, b in catalog.edges():
+        if a not in catalog.neighbors(b):
+            raise SystemExit(f"asymmetric border: {catalog.name_of(a)} / {catalog.name_of(b)}")
+    print(f"[OK] {len(catalog)} countries, {len(catalog.edges())} borders, {len(REGIONS)} regions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+# Event-driven collapse detection over the pillar store
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from .canon import PILLARS
+from .pillars import N_PILLARS, PillarStore
+
+# -------------------------------------------------
+# Collapse rule (v0.1)
+#
+# A pillar has FAILED when its value <= its failure threshold.
+# A seat COLLAPSES when at least `min_failed` pillars have failed.
+# Collapse is terminal: a collapsed seat is never re-evaluated.
+#
+# A seat is NEAR collapse when at least `min_failed` pillars are
+# within `near_margin` of their threshold (failed ones included).
+#
+# Only seats owning a changed (seat, pillar) cell are re-evaluated
+# after a Resolution commit. Events are emitted in seat order.
+# -------------------------------------------------
+
+
+@dataclass(frozen=True)
+class CollapseRule:
+    thresholds: Sequence[int] = (0,) * N_PILLARS
+    min_failed: int = 3
+    near_margin: int = 2
+
+    def __post_init__(self) -> None:
+        if len(self.thresholds) != N_PILLARS:
+            raise ValueError(f"thresholds must have {N_PILLARS} values")
+        if not 1 <= self.min_failed <= N_PILLARS:
+            raise ValueError("min_failed out of range")
+
+
+@dataclass(frozen=True)
+class PillarEvidence:
+    pillar: str
+    value: int
+    threshold: int
+
+
+@dataclass(frozen=True)
+class CollapseEvent:
+    turn: int
+    seat: int
+    failed: int
+    evidence: List[PillarEvidence] = field(default_factory=list)
+
+
+class CollapseWatcher:
+    """
+    Incremental collapse evaluation driven by changed pillar cells.
+    """
+
+    def __init__(self, store: PillarStore, rule: Optional[CollapseRule] = None) -> None:
+        self.store = store
+        self.rule = rule or CollapseRule()
+        self.failed_count: Dict[int, int] = {}
+        self.near: Set[int] = set()
+        self.collapsed: Dict[int, int] = {}  # seat -> collapse turn
+        self.evaluations = 0
+
+        # Initial full pass (turn 0); later passes are incremental. Seats
+        # that start collapsed are reported here, never by observe()
+        self.initial_events: List[CollapseEvent] = self.observe(
+            0, range(0, store.seats_total * N_PILLARS, N_PILLARS)
+        )
+
+    def _evaluate(self, seat: int) -> int:
+        values = self.store.values
+        thresholds = self.rule.thresholds
+        margin = self.rule.near_margin
+        base = (seat - 1) * N_PILLARS
+        failed = 0
+        close = 0
+        for p in range(N_PILLARS):
+            v = values[base + p]
+            t = thresholds[p]
+            if v <= t:
+                failed += 1
+            if v <= t + margin:
+                close += 1
+
+        self.evaluations += 1
+        self.failed_count[seat] = failed
+        if close >= self.rule.min_failed:
+            self.near.add(seat)
+        else:
+            self.near.discard(seat)
+        return failed
+
+    def _evidence(self, seat: int) -> List[PillarEvidence]:
+        values = self.store.values
+        base = (seat - 1) * N_PILLARS
+        return [
+            PillarEvidence(pillar=PILLARS[p], value=values[base + p], threshold=t)
+            for p, t in enumerate(self.rule.thresholds)
+            if values[base + p] <= t
+        ]
+
+    def observe(self, turn: int, changed: Iterable[int]) -> List[CollapseEvent]:
+        """
+        Re-evaluate the seats owning the changed flat cell indices.
+        """
+        seats = sorted({idx // N_PILLARS + 1 for idx in changed})
+        events: List[CollapseEvent] = []
+        for seat in seats:
+            if seat in self.collapsed:
+                continue
+            failed = self._evaluate(seat)
+            if failed >= self.rule.min_failed:
+                self.collapsed[seat] = turn
+                self.near.discard(seat)
+                events.append(CollapseEvent(
+                    turn=turn,
+                    seat=seat,
+                    failed=failed,
+                    evidence=self._evidence(seat),
+                ))
+        return events
+
+    def near_collapse(self) -> List[int]:
+        return sorted(self.near)
+
+    def is_collapsed(self, seat: int) -> bool:
+        return seat in self.collapsed
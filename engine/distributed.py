@@ -0,0 +1,267 @@
+# Distributed sweeps: TCP coordinator hands out leased work units to workers
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from .sweep import completed_ids, grid, point_id, run_point
+
+# -------------------------------------------------
+# Wire protocol (v0.1): JSON lines over one TCP connection per worker
+#
+#   worker -> {"op": "lease", "worker": id}
+#   coord  -> {"op": "unit", "unit_id", "params", "lease_s"}
+#           | {"op": "wait", "retry_s"}      all units leased, none free
+#           | {"op": "done"}                 every unit has a result
+#   worker -> {"op": "result", "worker": id, "unit_id", "summary"}
+#   coord  -> {"op": "ack", "accepted": bool}
+#
+# A work unit is one sweep grid point; unit_id == sweep.point_id(params).
+# A lease not answered within lease_s is reclaimed and re-dispatched.
+# The first result for a unit wins; later duplicates (from a slow or
+# re-leased worker) are acknowledged and dropped. Summaries come from
+# run_scenario and carry no worker identity, so the result set is the
+# same whichever node ran which unit.
+#
+# Accepted results are appended to out_path in the sweep.run_sweep
+# format, so the file doubles as the checkpoint for resume.
+# -------------------------------------------------
+
+DEFAULT_LEASE_S = 60.0
+WAIT_RETRY_S = 0.2
+
+
+def _send(fh, message: Dict[str, Any]) -> None:
+    fh.write((json.dumps(message, sort_keys=True) + "\n").encode("utf-8"))
+    fh.flush()
+
+
+def _recv(fh) -> Optional[Dict[str, Any]]:
+    line = fh.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+class Coordinator:
+    """
+    Owns the unit queue, leases and accepted results.
+    """
+
+    def __init__(
+        self,
+        points: List[Dict[str, Any]],
+        *,
+        out_path: Optional[Path] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        lease_s: float = DEFAULT_LEASE_S,
+    ) -> None:
+        if lease_s <= 0:
+            raise ValueError("lease_s must be > 0")
+        self.lease_s = float(lease_s)
+        self.out_path = Path(out_path) if out_path is not None else None
+        self.units: Dict[str, Dict[str, Any]] = {}
+        for params in points:
+            self.units.setdefault(point_id(params), params)
+        self.order: List[str] = list(self.units)
+        self.position: Dict[str, int] = {u: i for i, u in enumerate(self.order)}
+
+        done = completed_ids(self.out_path) if self.out_path is not None else set()
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.pending: Deque[str] = deque(u for u in self.order if u not in done)
+        self.resumed = len(self.order) - len(self.pending)
+        self.leases: Dict[str, Tuple[str, float]] = {}
+        self.redispatched = 0
+        self.duplicates = 0
+
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+        if not self.pending:
+            self._finished.set()
+        self._out = None
+        if self.out_path is not None:
+            self.out_path.parent.mkdir(parents=True, exist_ok=True)
+            self._out = self.out_path.open("a", encoding="utf-8")
+
+        coordinator = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                coordinator._serve(self.rfile, self.wfile)
+
+        class Server(socketserver.ThreadingTCPServer):
+            daemon_threads = True
+            allow_reuse_address = True
+
+        self._server = Server((host, port), Handler)
+        self.address: Tuple[str, int] = self._server.server_address[:2]
+        self._thread: Optional[threading.Thread] = None
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+
+    def start(self) -> Tuple[str, int]:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.address
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._finished.wait(timeout)
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        if self._out is not None:
+            self._out.close()
+            self._out = None
+
+    def __enter__(self) -> "Coordinator":
+        self.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -------------------------
+    # Unit bookkeeping (under lock)
+    # -------------------------
+
+    def _reclaim(self, now: float) -> None:
+        expired = sorted(
+            (u for u, (_, deadline) in self.leases.items() if deadline <= now),
+            key=self.position.__getitem__,
+            reverse=True,
+        )
+        for unit_id in expired:
+            del self.leases[unit_id]
+            self.pending.appendleft(unit_id)
+            self.redispatched += 1
+
+    def lease(self, worker: str) -> Dict[str, Any]:
+        with self._lock:
+            if self._finished.is_set():
+                return {"op": "done"}
+            now = time.monotonic()
+            self._reclaim(now)
+            while self.pending:
+                unit_id = self.pending.popleft()
+                if unit_id in self.results:
+                    continue
+                self.leases[unit_id] = (worker, now + self.lease_s)
+                return {"op": "unit", "unit_id": unit_id, "params": self.units[unit_id], "lease_s": self.lease_s}
+            return {"op": "wait", "retry_s": WAIT_RETRY_S}
+
+    def complete(self, unit_id: str, summary: Dict[str, Any]) -> bool:
+        with self._lock:
+            if unit_id not in self.units or unit_id in self.results or self._finished.is_set():
+                self.duplicates += 1
+                return False
+            if not isinstance(summary, dict) or summary.get("point_id") != unit_id:
+                raise ValueError(f"summary is not a result for unit {unit_id}")
+            self.results[unit_id] = summary
+            self.leases.pop(unit_id, None)
+            if self._out is not None:
+                self._out.write(json.dumps(summary, sort_keys=True) + "\n")
+                self._out.flush()
+                os.fsync(self._out.fileno())
+            if len(self.results) + self.resumed == len(self.order):
+                self._finished.set()
+            return True
+
+    def ordered_results(self) -> List[Dict[str, Any]]:
+        """
+        Results accepted in this session, in grid order.
+        """
+        return [self.results[u] for u in self.order if u in self.results]
+
+    def _serve(self, rfile, wfile) -> None:
+        while True:
+            try:
+                msg = _recv(rfile)
+            except (OSError, ValueError):
+                return
+            if msg is None:
+                return
+            op = msg.get("op")
+            if op == "lease":
+                _send(wfile, self.lease(str(msg.get("worker", "?"))))
+            elif op == "result":
+                try:
+                    accepted = self.complete(str(msg["unit_id"]), msg["summary"])
+                except (KeyError, ValueError):
+                    accepted = False
+                _send(wfile, {"op": "ack", "accepted": accepted})
+            else:
+                _send(wfile, {"op": "error", "message": f"unknown op: {op}"})
+
+
+def run_worker(host: str, port: int, *, worker_id: Optional[str] = None, connect_timeout: float = 10.0) -> int:
+    """
+    Lease, run and report units until the coordinator says done.
+
+    Returns the number of units this worker completed.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    ran = 0
+    with socket.create_connection((host, port), timeout=connect_timeout) as sock:
+        sock.settimeout(None)
+        fh = sock.makefile("rwb")
+        while True:
+            _send(fh, {"op": "lease", "worker": worker_id})
+            reply = _recv(fh)
+            if reply is None or reply["op"] == "done":
+                return ran
+            if reply["op"] == "wait":
+                time.sleep(float(reply.get("retry_s", WAIT_RETRY_S)))
+                continue
+            summary = run_point(reply["params"])
+            _send(fh, {"op": "result", "worker": worker_id, "unit_id": reply["unit_id"], "summary": summary})
+            if _recv(fh) is None:
+                return ran
+            ran += 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Distributed scenario sweep over TCP.")
+    sub = parser.add_subparsers(dest="role", required=True)
+
+    coord = sub.add_parser("coordinator")
+    coord.add_argument("--space", type=Path, required=True, help="JSON: {param: [values, ...]}")
+    coord.add_argument("--out", type=Path, required=True, help="results JSONL (also the checkpoint)")
+    coord.add_argument("--host", default="0.0.0.0")
+    coord.add_argument("--port", type=int, default=7341)
+    coord.add_argument("--lease", type=float, default=DEFAULT_LEASE_S)
+
+    work = sub.add_parser("worker")
+    work.add_argument("--host", required=True)
+    work.add_argument("--port", type=int, default=7341)
+    work.add_argument("--id", default=None)
+
+    args = parser.parse_args()
+    if args.role == "worker":
+        ran = run_worker(args.host, args.port, worker_id=args.id)
+        print(f"[OK] worker: {ran} unit(s)")
+        return
+
+    points = grid(json.loads(args.space.read_text(encoding="utf-8")))
+    with Coordinator(points, out_path=args.out, host=args.host, port=args.port, lease_s=args.lease) as c:
+        print(f"COORDINATOR: {len(points)} unit(s) on {c.address[0]}:{c.address[1]} ({c.resumed} resumed)")
+        c.wait()
+    print(f"[OK] sweep: {len(c.results)} run now, {c.redispatched} re-dispatched, {c.duplicates} duplicate(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+# AI doctrine evaluation: legal-action enumeration and per-turn seat scoring
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from . import canon, metrics
+from .legality import OBJECT_NONE_CODE, LegalityTables
+from .rng import RngService
+from .wallets import KINDS, WalletTable
+
+# -------------------------------------------------
+# Doctrine contract (v0.1)
+#
+# Doctrine selects among legal actions only (TIER_1_MCI_v1_0.md, 8).
+# A doctrine is a pure scorer:
+#
+#   score(action, own, target) -> float
+#     action   candidate in the turn_executor action contract
+#     own      acting seat's wallet, tuple in RESOURCE_KINDS order
+#     target   receiving seat's wallet (TRANSFER), else None
+#
+# Scores may depend on the action's verb, resource and amount and on the
+# two wallets, not on seat numbers: they are cached on exactly that key.
+#
+# Candidates per AI seat:
+#   HOLD
+#   SPEND / TRANSFER of balance // d for d in amount_divisors (> 0 only,
+#   so Resolution never sees an overdraw from a proposal)
+#   TRANSFER targets: every other seat, or a seeded sample of
+#   max_targets of them
+#
+# Each turn:
+#   - wallets are snapshotted once; workers read only the snapshot
+#   - seats are scored in a thread pool, in chunks
+#   - scores are cached per turn on (verb, kind, amount, own, target),
+#     so seats in the same position share work
+#   - the best score wins; ties break on the seat's RNG stream
+#     (for_seat(phase=DOCTRINE_PHASE, seat, turn))
+#
+# A seat not finished by the per-turn deadline proposes HOLD (fallback).
+# Within budget, choices are a pure function of (seed, turn, seat,
+# wallets, doctrine) and do not depend on scheduling or worker count.
+# -------------------------------------------------
+
+DOCTRINE_PHASE = 8
+
+DEFAULT_BUDGET_S = 0.05
+AMOUNT_DIVISORS: Tuple[int, ...] = (4, 2, 1)
+
+_TRANSFER = canon.VERB_INDEX["TRANSFER"]
+
+Action = Dict[str, Any]
+Wallet = Tuple[int, ...]
+Doctrine = Callable[[Action, Wallet, Optional[Wallet]], float]
+
+
+def hold(seat: int) -> Action:
+    return {"seat": seat, "verb": "HOLD"}
+
+
+def reference_doctrine(action: Action, own: Wallet, target: Optional[Wallet]) -> float:
+    """
+    Keep half of each resource in reserve; level toward poorer seats.
+    """
+    verb = action["verb"]
+    if verb == "HOLD":
+        return 0.0
+    kind = canon.RESOURCE_INDEX[action["resource"]]
+    amount = action["amount"]
+    balance = own[kind]
+    spare = balance - balance // 2
+    if verb == "SPEND":
+        return amount / balance if amount <= spare else -amount / balance
+    gap = balance - target[kind]
+    if gap <= 0:
+        return -1.0
+    # best when the transfer closes about half the gap
+    return 1.0 - abs(amount - gap / 2) / gap
+
+
+def _snapshot(wallets: WalletTable) -> List[Wallet]:
+    # index 0 unused: seats are 1-based
+    balances = wallets.balances
+    return [()] + [tuple(balances[(s - 1) * KINDS:s * KINDS]) for s in range(1, wallets.seats_total + 1)]
+
+
+@dataclass(frozen=True)
+class SeatChoice:
+    seat: int
+    action: Action
+    score: Optional[float]
+    candidates: int
+    fallback: bool = False
+
+
+@dataclass(frozen=True)
+class DoctrineTurn:
+    turn: int
+    # One choice per AI seat, in seat order
+    choices: List[SeatChoice] = field(default_factory=list)
+    elapsed_s: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+
+    @property
+    def actions(self) -> List[Action]:
+        return [c.action for c in self.choices]
+
+    @property
+    def fallbacks(self) -> List[int]:
+        return [c.seat for c in self.choices if c.fallback]
+
+
+class DoctrineEvaluator:
+    """
+    Chooses one legal action per AI seat per turn, within a time budget.
+    """
+
+    def __init__(
+        self,
+        legality: LegalityTables,
+        *,
+        seed: int,
+        doctrine: Doctrine = reference_doctrine,
+        budget_s: float = DEFAULT_BUDGET_S,
+        workers: int = 4,
+        amount_divisors: Tuple[int, ...] = AMOUNT_DIVISORS,
+        max_targets: Optional[int] = 8,
+    ) -> None:
+        if budget_s <= 0:
+            raise ValueError("budget_s must be > 0")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if not amount_divisors or any(d < 1 for d in amount_divisors):
+            raise ValueError("amount_divisors must be positive integers")
+        if max_targets is not None and max_targets < 1:
+            raise ValueError("max_targets must be >= 1")
+        self.legality = legality
+        self.rng = RngService(seed)
+        self.doctrine = doctrine
+        self.budget_s = float(budget_s)
+        self.workers = int(workers)
+        self.amount_divisors = tuple(sorted(set(amount_divisors), reverse=True))
+        self.max_targets = max_targets
+
+        ai = canon.ACTOR_CLASS_INDEX["AI"]
+        self.ai_seats: List[int] = [
+            s for s in range(1, legality.seats_total + 1) if legality.seat_class[s] == ai
+        ]
+        # Legality is static, so (verb, object) shapes per actor class are
+        # compiled once rather than re-tested per candidate
+        self._shapes: Dict[int, List[Tuple[int, int]]] = {}
+        for a in range(len(canon.ACTOR_CLASSES)):
+            self._shapes[a] = [
+                (verb, obj)
+                for verb in range(len(canon.VERBS))
+                for obj in range(len(canon.OBJECT_CLASSES))
+                if legality.allowed[a * len(canon.OBJECT_CLASSES) + obj] >> verb & 1
+            ]
+
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._cache: Dict[Tuple[Any, ...], float] = {}
+
+    @classmethod
+    def from_players(cls, players: Dict[str, Any], **kwargs: Any) -> "DoctrineEvaluator":
+        return cls(LegalityTables.from_players(players), **kwargs)
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "DoctrineEvaluator":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -------------------------
+    # Candidates
+    # -------------------------
+
+    def legal_actions(self, seat: int, turn: int, wallets: WalletTable) -> List[Action]:
+        """
+        Candidate actions for one seat, in a fixed order; HOLD first.
+        """
+        stream = self.rng.for_seat(phase=DOCTRINE_PHASE, seat=seat, turn=turn)
+        return self._candidates(seat, _snapshot(wallets), stream)
+
+    def _targets(self, seat: int, stream) -> List[int]:
+        n = self.legality.seats_total - 1
+        if self.max_targets is None or n <= self.max_targets:
+            return [s for s in range(1, n + 2) if s != seat]
+        # k distinct draws over the other seats, without building them all
+        picks = set()
+        while len(picks) < self.max_targets:
+            picks.add(stream.below(n))
+        return sorted(i + 1 if i + 1 < seat else i + 2 for i in picks)
+
+    def _candidates(self, seat: int, snapshot: List[Wallet], stream) -> List[Action]:
+        own = snapshot[seat]
+        out: List[Action] = []
+        targets: Optional[List[int]] = None
+        for verb, obj in self._shapes[self.legality.seat_class[seat]]:
+            name = canon.VERBS[verb]
+            if obj == OBJECT_NONE_CODE:
+                out.append({"seat": seat, "verb": name})
+                continue
+            balance = own[obj]
+            amounts = sorted({balance // d for d in self.amount_divisors if balance // d > 0})
+            if not amounts:
+                continue
+            resource = canon.RESOURCE_KINDS[obj]
+            if verb == _TRANSFER:
+                if targets is None:
+                    targets = self._targets(seat, stream)
+                for target in targets:
+                    for amount in amounts:
+                        out.append({"seat": seat, "verb": name, "resource": resource, "amount": amount, "target": target})
+            else:
+                for amount in amounts:
+                    out.append({"seat": seat, "verb": name, "resource": resource, "amount": amount})
+        return out
+
+    # -------------------------
+    # Scoring
+    # -------------------------
+
+    def _choose(
+        self,
+        seat: int,
+        turn: int,
+        snapshot: List[Wallet],
+        deadline: float,
+        stop: threading.Event,
+        stats: List[int],
+    ) -> Optional[SeatChoice]:
+        stream = self.rng.for_seat(phase=DOCTRINE_PHASE, seat=seat, turn=turn)
+        candidates = self._candidates(seat, snapshot, stream)
+        cache = self._cache
+        doctrine = self.doctrine
+        own = snapshot[seat]
+
+        best: Optional[float] = None
+        ties: List[Action] = []
+        for action in candidates:
+            if stop.is_set() or time.monotonic() > deadline:
+                return None
+            target = snapshot[action["target"]] if "target" in action else None
+            key = (action["verb"], action.get("resource"), action.get("amount"), own, target)
+            score = cache.get(key)
+            if score is None:
+                score = cache[key] = float(doctrine(action, own, target))
+                stats[1] += 1
+            else:
+                stats[0] += 1
+            if best is None or score > best:
+                best, ties = score, [action]
+            elif score == best:
+                ties.append(action)
+
+        action = ties[0] if len(ties) == 1 else ties[stream.below(len(ties))]
+        return SeatChoice(seat, action, best, len(candidates))
+
+    def _run_chunk(
+        self,
+        seats: List[int],
+        turn: int,
+        snapshot: List[Wallet],
+        deadline: float,
+        stop: threading.Event,
+        lock: threading.Lock,
+        out: Dict[int, SeatChoice],
+        stats: List[int],
+    ) -> None:
+        # Choices are published to `out` one by one, so seats finished
+        # before the deadline count even if the chunk does not. A seat
+        # finished after the deadline is dropped, never published late:
+        # the harvest takes `lock`, sets `stop` and reads `out` at once.
+        for seat in seats:
+            choice = self._choose(seat, turn, snapshot, deadline, stop, stats)
+            if choice is None:
+                return
+            with lock:
+                if stop.is_set() or time.monotonic() > deadline:
+                    return
+                out[seat] = choice
+
+    def evaluate_turn(self, turn: int, wallets: WalletTable) -> DoctrineTurn:
+        """
+        One proposal per AI seat; HOLD for seats not scored in budget.
+        """
+        start = time.monotonic()
+        deadline = start + self.budget_s
+        if wallets.seats_total != self.legality.seats_total:
+            raise ValueError("wallet table does not match legality seats_total")
+
+        snapshot = _snapshot(wallets)
+        # Scores are only valid against this turn's snapshot
+        self._cache = {}
+
+        seats = self.ai_seats
+        n_chunks = min(len(seats), self.workers * 4)
+        chunks = [seats[i::n_chunks] for i in range(n_chunks)] if n_chunks else []
+        stop = threading.Event()
+        lock = threading.Lock()
+        if self._pool is None and chunks:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="doctrine")
+
+        outs: List[Dict[int, SeatChoice]] = [{} for _ in chunks]
+        stats = [[0, 0] for _ in chunks]  # cache hits, misses
+        with metrics.span("doctrine.evaluate_turn"):
+            futures = [
+                self._pool.submit(self._run_chunk, c, turn, snapshot, deadline, stop, lock, outs[i], stats[i])
+                for i, c in enumerate(chunks)
+            ]
+            done, _ = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+            chosen: Dict[int, SeatChoice] = {}
+            with lock:
+                stop.set()
+                for out in outs:
+                    chosen.update(out)
+            for f in done:
+                f.result()
+
+        hits = sum(s[0] for s in stats)
+        misses = sum(s[1] for s in stats)
+
+        choices = [
+            chosen.get(seat) or SeatChoice(seat, hold(seat), None, 0, fallback=True)
+            for seat in seats
+        ]
+        fallbacks = sum(1 for c in choices if c.fallback)
+        if fallbacks:
+            metrics.count("doctrine_fallbacks", fallbacks)
+        return DoctrineTurn(
+            turn=turn,
+            choices=choices,
+            elapsed_s=time.monotonic() - start,
+            cache_hits=hits,
+            cache_misses=misses,
+        )
@@ -0,0 +1,254 @@
+# Columnar event archive: raw fixed-width columns, turn-range partitions, mmap reads
+from __future__ import annotations
+
+import json
+import mmap
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .interning import SymbolTable
+
+# -------------------------------------------------
+# On-disk layout (v0.1)
+#
+#   <root>/manifest.json
+#       schema_version, byteorder, partition_turns,
+#       actors: [name, ...]                 actor id == list position
+#       partitions: [{"name", "from_turn", "to_turn", "rows"}]
+#   <root>/<name>/<column>.bin              one raw array per column
+#
+# Columns (typecode): turn i, actor i, ok B, cost d, delta d, magnitude d
+#
+# Partition k covers turns [k * P + 1, (k + 1) * P]; k is negative for
+# turns <= 0, which the extractor accepts like any other.
+#
+# Values are resolved at write time exactly as the extractor reads them
+# (missing / None -> 0 / False, magnitude defaults to delta); rows with
+# no turn or a blank actor are dropped, since no window can select them.
+# Rows keep arrival order, so extraction matches the in-memory path for
+# turn-ordered input.
+#
+# Reads mmap only partitions overlapping the requested turn range and
+# view them through memoryview.cast; nothing is parsed.
+# -------------------------------------------------
+
+MANIFEST = "manifest.json"
+SCHEMA_VERSION = "0.1"
+
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("turn", "i"),
+    ("actor", "i"),
+    ("ok", "B"),
+    ("cost", "d"),
+    ("delta", "d"),
+    ("magnitude", "d"),
+)
+
+_NO_TURN = -10**9
+
+
+def _write_manifest(root: Path, manifest: Dict[str, Any]) -> None:
+    tmp = root / (MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    tmp.replace(root / MANIFEST)
+
+
+def partition_of(turn: int, partition_turns: int) -> int:
+    return (turn - 1) // partition_turns
+
+
+class ArchiveWriter:
+    """
+    Appends events partition by partition; a sealed partition is final.
+    """
+
+    def __init__(self, root: Path, *, partition_turns: int = 100, symbols: Optional[SymbolTable] = None) -> None:
+        if partition_turns < 1:
+            raise ValueError("partition_turns must be >= 1")
+        self.root = Path(root)
+        if (self.root / MANIFEST).exists():
+            raise ValueError(f"archive already exists: {self.root}")
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.partition_turns = int(partition_turns)
+        self.symbols = symbols if symbols is not None else SymbolTable()
+        self.partitions: List[Dict[str, Any]] = []
+        self._open: Optional[int] = None
+        self._cols: Dict[str, array] = {}
+        self._sealed_through: Optional[int] = None
+
+    def add(self, events: Iterable[Dict[str, Any]]) -> None:
+        intern = self.symbols.intern
+        P = self.partition_turns
+        for e in events:
+            turn = int(e.get("turn", _NO_TURN))
+            actor = str(e.get("actor", "")).strip()
+            if turn == _NO_TURN or not actor:
+                continue
+            part = partition_of(turn, P)
+            if self._sealed_through is not None and part <= self._sealed_through:
+                raise ValueError(f"turn {turn} belongs to a sealed partition")
+            if part != self._open:
+                if self._open is not None:
+                    if part < self._open:
+                        raise ValueError(f"turn {turn} belongs to a sealed partition")
+                    self._seal()
+                self._open = part
+                self._cols = {name: array(code) for name, code in COLUMNS}
+            cols = self._cols
+            cols["turn"].append(turn)
+            cols["actor"].append(intern(actor))
+            cols["ok"].append(1 if e.get("ok", False) else 0)
+            cols["cost"].append(float(e.get("cost", 0.0) or 0.0))
+            cols["delta"].append(float(e.get("delta", 0.0) or 0.0))
+            cols["magnitude"].append(float(e.get("magnitude", e.get("delta", 0.0)) or 0.0))
+
+    def _seal(self) -> None:
+        part = self._open
+        rows = len(self._cols["turn"])
+        P = self.partition_turns
+        lo, hi = part * P + 1, (part + 1) * P
+        name = f"part_{lo:08d}_{hi:08d}"
+        pdir = self.root / name
+        pdir.mkdir(parents=True, exist_ok=True)
+        for col, _ in COLUMNS:
+            with open(pdir / f"{col}.bin", "wb") as fh:
+                self._cols[col].tofile(fh)
+        self.partitions.append({"name": name, "from_turn": lo, "to_turn": hi, "rows": rows})
+        self._sealed_through = part
+        self._open = None
+        self._cols = {}
+        self._write_manifest()
+
+    def _write_manifest(self) -> None:
+        _write_manifest(self.root, {
+            "schema_version": SCHEMA_VERSION,
+            "byteorder": sys.byteorder,
+            "partition_turns": self.partition_turns,
+            "columns": [list(c) for c in COLUMNS],
+            "actors": self.symbols.names(),
+            "partitions": self.partitions,
+        })
+
+    def close(self) -> None:
+        if self._open is not None:
+            self._seal()
+        else:
+            self._write_manifest()
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def write_archive(root: Path, events: Iterable[Dict[str, Any]], *, partition_turns: int = 100) -> Path:
+    with ArchiveWriter(root, partition_turns=partition_turns) as writer:
+        writer.add(events)
+    return Path(root)
+
+
+class Partition:
+    """
+    Read-only mmap views over one partition's columns.
+    """
+
+    __slots__ = ("name", "from_turn", "to_turn", "rows", "columns", "_maps")
+
+    def __init__(self, root: Path, meta: Dict[str, Any]) -> None:
+        self.name = meta["name"]
+        self.from_turn = int(meta["from_turn"])
+        self.to_turn = int(meta["to_turn"])
+        self.rows = int(meta["rows"])
+        self.columns: Dict[str, memoryview] = {}
+        self._maps: List[mmap.mmap] = []
+        for col, code in COLUMNS:
+            path = root / self.name / f"{col}.bin"
+            expected = self.rows * array(code).itemsize
+            with open(path, "rb") as fh:
+                size = fh.seek(0, 2)
+                if size != expected:
+                    raise ValueError(f"column size mismatch: {path} ({size} != {expected})")
+                if size == 0:
+                    self.columns[col] = memoryview(b"").cast(code)
+                    continue
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps.append(mm)
+            self.columns[col] = memoryview(mm).cast(code)
+
+    def close(self) -> None:
+        for view in self.columns.values():
+            view.release()
+        self.columns = {}
+        for mm in self._maps:
+            mm.close()
+        self._maps = []
+
+
+class EventArchive:
+    """
+    Opened archive; partitions are mapped on first use and kept open.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        manifest = json.loads((self.root / MANIFEST).read_text(encoding="utf-8"))
+        if manifest.get("schema_version") != SCHEMA_VERSION:
+            raise ValueError(f"unsupported archive schema: {manifest.get('schema_version')}")
+        if manifest.get("byteorder") != sys.byteorder:
+            raise ValueError(f"archive byteorder {manifest.get('byteorder')} != host {sys.byteorder}")
+        self.partition_turns = int(manifest["partition_turns"])
+        self.symbols = SymbolTable(manifest["actors"])
+        self._meta = sorted(manifest["partitions"], key=lambda m: m["from_turn"])
+        self._open: Dict[str, Partition] = {}
+
+    def partitions(self, lo: int, hi: int) -> List[Partition]:
+        """
+        Mapped partitions overlapping turns [lo, hi], in turn order.
+        """
+        out = []
+        for meta in self._meta:
+            if meta["to_turn"] < lo or meta["from_turn"] > hi:
+                continue
+            part = self._open.get(meta["name"])
+            if part is None:
+                part = self._open[meta["name"]] = Partition(self.root, meta)
+            out.append(part)
+        return out
+
+    def iter_events(self, lo: int, hi: int) -> Iterator[Dict[str, Any]]:
+        """
+        Events with lo <= turn <= hi, in extractor event shape.
+        """
+        names = self.symbols.name_of
+        for part in self.partitions(lo, hi):
+            c = part.columns
+            turns, actors, oks = c["turn"], c["actor"], c["ok"]
+            costs, deltas, mags = c["cost"], c["delta"], c["magnitude"]
+            for i in range(part.rows):
+                turn = turns[i]
+                if lo <= turn <= hi:
+                    yield {
+                        "turn": turn,
+                        "actor": names(actors[i]),
+                        "ok": bool(oks[i]),
+                        "cost": costs[i],
+                        "delta": deltas[i],
+                        "magnitude": mags[i],
+                    }
+
+    def window_events(self, current_turn: int, window: int) -> List[Dict[str, Any]]:
+        return list(self.iter_events(current_turn - window + 1, current_turn))
+
+    def close(self) -> None:
+        for part in self._open.values():
+            part.close()
+        self._open = {}
+
+    def __enter__(self) -> "EventArchive":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
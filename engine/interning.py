@@ -0,0 +1,58 @@
+# Name <-> dense integer id interning (no engine dependencies)
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+# -------------------------------------------------
+# Interning (v0.1)
+#
+# Internal stores and hot loops key on dense ints (0..n-1, in first-seen
+# order). Names are rendered only at the edges: persisted artifacts,
+# printed output and consumer-facing results.
+#
+# Persisted formats are unchanged (ARCHITECTURE.md: the persistence
+# format is not an extension point).
+#
+# Kept free of imports so derived/ and storage modules can use it
+# without pulling in the catalog.
+# -------------------------------------------------
+
+
+class SymbolTable:
+    """
+    Append-only bijection between names and dense integer ids.
+    """
+
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        sid = self._ids.get(name)
+        if sid is None:
+            sid = len(self._names)
+            self._ids[name] = sid
+            self._names.append(name)
+        return sid
+
+    def id_of(self, name: str) -> int:
+        return self._ids[name]
+
+    def get(self, name: str, default: Optional[int] = None) -> Optional[int]:
+        return self._ids.get(name, default)
+
+    def name_of(self, sid: int) -> str:
+        return self._names[sid]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def names(self) -> List[str]:
+        return list(self._names)
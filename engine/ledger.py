@@ -0,0 +1,162 @@
+# Ledger compaction: balance checkpoints + archived, compressed segments
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .canon import RESOURCE_KINDS
+
+# -------------------------------------------------
+# Ledger contract (v0.1)
+#
+# resources_by_seat[i]["ledger"] holds records:
+#   {"turn": int, "resource": str, "delta": int, ...}
+#
+# Wallet invariant, per seat and resource kind:
+#   wallet == opening + sum(delta of hot ledger)
+# where opening is ledger_checkpoint["balance"] if present, else the
+# ruleset starting values.
+#
+# Compaction folds every record with turn <= cutoff into a new
+# checkpoint balance and moves those records to a gzip JSONL segment:
+#   <archive>/seat_<seat>/ledger_<from>_<to>.jsonl.gz
+# The checkpoint lists its segments (path relative to <archive>, turn
+# range, count, sha256) so history stays queryable.
+# -------------------------------------------------
+
+
+def starting_balance(resources: Dict[str, Any]) -> Dict[str, int]:
+    ruleset = resources.get("ruleset", {})
+    return {kind: int(ruleset.get(f"starting_{kind}", 0)) for kind in RESOURCE_KINDS}
+
+
+def opening_balance(resources: Dict[str, Any], entry: Dict[str, Any]) -> Dict[str, int]:
+    checkpoint = entry.get("ledger_checkpoint")
+    if checkpoint:
+        return {k: int(v) for k, v in checkpoint["balance"].items()}
+    return starting_balance(resources)
+
+
+def _fold(balance: Dict[str, int], records: List[Dict[str, Any]]) -> Dict[str, int]:
+    out = dict(balance)
+    for r in records:
+        out[r["resource"]] = out.get(r["resource"], 0) + int(r["delta"])
+    return out
+
+
+def verify_seat(resources: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """
+    Raise ValueError if opening + hot ledger does not reproduce the wallet.
+    """
+    derived = _fold(opening_balance(resources, entry), entry.get("ledger", []))
+    wallet = entry.get("wallet", {})
+    for kind in RESOURCE_KINDS:
+        if derived.get(kind, 0) != int(wallet.get(kind, 0)):
+            raise ValueError(
+                f"ledger does not match wallet for seat {entry.get('seat')}: "
+                f"{kind} derived={derived.get(kind, 0)} wallet={wallet.get(kind, 0)}"
+            )
+
+
+def compact_resources(
+    resources: Dict[str, Any],
+    archive_dir: Path,
+    *,
+    cutoff_turn: int,
+) -> int:
+    """
+    Fold ledger records with turn <= cutoff_turn into checkpoints.
+
+    Mutates `resources` in place; returns the number of records archived.
+    Raises ValueError, before touching that seat, if its hot ledger does
+    not reproduce its wallet.
+    """
+    archive_dir = Path(archive_dir)
+    archived = 0
+
+    for entry in resources.get("resources_by_seat", []):
+        seat = int(entry["seat"])
+        ledger = entry.get("ledger", [])
+        old = [r for r in ledger if int(r["turn"]) <= cutoff_turn]
+        if not old:
+            continue
+
+        verify_seat(resources, entry)
+
+        hot = [r for r in ledger if int(r["turn"]) > cutoff_turn]
+        balance = _fold(opening_balance(resources, entry), old)
+        for kind, value in balance.items():
+            if value < 0:
+                raise ValueError(f"negative checkpoint balance for seat {seat}: {kind}={value}")
+
+        from_turn = int(old[0]["turn"])
+        rel = Path(f"seat_{seat:04d}") / f"ledger_{from_turn:08d}_{cutoff_turn:08d}.jsonl.gz"
+        path = archive_dir / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = "".join(json.dumps(r, sort_keys=True) + "\n" for r in old).encode("utf-8")
+        # mtime=0 keeps segment bytes deterministic
+        path.write_bytes(gzip.compress(payload, mtime=0))
+
+        previous = entry.get("ledger_checkpoint") or {}
+        segments = list(previous.get("segments", []))
+        segments.append({
+            "path": rel.as_posix(),
+            "from_turn": from_turn,
+            "to_turn": cutoff_turn,
+            "entries": len(old),
+            "sha256": hashlib.sha256(payload).hexdigest(),
+        })
+
+        entry["ledger_checkpoint"] = {
+            "turn": cutoff_turn,
+            "balance": balance,
+            "segments": segments,
+        }
+        entry["ledger"] = hot
+        verify_seat(resources, entry)
+        archived += len(old)
+
+    return archived
+
+
+def history(
+    entry: Dict[str, Any],
+    archive_dir: Path,
+    *,
+    from_turn: Optional[int] = None,
+    to_turn: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Full ledger for one seat (archived segments + hot records), in order.
+    """
+    archive_dir = Path(archive_dir)
+    lo = from_turn if from_turn is not None else -10**9
+    hi = to_turn if to_turn is not None else 10**9
+
+    records: List[Dict[str, Any]] = []
+    checkpoint = entry.get("ledger_checkpoint") or {}
+    for seg in checkpoint.get("segments", []):
+        if seg["to_turn"] < lo or seg["from_turn"] > hi:
+            continue
+        payload = gzip.decompress((archive_dir / seg["path"]).read_bytes())
+        if hashlib.sha256(payload).hexdigest() != seg["sha256"]:
+            raise ValueError(f"archived ledger segment corrupted: {seg['path']}")
+        records.extend(json.loads(line) for line in payload.splitlines())
+
+    records.extend(entry.get("ledger", []))
+    return [r for r in records if lo <= int(r["turn"]) <= hi]
+
+
+def balance_at(
+    resources: Dict[str, Any],
+    entry: Dict[str, Any],
+    archive_dir: Path,
+    turn: int,
+) -> Dict[str, int]:
+    """
+    Wallet balance as of the end of `turn`, replayed from full history.
+    """
+    return _fold(starting_balance(resources), history(entry, archive_dir, to_turn=turn))
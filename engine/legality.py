@@ -0,0 +1,165 @@
+# Precompiled legality tables for closed-canon action validation
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from . import canon
+
+# -------------------------------------------------
+# Tables (compiled once, at load)
+#
+#   allowed[actor_class * N_OBJECTS + object_class] -> verb bitmask
+#   seat_class[seat]                                -> actor class code
+#
+# Validation of an action is then a few dict/array lookups and a bit
+# test. Rejection codes are stable integers (0 = legal).
+#
+# Legality is static: it never reads wallets or other mutable state.
+# State-dependent checks (funds) belong to Resolution.
+# -------------------------------------------------
+
+OK = 0
+REJECT_UNKNOWN_SEAT = 1
+REJECT_UNKNOWN_VERB = 2
+REJECT_UNKNOWN_RESOURCE = 3
+REJECT_BAD_AMOUNT = 4
+REJECT_BAD_TARGET = 5
+REJECT_VERB_NOT_ALLOWED = 6
+
+REJECTION_NAMES: Dict[int, str] = {
+    OK: "OK",
+    REJECT_UNKNOWN_SEAT: "UNKNOWN_SEAT",
+    REJECT_UNKNOWN_VERB: "UNKNOWN_VERB",
+    REJECT_UNKNOWN_RESOURCE: "UNKNOWN_RESOURCE",
+    REJECT_BAD_AMOUNT: "BAD_AMOUNT",
+    REJECT_BAD_TARGET: "BAD_TARGET",
+    REJECT_VERB_NOT_ALLOWED: "VERB_NOT_ALLOWED",
+}
+
+N_OBJECTS = len(canon.OBJECT_CLASSES)
+OBJECT_NONE_CODE = canon.OBJECT_CLASSES.index(canon.OBJECT_NONE)
+
+_TRANSFER = canon.VERB_INDEX["TRANSFER"]
+
+
+def seat_classes_from_players(players: Dict[str, Any]) -> List[str]:
+    """
+    Seat actor classes: humans take the first seats, AIs the rest.
+    """
+    humans = players.get("humans", [])
+    ais = players.get("ais", [])
+    seats_total = int(players.get("seats_total", len(humans) + len(ais)))
+    return ["HUMAN" if s < len(humans) else "AI" for s in range(seats_total)]
+
+
+@dataclass(frozen=True)
+class ValidatedBatch:
+    """
+    Column-oriented view of a validated batch, aligned with the input.
+    """
+    codes: array   # 'B' rejection code
+    seats: array   # 'q' acting seat (0 when unknown)
+    verbs: array   # 'b' verb code (-1 when unknown)
+    kinds: array   # 'b' object class code
+    amounts: array  # 'q'
+    targets: array  # 'q' target seat (0 when none)
+
+    def accepted(self) -> List[int]:
+        codes = self.codes
+        return [i for i in range(len(codes)) if codes[i] == OK]
+
+
+class LegalityTables:
+    """
+    Integer-coded legality for one session's seats.
+    """
+
+    __slots__ = ("seats_total", "seat_class", "allowed")
+
+    def __init__(self, seat_classes: List[str]) -> None:
+        self.seats_total = len(seat_classes)
+        # index 0 unused: seats are 1-based
+        self.seat_class = array("b", [-1] + [canon.ACTOR_CLASS_INDEX[c] for c in seat_classes])
+        self.allowed = self.compile()
+
+    @staticmethod
+    def compile() -> array:
+        allowed = array("H", [0] * (len(canon.ACTOR_CLASSES) * N_OBJECTS))
+        for a, actor_class in enumerate(canon.ACTOR_CLASSES):
+            for verb in canon.ACTOR_VERBS[actor_class]:
+                bit = 1 << canon.VERB_INDEX[verb]
+                for obj in canon.VERB_OBJECTS[verb]:
+                    allowed[a * N_OBJECTS + canon.OBJECT_CLASSES.index(obj)] |= bit
+        return allowed
+
+    @classmethod
+    def from_players(cls, players: Dict[str, Any]) -> "LegalityTables":
+        return cls(seat_classes_from_players(players))
+
+    def is_legal(self, seat: int, verb: int, obj: int) -> bool:
+        return bool(self.allowed[self.seat_class[seat] * N_OBJECTS + obj] >> verb & 1)
+
+    def validate_batch(self, actions: List[Dict[str, Any]]) -> ValidatedBatch:
+        """
+        Validate a whole turn's batch in one pass.
+        """
+        n = len(actions)
+        codes = array("B", bytes(n))
+        seats = array("q", bytes(8 * n))
+        verbs = array("b", b"\xff" * n)
+        kinds = array("b", bytes(n))
+        amounts = array("q", bytes(8 * n))
+        targets = array("q", bytes(8 * n))
+
+        seats_total = self.seats_total
+        seat_class = self.seat_class
+        allowed = self.allowed
+        verb_index = canon.VERB_INDEX
+        resource_index = canon.RESOURCE_INDEX
+
+        for i, a in enumerate(actions):
+            seat = a.get("seat")
+            if type(seat) is not int or not 0 < seat <= seats_total:
+                codes[i] = REJECT_UNKNOWN_SEAT
+                continue
+            seats[i] = seat
+
+            verb = verb_index.get(a.get("verb"))
+            if verb is None:
+                codes[i] = REJECT_UNKNOWN_VERB
+                continue
+            verbs[i] = verb
+
+            resource = a.get("resource")
+            if resource is None:
+                obj = OBJECT_NONE_CODE
+            else:
+                obj = resource_index.get(resource)
+                if obj is None:
+                    codes[i] = REJECT_UNKNOWN_RESOURCE
+                    continue
+            kinds[i] = obj
+
+            if not allowed[seat_class[seat] * N_OBJECTS + obj] >> verb & 1:
+                codes[i] = REJECT_VERB_NOT_ALLOWED
+                continue
+
+            if obj == OBJECT_NONE_CODE:
+                continue
+
+            amount = a.get("amount")
+            if type(amount) is not int or amount < 0:
+                codes[i] = REJECT_BAD_AMOUNT
+                continue
+            amounts[i] = amount
+
+            if verb == _TRANSFER:
+                target = a.get("target")
+                if type(target) is not int or not 0 < target <= seats_total or target == seat:
+                    codes[i] = REJECT_BAD_TARGET
+                    continue
+                targets[i] = target
+
+        return ValidatedBatch(codes, seats, verbs, kinds, amounts, targets)
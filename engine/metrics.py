@@ -0,0 +1,194 @@
+# Opt-in instrumentation: timed spans and counters, per-run JSONL
+from __future__ import annotations
+
+import functools
+import json
+import os
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# -------------------------------------------------
+# Metrics contract (v0.1)
+#
+# Enabled when RISK_METRICS is truthy (1/true/yes/on). When disabled,
+# span() returns a shared no-op object, count() returns immediately and
+# timed() adds one global check per call.
+#
+# Output (one file per run): <log_dir>/metrics/metrics_<run_id>.jsonl
+#   {"type": "span", "name", "depth", "wall_s", "cpu_s"}   in close order
+#   {"type": "counters", "counters": {...}}
+#   {"type": "summary", "run_id", "spans": {...}, "counters": {...}}
+#
+# Metrics are observational only: they never feed back into state.
+# -------------------------------------------------
+
+ENV_VAR = "RISK_METRICS"
+
+
+def _truthy(value: str) -> bool:
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+class Recorder:
+    """
+    Span records and counters for one run.
+    """
+
+    __slots__ = ("run_id", "spans", "counters", "depth")
+
+    def __init__(self, run_id: Optional[str] = None) -> None:
+        if run_id is None:
+            stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+            run_id = f"{stamp}_{os.getpid()}"
+        self.run_id = run_id
+        self.spans: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {}
+        self.depth = 0
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("rec", "name", "wall", "cpu")
+
+    def __init__(self, rec: Recorder, name: str) -> None:
+        self.rec = rec
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.rec.depth += 1
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        rec = self.rec
+        rec.depth -= 1
+        rec.spans.append({"type": "span", "name": self.name, "depth": rec.depth, "wall_s": wall, "cpu_s": cpu})
+        return False
+
+
+_recorder: Optional[Recorder] = Recorder() if _truthy(os.getenv(ENV_VAR, "")) else None
+
+
+# -------------------------
+# Control
+# -------------------------
+
+def enabled() -> bool:
+    return _recorder is not None
+
+
+def enable(run_id: Optional[str] = None) -> Recorder:
+    global _recorder
+    _recorder = Recorder(run_id)
+    return _recorder
+
+
+def disable() -> None:
+    global _recorder
+    _recorder = None
+
+
+# -------------------------
+# Recording
+# -------------------------
+
+def span(name: str):
+    rec = _recorder
+    if rec is None:
+        return _NULL_SPAN
+    return _Span(rec, name)
+
+
+def count(name: str, n: int = 1) -> None:
+    rec = _recorder
+    if rec is None:
+        return
+    rec.counters[name] = rec.counters.get(name, 0) + n
+
+
+def timed(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator: record a span around every call of the wrapped function.
+    """
+    def decorate(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            rec = _recorder
+            if rec is None:
+                return fn(*args, **kwargs)
+            with _Span(rec, name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+# -------------------------
+# Output
+# -------------------------
+
+def summary() -> Dict[str, Any]:
+    rec = _recorder
+    if rec is None:
+        return {}
+    spans: Dict[str, Dict[str, Any]] = {}
+    for s in rec.spans:
+        agg = spans.setdefault(s["name"], {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "max_wall_s": 0.0})
+        agg["calls"] += 1
+        agg["wall_s"] += s["wall_s"]
+        agg["cpu_s"] += s["cpu_s"]
+        agg["max_wall_s"] = max(agg["max_wall_s"], s["wall_s"])
+    return {
+        "type": "summary",
+        "run_id": rec.run_id,
+        "spans": dict(sorted(spans.items())),
+        "counters": dict(sorted(rec.counters.items())),
+    }
+
+
+def flush(log_dir: Path) -> Optional[Path]:
+    """
+    Write this run's metrics JSONL under log_dir/metrics; returns the path.
+    """
+    rec = _recorder
+    if rec is None:
+        return None
+    out_dir = Path(log_dir) / "metrics"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / f"metrics_{rec.run_id}.jsonl"
+    lines = [json.dumps(s) for s in rec.spans]
+    lines.append(json.dumps({"type": "counters", "counters": dict(sorted(rec.counters.items()))}))
+    lines.append(json.dumps(summary()))
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def format_summary() -> str:
+    data = summary()
+    if not data:
+        return ""
+    out = [f"METRICS: run {data['run_id']}"]
+    for name, agg in data["spans"].items():
+        out.append(
+            f"  {name:<24} calls={agg['calls']:<4} wall={agg['wall_s'] * 1e3:9.2f} ms"
+            f"  cpu={agg['cpu_s'] * 1e3:9.2f} ms"
+        )
+    for name, value in data["counters"].items():
+        out.append(f"  {name:<24} {value}")
+    return "\n".join(out)
@@ -0,0 +1,138 @@
+# Struct-of-arrays pillar state (seats x pillars)
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, List, Sequence, Tuple, Union
+
+from .canon import PILLARS
+
+# -------------------------------------------------
+# Layout (v0.1)
+#
+# values is a flat, row-major array('q'):
+#   index = (seat - 1) * N_PILLARS + pillar
+#
+# Quantities are non-negative integers. Effects saturate at 0:
+# a pillar cannot be driven below "failed".
+#
+# A snapshot is the raw bytes of the array (one memcpy), cheap enough
+# to take every turn.
+# -------------------------------------------------
+
+N_PILLARS = len(PILLARS)
+
+Effect = Tuple[int, int, int]  # (seat, pillar, delta)
+
+
+class PillarStore:
+    """
+    Pillar values for every seat in one contiguous integer array.
+    """
+
+    __slots__ = ("seats_total", "values")
+
+    def __init__(self, seats_total: int, initial: Union[int, Sequence[int]] = 0) -> None:
+        self.seats_total = int(seats_total)
+        if isinstance(initial, int):
+            row = [initial] * N_PILLARS
+        else:
+            row = list(initial)
+            if len(row) != N_PILLARS:
+                raise ValueError(f"initial row must have {N_PILLARS} values")
+        if any(v < 0 for v in row):
+            raise ValueError("pillar values must be non-negative")
+        self.values = array("q", row * self.seats_total)
+
+    # -------------------------
+    # Cell access
+    # -------------------------
+
+    def index(self, seat: int, pillar: int) -> int:
+        return (seat - 1) * N_PILLARS + pillar
+
+    def get(self, seat: int, pillar: int) -> int:
+        return self.values[(seat - 1) * N_PILLARS + pillar]
+
+    def row(self, seat: int) -> Dict[str, int]:
+        base = (seat - 1) * N_PILLARS
+        return {p: self.values[base + i] for i, p in enumerate(PILLARS)}
+
+    def column(self, pillar: int) -> array:
+        # Strided copy: one value per seat, in seat order
+        return self.values[pillar::N_PILLARS]
+
+    # -------------------------
+    # Bulk effects
+    # -------------------------
+
+    def apply_effects(self, effects: Iterable[Effect]) -> List[int]:
+        """
+        Apply (seat, pillar, delta) effects in bulk.
+
+        Deltas on the same cell are netted first, then each cell is
+        written once and clamped at 0. Returns the sorted flat indices
+        of cells whose value actually changed.
+        """
+        seats_total = self.seats_total
+        net: Dict[int, int] = {}
+        for seat, pillar, delta in effects:
+            if not 0 < seat <= seats_total or not 0 <= pillar < N_PILLARS:
+                raise IndexError(f"effect out of range: seat={seat} pillar={pillar}")
+            idx = (seat - 1) * N_PILLARS + pillar
+            net[idx] = net.get(idx, 0) + int(delta)
+
+        values = self.values
+        changed: List[int] = []
+        for idx in sorted(net):
+            old = values[idx]
+            new = old + net[idx]
+            if new < 0:
+                new = 0
+            if new != old:
+                values[idx] = new
+                changed.append(idx)
+        return changed
+
+    # -------------------------
+    # Aggregates (per pillar)
+    # -------------------------
+
+    def totals(self) -> List[int]:
+        return [sum(self.values[p::N_PILLARS]) for p in range(N_PILLARS)]
+
+    def minimums(self) -> List[int]:
+        if not self.seats_total:
+            return [0] * N_PILLARS
+        return [min(self.values[p::N_PILLARS]) for p in range(N_PILLARS)]
+
+    def maximums(self) -> List[int]:
+        if not self.seats_total:
+            return [0] * N_PILLARS
+        return [max(self.values[p::N_PILLARS]) for p in range(N_PILLARS)]
+
+    def means(self) -> List[float]:
+        n = self.seats_total
+        return [t / n if n else 0.0 for t in self.totals()]
+
+    def count_at_or_below(self, pillar: int, threshold: int) -> int:
+        return sum(1 for v in self.values[pillar::N_PILLARS] if v <= threshold)
+
+    # -------------------------
+    # Snapshots
+    # -------------------------
+
+    def snapshot(self) -> bytes:
+        return self.values.tobytes()
+
+    def restore(self, snapshot: bytes) -> None:
+        values = array("q")
+        values.frombytes(snapshot)
+        if len(values) != self.seats_total * N_PILLARS:
+            raise ValueError("snapshot does not match store shape")
+        self.values = values
+
+    @classmethod
+    def from_snapshot(cls, seats_total: int, snapshot: bytes) -> "PillarStore":
+        store = cls(seats_total)
+        store.restore(snapshot)
+        return store
@@ -0,0 +1,68 @@
+# cProfile / tracemalloc wrappers for RISK_PROFILE runs
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List
+
+# -------------------------------------------------
+# Profile artifacts (v0.1)
+#
+# RISK_PROFILE=cpu   cProfile only
+# RISK_PROFILE=mem   cProfile + tracemalloc
+#
+# Files are named by tag only (no timestamps), so reruns overwrite:
+#   <out_dir>/<tag>.pstats        load with pstats / snakeviz
+#   <out_dir>/<tag>.top.txt       top functions by cumulative time
+#   <out_dir>/<tag>.alloc.txt     top allocation sites (mem only)
+#
+# main.py refuses to enable profiling in proof or CI mode.
+# -------------------------------------------------
+
+PROFILE_MODES = ("cpu", "mem")
+TOP_FUNCTIONS = 40
+TOP_ALLOCATIONS = 25
+TRACE_FRAMES = 10
+
+
+def profile_call(tag: str, fn: Callable[[], Any], *, mode: str, out_dir: Path) -> List[Path]:
+    """
+    Run fn() under the requested profilers; returns the files written.
+    """
+    if mode not in PROFILE_MODES:
+        raise ValueError(f"unknown profile mode: {mode}")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    trace = mode == "mem" and not tracemalloc.is_tracing()
+    if trace:
+        tracemalloc.start(TRACE_FRAMES)
+    profiler = cProfile.Profile()
+    written: List[Path] = []
+    try:
+        profiler.runcall(fn)
+    finally:
+        stats_path = out_dir / f"{tag}.pstats"
+        profiler.dump_stats(str(stats_path))
+        written.append(stats_path)
+
+        buf = io.StringIO()
+        pstats.Stats(profiler, stream=buf).sort_stats("cumulative").print_stats(TOP_FUNCTIONS)
+        top_path = out_dir / f"{tag}.top.txt"
+        top_path.write_text(buf.getvalue(), encoding="utf-8")
+        written.append(top_path)
+
+        if trace:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            lines = [f"# {tag}: current={current} B peak={peak} B", ""]
+            for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+                lines.append(str(stat))
+            alloc_path = out_dir / f"{tag}.alloc.txt"
+            alloc_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            written.append(alloc_path)
+    return written
@@ -0,0 +1,170 @@
+# Checkpointed replay: full state every K turns, deltas in between
+from __future__ import annotations
+
+import hashlib
+import json
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+# -------------------------------------------------
+# On-disk layout (v0.1)
+#
+#   <root>/manifest.json                 every, length, typecode, checkpoints
+#   <root>/checkpoint_<turn>.bin         raw array bytes (turn % every == 0)
+#   <root>/deltas_<turn>.jsonl           one line per turn after checkpoint <turn>:
+#                                        {"turn", "cells": [[index, value], ...], "fp"}
+#
+# fp is the SHA-256 of the full state bytes after that turn's commit.
+# Seeking to turn N loads checkpoint floor(N / every) * every and applies
+# at most every-1 deltas, then verifies the recorded fingerprint.
+# -------------------------------------------------
+
+MANIFEST = "manifest.json"
+
+
+class ReplayIntegrityError(ValueError):
+    pass
+
+
+def fingerprint(state: array) -> str:
+    return hashlib.sha256(state.tobytes()).hexdigest()
+
+
+def _checkpoint_path(root: Path, turn: int) -> Path:
+    return root / f"checkpoint_{turn:08d}.bin"
+
+
+def _deltas_path(root: Path, turn: int) -> Path:
+    return root / f"deltas_{turn:08d}.jsonl"
+
+
+def _write_manifest(root: Path, manifest: Dict[str, Any]) -> None:
+    tmp = root / (MANIFEST + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(root / MANIFEST)
+
+
+class ReplayWriter:
+    """
+    Records committed state, one call per turn, in order.
+    """
+
+    def __init__(self, root: Path, initial: array, *, every: int = 50) -> None:
+        if every < 1:
+            raise ValueError("checkpoint interval must be >= 1")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.every = int(every)
+        self.turn = 0
+        self.manifest: Dict[str, Any] = {
+            "every": self.every,
+            "length": len(initial),
+            "typecode": initial.typecode,
+            "checkpoints": {},
+            "last_turn": 0,
+        }
+        self._segment = None
+        self._checkpoint(0, initial)
+
+    def _checkpoint(self, turn: int, state: array) -> None:
+        if self._segment is not None:
+            self._segment.close()
+        _checkpoint_path(self.root, turn).write_bytes(state.tobytes())
+        self.manifest["checkpoints"][str(turn)] = fingerprint(state)
+        self.manifest["last_turn"] = turn
+        _write_manifest(self.root, self.manifest)
+        self._segment = _deltas_path(self.root, turn).open("w", encoding="utf-8")
+
+    def record(self, turn: int, state: array, changed: Iterable[int]) -> None:
+        """
+        Record the committed state after `turn`; `changed` lists the flat
+        indices written by that turn's Resolution.
+        """
+        if turn != self.turn + 1:
+            raise ValueError(f"turns must be recorded in order (expected {self.turn + 1}, got {turn})")
+        self.turn = turn
+
+        if turn % self.every == 0:
+            self._checkpoint(turn, state)
+            return
+
+        cells = [[i, state[i]] for i in sorted(set(changed))]
+        line = {"turn": turn, "cells": cells, "fp": fingerprint(state)}
+        self._segment.write(json.dumps(line, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        if self._segment is not None:
+            self._segment.close()
+            self._segment = None
+        self.manifest["last_turn"] = self.turn
+        _write_manifest(self.root, self.manifest)
+
+    def __enter__(self) -> "ReplayWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ReplayReader:
+    """
+    Random access to any recorded turn.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.manifest = json.loads((self.root / MANIFEST).read_text(encoding="utf-8"))
+        self.every = int(self.manifest["every"])
+        self.last_turn = int(self.manifest["last_turn"])
+
+    def _load_checkpoint(self, turn: int) -> array:
+        state = array(self.manifest["typecode"])
+        state.frombytes(_checkpoint_path(self.root, turn).read_bytes())
+        if len(state) != self.manifest["length"]:
+            raise ReplayIntegrityError(f"checkpoint {turn} has wrong length")
+        expected = self.manifest["checkpoints"].get(str(turn))
+        if fingerprint(state) != expected:
+            raise ReplayIntegrityError(f"checkpoint {turn} fingerprint mismatch")
+        return state
+
+    def seek(self, turn: int, *, verify: bool = True) -> array:
+        """
+        Reconstruct state after `turn`.
+        """
+        if not 0 <= turn <= self.last_turn:
+            raise ValueError(f"turn {turn} not recorded (0..{self.last_turn})")
+
+        base = (turn // self.every) * self.every
+        state = self._load_checkpoint(base)
+        if turn == base:
+            return state
+
+        expected_fp: Optional[str] = None
+        with _deltas_path(self.root, base).open("r", encoding="utf-8") as fh:
+            for raw in fh:
+                line = json.loads(raw)
+                for i, value in line["cells"]:
+                    state[i] = value
+                if line["turn"] == turn:
+                    expected_fp = line["fp"]
+                    break
+
+        if expected_fp is None:
+            raise ReplayIntegrityError(f"delta for turn {turn} missing")
+        if verify and fingerprint(state) != expected_fp:
+            raise ReplayIntegrityError(f"turn {turn} fingerprint mismatch")
+        return state
+
+    def fingerprints(self) -> List[str]:
+        """
+        Recorded fingerprint of every turn, 0..last_turn.
+        """
+        out: List[str] = []
+        for base in range(0, self.last_turn + 1, self.every):
+            out.append(self.manifest["checkpoints"][str(base)])
+            path = _deltas_path(self.root, base)
+            if path.exists():
+                with path.open("r", encoding="utf-8") as fh:
+                    out.extend(json.loads(raw)["fp"] for raw in fh)
+        return out[: self.last_turn + 1]
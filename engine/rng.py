@@ -0,0 +1,167 @@
+# Splittable, counter-based RNG service
+from __future__ import annotations
+
+import hashlib
+from typing import List, MutableSequence, Tuple, Union
+
+# -------------------------------------------------
+# Construction (v0.1)
+#
+# Every draw is a pure function of:
+#   root_seed, stream path (labels), counter
+#
+#   u64 = BLAKE2b-64(root_seed || encoded path || counter)
+#
+# A stream never depends on how many draws another stream made,
+# so workers may generate randomness in any order and still
+# reproduce a serial run bit-for-bit.
+#
+# Never use the builtin hash() for seeds: it is salted per process
+# (PYTHONHASHSEED) and is not reproducible across runs.
+# -------------------------------------------------
+
+Label = Union[int, str]
+
+SEED_BITS = 63
+_U64 = 2**64
+
+
+def _encode_label(label: Label) -> bytes:
+    if isinstance(label, bool) or not isinstance(label, (int, str)):
+        raise TypeError(f"RNG labels must be int or str, got {type(label).__name__}")
+    if isinstance(label, int):
+        body = str(label).encode("ascii")
+        return b"i" + len(body).to_bytes(4, "big") + body
+    body = label.encode("utf-8")
+    return b"s" + len(body).to_bytes(4, "big") + body
+
+
+def _encode_path(labels: Tuple[Label, ...]) -> bytes:
+    return b"".join(_encode_label(lbl) for lbl in labels)
+
+
+def _u64(root_seed: int, path: bytes, counter: int) -> int:
+    h = hashlib.blake2b(digest_size=8)
+    h.update(int(root_seed).to_bytes(16, "big", signed=True))
+    h.update(path)
+    h.update(b"#")
+    h.update(int(counter).to_bytes(8, "big"))
+    return int.from_bytes(h.digest(), "big")
+
+
+def seed_from_text(text: str) -> int:
+    """
+    Stable, process-independent seed derived from text (e.g. created_utc).
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % (2**31)
+
+
+def derive_seed(root_seed: int, *labels: Label) -> int:
+    """
+    Derive a non-negative integer seed for a sub-stream.
+    """
+    return _u64(root_seed, _encode_path(labels), 0) >> (64 - SEED_BITS)
+
+
+# -----------------------------
+# Streams
+# -----------------------------
+
+class RngStream:
+    """
+    Independent random stream addressed by (root_seed, labels).
+
+    Draws are indexed by an internal counter; ``at()`` gives random
+    access to any position without advancing the stream.
+    """
+
+    __slots__ = ("root_seed", "labels", "_path", "_counter")
+
+    def __init__(self, root_seed: int, labels: Tuple[Label, ...] = ()) -> None:
+        self.root_seed = int(root_seed)
+        self.labels = tuple(labels)
+        self._path = _encode_path(self.labels)
+        self._counter = 0
+
+    def split(self, *labels: Label) -> "RngStream":
+        return RngStream(self.root_seed, self.labels + tuple(labels))
+
+    @property
+    def counter(self) -> int:
+        return self._counter
+
+    def at(self, counter: int) -> int:
+        return _u64(self.root_seed, self._path, counter)
+
+    def next_u64(self) -> int:
+        value = _u64(self.root_seed, self._path, self._counter)
+        self._counter += 1
+        return value
+
+    def random(self) -> float:
+        # 53 high bits -> float in [0, 1)
+        return (self.next_u64() >> 11) / float(2**53)
+
+    def below(self, n: int) -> int:
+        """
+        Uniform integer in [0, n) without modulo bias.
+        """
+        if n <= 0:
+            raise ValueError("below() requires n > 0")
+        limit = _U64 - (_U64 % n)
+        while True:
+            value = self.next_u64()
+            if value < limit:
+                return value % n
+
+    def randint(self, lo: int, hi: int) -> int:
+        return lo + self.below(hi - lo + 1)
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("choice() from empty sequence")
+        return seq[self.below(len(seq))]
+
+    def shuffle(self, seq: MutableSequence) -> None:
+        # Fisher-Yates, in place
+        for i in range(len(seq) - 1, 0, -1):
+            j = self.below(i + 1)
+            seq[i], seq[j] = seq[j], seq[i]
+
+    def sample_indices(self, n: int, k: int) -> List[int]:
+        order = list(range(n))
+        self.shuffle(order)
+        return order[:k]
+
+
+# -----------------------------
+# Session-level service
+# -----------------------------
+
+class RngService:
+    """
+    Root of all engine randomness for one session.
+
+    Streams are addressed by (phase, seat, turn, ...) labels:
+
+        rng = RngService(session_seed)
+        rng.stream("phase", 2).shuffle(pool)
+        rng.for_seat(phase=7, seat=3, turn=12).random()
+    """
+
+    def __init__(self, root_seed: int) -> None:
+        self.root_seed = int(root_seed)
+
+    def stream(self, *labels: Label) -> RngStream:
+        return RngStream(self.root_seed, tuple(labels))
+
+    def for_phase(self, phase: int) -> RngStream:
+        return self.stream("phase", int(phase))
+
+    def for_seat(self, *, phase: int, seat: int, turn: int) -> RngStream:
+        return self.stream("phase", int(phase), "seat", int(seat), "turn", int(turn))
+
+    def for_turn(self, turn: int) -> RngStream:
+        return self.stream("turn", int(turn))
+
@@ -0,0 +1,104 @@
+# Deterministic scenario driver: stable / stressed / collapse
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+from .collapse import CollapseRule, CollapseWatcher
+from .pillars import N_PILLARS, PillarStore
+from .rng import RngService
+
+# -------------------------------------------------
+# Scenarios (v0.2 semantics, STATUS.md)
+#
+#   stable    no degradation
+#   stressed  each turn, each seat takes a hit of `stress_rate` on one
+#             seeded-random pillar with probability 1/2; a seat with
+#             budget left pays 1 budget to absorb the hit instead
+#   collapse  every pillar of every seat loses `stress_rate` per turn;
+#             collapse happens at a fixed, computable turn
+#
+# Pillar effects are applied in bulk once per turn (the Resolution
+# commit) and fed to the collapse watcher.
+# -------------------------------------------------
+
+SCENARIOS = ("stable", "stressed", "collapse")
+
+
+@dataclass(frozen=True)
+class ScenarioParams:
+    scenario: str = "stable"
+    seed: int = 0
+    seats: int = 8
+    horizon: int = 100
+    stress_rate: int = 1
+    starting_budget: int = 10
+    pillar_start: int = 10
+    min_failed: int = 3
+
+    def __post_init__(self) -> None:
+        if self.scenario not in SCENARIOS:
+            raise ValueError(f"unknown scenario: {self.scenario}")
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScenarioParams":
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def run_scenario(params: ScenarioParams, *, stop_on_collapse: bool = True) -> Dict[str, Any]:
+    """
+    Run one scenario to the horizon (or the first collapse) and summarize.
+    """
+    store = PillarStore(params.seats, initial=params.pillar_start)
+    watcher = CollapseWatcher(store, CollapseRule(min_failed=params.min_failed))
+    rng = RngService(params.seed)
+    budget = [params.starting_budget] * (params.seats + 1)
+
+    collapse_turn: Optional[int] = None
+    turns_run = 0
+    if watcher.initial_events:
+        collapse_turn = 0
+
+    for turn in range(1, params.horizon + 1):
+        if collapse_turn is not None and stop_on_collapse:
+            break
+        effects = []
+        if params.scenario == "collapse":
+            effects = [
+                (seat, p, -params.stress_rate)
+                for seat in range(1, params.seats + 1)
+                for p in range(N_PILLARS)
+            ]
+        elif params.scenario == "stressed":
+            for seat in range(1, params.seats + 1):
+                if watcher.is_collapsed(seat):
+                    continue
+                stream = rng.for_seat(phase=7, seat=seat, turn=turn)
+                if stream.below(2):
+                    continue
+                pillar = stream.below(N_PILLARS)
+                if budget[seat] > 0:
+                    budget[seat] -= 1
+                    continue
+                effects.append((seat, pillar, -params.stress_rate))
+
+        changed = store.apply_effects(effects)
+        events = watcher.observe(turn, changed)
+        turns_run = turn
+
+        if events and collapse_turn is None:
+            collapse_turn = turn
+
+    return {
+        "params": params.to_dict(),
+        "turns_run": turns_run,
+        "collapse_turn": collapse_turn,
+        "collapsed_seats": len(watcher.collapsed),
+        "near_collapse": len(watcher.near),
+        "pillar_totals": store.totals(),
+        "fingerprint_sha256": hashlib.sha256(store.snapshot()).hexdigest(),
+    }
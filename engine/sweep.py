@@ -0,0 +1,141 @@
+# Scenario sweep runner: parallel, early-terminating, resumable
+from __future__ import annotations
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .scenario import ScenarioParams, run_scenario
+
+# -------------------------------------------------
+# Sweep contract (v0.1)
+#
+# A grid point is a ScenarioParams dict. Its point_id is a hash of the
+# canonical JSON of those params, so ids are stable across runs.
+#
+# Results stream to a JSONL file, one summary per finished point,
+# flushed as they arrive. That file IS the checkpoint: on restart,
+# every point whose id appears in it is skipped. A torn last line from
+# an interrupted write is dropped.
+#
+# Runs stop at the first collapse turn (no simulation past terminal).
+# -------------------------------------------------
+
+
+def point_id(params: Dict[str, Any]) -> str:
+    canonical = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def grid(space: Dict[str, List[Any]], base: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """
+    Cartesian product of a parameter space, in deterministic key order.
+    """
+    keys = sorted(space)
+    points = []
+    for combo in itertools.product(*(space[k] for k in keys)):
+        params = dict(base or {})
+        params.update(zip(keys, combo))
+        # Normalize through ScenarioParams so defaults are explicit
+        points.append(ScenarioParams.from_dict(params).to_dict())
+    return points
+
+
+def run_point(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one grid point; the summary carries its point_id.
+    """
+    summary = run_scenario(ScenarioParams.from_dict(params), stop_on_collapse=True)
+    summary["point_id"] = point_id(params)
+    return summary
+
+
+def load_results(path: Path) -> List[Dict[str, Any]]:
+    """
+    Parse a results stream, repairing a torn trailing line in place.
+    """
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    raw = path.read_bytes()
+    results = []
+    good = 0
+    for line in raw.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            break
+        try:
+            results.append(json.loads(line))
+        except json.JSONDecodeError:
+            break
+        good += len(line)
+
+    if good != len(raw):
+        with path.open("r+b") as fh:
+            fh.truncate(good)
+    return results
+
+
+def completed_ids(path: Path) -> Set[str]:
+    return {r["point_id"] for r in load_results(path)}
+
+
+def run_sweep(
+    points: Iterable[Dict[str, Any]],
+    out_path: Path,
+    *,
+    workers: int = 0,
+) -> int:
+    """
+    Run every unfinished grid point and append summaries to out_path.
+
+    workers <= 1 runs in-process. Returns the number of points run now.
+    """
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    done = completed_ids(out_path)
+    pending = [p for p in points if point_id(p) not in done]
+    if not pending:
+        return 0
+
+    with out_path.open("a", encoding="utf-8") as out:
+
+        def write(summary: Dict[str, Any]) -> None:
+            out.write(json.dumps(summary, sort_keys=True) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+
+        if workers <= 1:
+            for params in pending:
+                write(run_point(params))
+            return len(pending)
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_point, params) for params in pending]
+            for fut in as_completed(futures):
+                write(fut.result())
+
+    return len(pending)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a scenario parameter sweep.")
+    parser.add_argument("--space", type=Path, required=True, help="JSON: {param: [values, ...]}")
+    parser.add_argument("--out", type=Path, required=True, help="results JSONL (also the checkpoint)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    space = json.loads(args.space.read_text(encoding="utf-8"))
+    points = grid(space)
+    ran = run_sweep(points, args.out, workers=args.workers)
+    print(f"[OK] sweep: {len(points)} point(s), {ran} run now, {len(points) - ran} resumed")
+
+
+if __name__ == "__main__":
+    main()
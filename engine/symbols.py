@@ -0,0 +1,49 @@
+# Session-level symbol tables: actors and catalog countries
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+from .catalog import load_catalog
+from .interning import SymbolTable
+
+# -------------------------------------------------
+# Session symbols (v0.1)
+#
+# One actor table and one country table per session, built on the
+# interning tables in engine.interning. Country ids are catalog ids.
+# -------------------------------------------------
+
+
+@dataclass
+class SessionSymbols:
+    """
+    Actor and country tables shared by every engine store in a session.
+
+    Country ids are catalog ids. Seat actors are interned first, in seat
+    order, so actor id == seat - 1 for seats.
+    """
+    actors: SymbolTable = field(default_factory=SymbolTable)
+    countries: SymbolTable = field(default_factory=lambda: SymbolTable(load_catalog().names))
+    seat_country: List[int] = field(default_factory=list)  # index seat - 1
+
+    @classmethod
+    def from_turn_order(cls, turn_order: Dict[str, Any]) -> "SessionSymbols":
+        symbols = cls()
+        seats_total = int(turn_order["seats_total"])
+        mapping = turn_order.get("seat_to_country", {})
+        for seat in range(1, seats_total + 1):
+            symbols.actors.intern(str(seat))
+            country = str(mapping.get(str(seat), "")).strip().upper()
+            symbols.seat_country.append(symbols.countries.intern(country) if country else -1)
+        return symbols
+
+    def actor_of_seat(self, seat: int) -> int:
+        return self.actors.id_of(str(seat))
+
+    def country_of_seat(self, seat: int) -> int:
+        return self.seat_country[seat - 1]
+
+    def country_name(self, seat: int) -> str:
+        cid = self.seat_country[seat - 1]
+        return self.countries.name_of(cid) if cid >= 0 else ""
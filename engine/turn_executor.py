@@ -0,0 +1,155 @@
+# Batched turn executor: validate -> resolve -> commit
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .canon import VERB_INDEX
+from .legality import (  # noqa: F401  (codes re-exported for callers)
+    OK,
+    REJECT_BAD_AMOUNT,
+    REJECT_BAD_TARGET,
+    REJECT_UNKNOWN_RESOURCE,
+    REJECT_UNKNOWN_SEAT,
+    REJECT_UNKNOWN_VERB,
+    REJECT_VERB_NOT_ALLOWED,
+    LegalityTables,
+)
+from .wallets import TRANSFER_OK, WalletTable
+
+# -------------------------------------------------
+# Action contract (v0.1)
+#
+# Each proposed action is a dict:
+#   seat: int            acting seat (1-based)
+#   verb: str            one of canon.VERBS
+#   resource: str        one of canon.RESOURCE_KINDS (SPEND / TRANSFER)
+#   amount: int          non-negative integer (SPEND / TRANSFER)
+#   target: int          receiving seat (TRANSFER only)
+#
+# Invariants:
+#   - every action is validated (legality tables) before Resolution
+#   - Resolution is one bulk transfer batch; wallets change once, at commit
+#   - rejected actions produce no state change
+# -------------------------------------------------
+
+# Resolution-time rejection (state-dependent); static codes live in legality
+REJECT_INSUFFICIENT = 100
+
+_HOLD = VERB_INDEX["HOLD"]
+_TRANSFER = VERB_INDEX["TRANSFER"]
+
+
+@dataclass(frozen=True)
+class TurnResult:
+    turn: int
+    # Events in the extract_consequences contract, one per action
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    # Per-action result code, aligned with the submitted batch
+    codes: List[int] = field(default_factory=list)
+
+    @property
+    def applied(self) -> int:
+        return sum(1 for c in self.codes if c == OK)
+
+    @property
+    def rejected(self) -> int:
+        return len(self.codes) - self.applied
+
+
+class TurnExecutor:
+    """
+    Processes every seat's proposed actions for a turn as one batch.
+    """
+
+    def __init__(
+        self,
+        turn_order: Dict[str, Any],
+        wallets: WalletTable,
+        legality: Optional[LegalityTables] = None,
+    ) -> None:
+        self.seats_total = int(turn_order["seats_total"])
+        if wallets.seats_total != self.seats_total:
+            raise ValueError("wallet table does not match turn order seats_total")
+        if legality is None:
+            legality = LegalityTables(["HUMAN"] * self.seats_total)
+        if legality.seats_total != self.seats_total:
+            raise ValueError("legality tables do not match turn order seats_total")
+        self.legality = legality
+        self.order: List[int] = [int(s) for s in turn_order["order"]]
+        # seat -> position in turn order (resolution priority)
+        self.rank: Dict[int, int] = {s: i for i, s in enumerate(self.order)}
+        self.wallets = wallets
+        self.turn = 0
+
+    @classmethod
+    def from_files(
+        cls,
+        turn_order_path: Path,
+        resources_path: Path,
+        players_path: Optional[Path] = None,
+    ) -> "TurnExecutor":
+        turn_order = json.loads(Path(turn_order_path).read_text(encoding="utf-8"))
+        resources = json.loads(Path(resources_path).read_text(encoding="utf-8"))
+        legality = None
+        if players_path is not None:
+            players = json.loads(Path(players_path).read_text(encoding="utf-8"))
+            legality = LegalityTables.from_players(players)
+        return cls(turn_order, WalletTable.from_resources(resources), legality)
+
+    # -------------------------
+    # Resolution + commit
+    # -------------------------
+
+    def execute_turn(self, turn: int, actions: List[Dict[str, Any]]) -> TurnResult:
+        """
+        Validate, resolve and commit one turn's batch.
+
+        Actions resolve in turn order (seat rank), submission order within
+        a seat. Funds checks see earlier effects of the same turn.
+        """
+        batch = self.legality.validate_batch(actions)
+        codes = batch.codes.tolist()
+        seats, verbs, kinds = batch.seats, batch.verbs, batch.kinds
+        amounts, targets = batch.amounts, batch.targets
+
+        rank = self.rank
+        schedule = sorted(batch.accepted(), key=lambda i: (rank[seats[i]], i))
+
+        # Resolution: one bulk, in-order transfer batch; the wallet table
+        # is committed once, after every entry resolved
+        entries = []
+        transfers = []
+        for i in schedule:
+            if verbs[i] == _HOLD or amounts[i] == 0:
+                continue
+            entries.append(i)
+            dst = targets[i] if verbs[i] == _TRANSFER else 0
+            transfers.append((seats[i], dst, kinds[i], amounts[i]))
+
+        results = self.wallets.apply_transfers(transfers, turn=turn, atomic=False)
+
+        applied = [0] * len(actions)
+        for i, code in zip(entries, results):
+            if code == TRANSFER_OK:
+                applied[i] = amounts[i]
+            else:
+                codes[i] = REJECT_INSUFFICIENT
+        self.turn = turn
+
+        events = []
+        for i, a in enumerate(actions):
+            amount = applied[i]
+            events.append({
+                "turn": turn,
+                "actor": str(a.get("seat", "")),
+                "verb": a.get("verb"),
+                "ok": codes[i] == OK,
+                "cost": float(amount),
+                "delta": float(-amount),
+                "magnitude": float(amount),
+            })
+
+        return TurnResult(turn=turn, events=events, codes=codes)
@@ -0,0 +1,184 @@
+# Array-backed wallet balances (seats x resource kinds)
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .canon import RESOURCE_KINDS
+
+# -------------------------------------------------
+# Layout (v0.1)
+#
+# balances is a flat, row-major array('q'):
+#   index = (seat - 1) * len(RESOURCE_KINDS) + kind
+#
+# Seats are 1-based, as in players.json / turn_order.json.
+# All quantities are non-negative integers.
+# -------------------------------------------------
+
+KINDS = len(RESOURCE_KINDS)
+
+# -------------------------------------------------
+# Bulk transfers (v0.1)
+#
+# A transfer is a tuple (src_seat, dst_seat, kind, amount):
+#   dst_seat == 0 means SPEND (debit only, no credit)
+#   kind is the RESOURCE_KINDS position
+#
+# atomic=True   the batch is netted per (seat, kind); if any entry is
+#               malformed or any cell would go negative, nothing is applied
+# atomic=False  entries are applied in submission order; an entry that
+#               would overdraw is rejected, the rest still apply
+#
+# Either way the table changes at most once, after the whole batch.
+# -------------------------------------------------
+
+TRANSFER_OK = 0
+TRANSFER_MALFORMED = 1
+TRANSFER_INSUFFICIENT = 2
+TRANSFER_BATCH_REJECTED = 3
+
+Transfer = Tuple[int, int, int, int]
+
+
+class WalletTable:
+    """
+    Integer wallet balances for every seat, one flat array.
+    """
+
+    __slots__ = ("seats_total", "balances", "ledger")
+
+    def __init__(self, seats_total: int, balances: array | None = None) -> None:
+        self.seats_total = int(seats_total)
+        if balances is None:
+            balances = array("q", bytes(8 * KINDS * self.seats_total))
+        if len(balances) != KINDS * self.seats_total:
+            raise ValueError("balances length does not match seats_total")
+        self.balances = balances
+        # Ledger records pending write-back, per seat
+        self.ledger: Dict[int, List[Dict[str, Any]]] = {}
+
+    @classmethod
+    def from_resources(cls, resources: Dict[str, Any]) -> "WalletTable":
+        """
+        Build from a Phase 3 resources.json payload.
+        """
+        rows = resources.get("resources_by_seat", [])
+        seats_total = max((int(r["seat"]) for r in rows), default=0)
+        table = cls(seats_total)
+        for r in rows:
+            base = (int(r["seat"]) - 1) * KINDS
+            wallet = r.get("wallet", {})
+            for k, kind in enumerate(RESOURCE_KINDS):
+                value = int(wallet.get(kind, 0))
+                if value < 0:
+                    raise ValueError(f"negative {kind} for seat {r['seat']}")
+                table.balances[base + k] = value
+        return table
+
+    def index(self, seat: int, kind: int) -> int:
+        return (seat - 1) * KINDS + kind
+
+    def get(self, seat: int, kind: int) -> int:
+        return self.balances[(seat - 1) * KINDS + kind]
+
+    def wallet(self, seat: int) -> Dict[str, int]:
+        base = (seat - 1) * KINDS
+        return {kind: self.balances[base + k] for k, kind in enumerate(RESOURCE_KINDS)}
+
+    def apply_transfers(
+        self,
+        transfers: Sequence[Transfer],
+        *,
+        turn: int,
+        atomic: bool = True,
+    ) -> List[int]:
+        """
+        Apply a batch of transfers; returns a result code per entry.
+        """
+        seats_total = self.seats_total
+        codes = [TRANSFER_OK] * len(transfers)
+        net: Dict[int, int] = {}
+        debits: Dict[int, int] = {}
+
+        for i, (src, dst, kind, amount) in enumerate(transfers):
+            if (
+                type(amount) is not int or amount < 0
+                or not 0 < src <= seats_total
+                or not 0 <= dst <= seats_total or dst == src
+                or not 0 <= kind < KINDS
+            ):
+                codes[i] = TRANSFER_MALFORMED
+                continue
+            s_idx = (src - 1) * KINDS + kind
+            net[s_idx] = net.get(s_idx, 0) - amount
+            debits[s_idx] = debits.get(s_idx, 0) + amount
+            if dst:
+                d_idx = (dst - 1) * KINDS + kind
+                net[d_idx] = net.get(d_idx, 0) + amount
+
+        balances = self.balances
+
+        if atomic and TRANSFER_MALFORMED in codes:
+            return [c if c == TRANSFER_MALFORMED else TRANSFER_BATCH_REJECTED for c in codes]
+
+        if atomic:
+            short = {idx for idx, d in net.items() if balances[idx] + d < 0}
+            if short:
+                for i, (src, _, kind, _) in enumerate(transfers):
+                    if codes[i] == TRANSFER_OK:
+                        idx = (src - 1) * KINDS + kind
+                        codes[i] = TRANSFER_INSUFFICIENT if idx in short else TRANSFER_BATCH_REJECTED
+                return codes
+            for idx, d in net.items():
+                balances[idx] += d
+        elif all(balances[idx] >= d for idx, d in debits.items()):
+            # Debits alone are covered: every entry succeeds in any order
+            for idx, d in net.items():
+                balances[idx] += d
+        else:
+            work = balances[:]
+            for i, (src, dst, kind, amount) in enumerate(transfers):
+                if codes[i] != TRANSFER_OK:
+                    continue
+                s_idx = (src - 1) * KINDS + kind
+                if work[s_idx] < amount:
+                    codes[i] = TRANSFER_INSUFFICIENT
+                    continue
+                work[s_idx] -= amount
+                if dst:
+                    work[(dst - 1) * KINDS + kind] += amount
+            # In place: holders of the table's array must see the commit
+            balances[:] = work
+
+        self._record(transfers, codes, turn)
+        return codes
+
+    def _record(self, transfers: Sequence[Transfer], codes: List[int], turn: int) -> None:
+        ledger = self.ledger
+        for i, (src, dst, kind, amount) in enumerate(transfers):
+            if codes[i] != TRANSFER_OK or amount == 0:
+                continue
+            resource = RESOURCE_KINDS[kind]
+            if dst:
+                ledger.setdefault(src, []).append(
+                    {"turn": turn, "verb": "TRANSFER", "resource": resource, "delta": -amount, "to": dst}
+                )
+                ledger.setdefault(dst, []).append(
+                    {"turn": turn, "verb": "TRANSFER", "resource": resource, "delta": amount, "from": src}
+                )
+            else:
+                ledger.setdefault(src, []).append(
+                    {"turn": turn, "verb": "SPEND", "resource": resource, "delta": -amount}
+                )
+
+    def write_back(self, resources: Dict[str, Any]) -> None:
+        """
+        Render balances and pending ledger records into resources.json shape.
+        """
+        for r in resources.get("resources_by_seat", []):
+            seat = int(r["seat"])
+            r["wallet"] = self.wallet(seat)
+            pending = self.ledger.pop(seat, None)
+            if pending:
+                r.setdefault("ledger", []).extend(pending)
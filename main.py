@@ -15,10 +15,27 @@ PROOF_MODE = RUN_MODE == "proof" or (IS_CI and RUN_MODE != "normal")
 if PROOF_MODE:
     print("Proof run OK (observer-only). No state created.")
     sys.exit(0)
+
+# ==============================
+# Profiling (opt-in, never in proof / CI)
+# ==============================
+from engine.profiling import PROFILE_MODES
+
+PROFILE_MODE = os.getenv("RISK_PROFILE", "").strip().lower()
+
+if PROFILE_MODE and IS_CI:
+    print("RISK_PROFILE ignored in CI.")
+    PROFILE_MODE = ""
+elif PROFILE_MODE and PROFILE_MODE not in PROFILE_MODES:
+    print(f"RISK_PROFILE ignored (expected {' or '.join(PROFILE_MODES)}): {PROFILE_MODE}")
+    PROFILE_MODE = ""
+
 from pathlib import Path
 import json
 from datetime import datetime, timezone
 
+from engine import metrics
+
 # =========================
 # Paths
 # =========================
@@ -48,16 +65,41 @@ def log(msg: str) -> None:
         LOG_FILE.write_text(line, encoding="utf-8")
 
 def load_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    with metrics.span("json.load"):
+        return json.loads(path.read_text(encoding="utf-8"))
 
 def save_json(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    with metrics.span("json.save"):
+        text = json.dumps(data, indent=2)
+        path.write_text(text, encoding="utf-8")
+        metrics.count("bytes_written", len(text))  # ASCII-only JSON
+
+def run_selected(tag: str, fn) -> None:
+    if PROOF_MODE or IS_CI or not PROFILE_MODE:
+        fn()
+        return
+
+    from engine.profiling import profile_call
+    written = profile_call(tag, fn, mode=PROFILE_MODE, out_dir=LOG_DIR / "profile")
+    log(f"PROFILE {PROFILE_MODE.upper()} {tag}")
+    for path in written:
+        print(f"PROFILE: {path}")
 
 # =========================
 # Router
 # =========================
 
 def main() -> None:
+    try:
+        with metrics.span("main.main"):
+            route()
+    finally:
+        if metrics.enabled():
+            path = metrics.flush(LOG_DIR)
+            print(metrics.format_summary())
+            print(f"METRICS: {path}")
+
+def route() -> None:
     if not SESSION_FILE.exists():
         print("No session found. Run Phase 0 first.")
         log("ROUTER: NO SESSION")
@@ -71,19 +113,19 @@ def main() -> None:
     # Phase 1 → Country Selection (Phase 2 stub)
     if phase == 1:
         from phases.phase2 import run_phase_2
-        run_phase_2()
+        run_selected("phase2", run_phase_2)
         return
 
     # Phase 2 → Initial Resources (Phase 3)
     if phase == 2:
         from phases.phase3 import run_phase_3
-        run_phase_3()
+        run_selected("phase3", run_phase_3)
         return
 
     # Phase 3 → Turn Order (Phase 6)
     if phase == 3:
         from phases.phase6 import run_phase_6
-        run_phase_6()
+        run_selected("phase6", run_phase_6)
         return
 
     print(f"Unknown session phase: {phase}")
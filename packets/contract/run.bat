@@ -0,0 +1,4 @@
+@echo off
+rem Run the contract packet from the repository root
+cd /d "%~dp0..\.."
+python scripts\packet_contract.py %*
@@ -0,0 +1,4 @@
+#!/usr/bin/env sh
+# Run the contract packet from the repository root
+cd "$(dirname "$0")/../.." || exit 1
+exec python scripts/packet_contract.py "$@"
@@ -0,0 +1,4 @@
+@echo off
+rem Run the determinism packet from the repository root
+cd /d "%~dp0..\.."
+python scripts\packet_determinism.py %*
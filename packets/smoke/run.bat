@@ -0,0 +1,4 @@
+@echo off
+rem Run the smoke packet from the repository root
+cd /d "%~dp0..\.."
+python scripts\packet_smoke.py %*
@@ -0,0 +1,4 @@
+#!/usr/bin/env sh
+# Run the smoke packet from the repository root
+cd "$(dirname "$0")/../.." || exit 1
+exec python scripts/packet_smoke.py "$@"
@@ -1,8 +1,11 @@
 import json
-import random
 from datetime import datetime, timezone
 from pathlib import Path
 
+from engine import metrics
+from engine.catalog import load_catalog
+from engine.rng import RngService, seed_from_text
+
 # -------------------------
 # Paths / Files
 # -------------------------
@@ -31,34 +34,21 @@ def log(msg: str) -> None:
 
 
 def load_json(path: Path) -> dict:
-    return json.loads(path.read_text(encoding="utf-8"))
+    with metrics.span("json.load"):
+        return json.loads(path.read_text(encoding="utf-8"))
 
 
 def save_json(path: Path, data: dict) -> None:
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-
-
-def normalize_pool(pool_text: str) -> list[str]:
-    # Uppercase, trim, drop blanks, de-dupe while preserving order
-    seen = set()
-    out = []
-    for raw in pool_text.splitlines():
-        name = raw.strip()
-        if not name:
-            continue
-        # allow comments in the text block
-        if name.startswith("#"):
-            continue
-        name = name.upper()
-        if name not in seen:
-            seen.add(name)
-            out.append(name)
-    return out
+    with metrics.span("json.save"):
+        text = json.dumps(data, indent=2)
+        path.write_text(text, encoding="utf-8")
+        metrics.count("bytes_written", len(text))  # ASCII-only JSON
 
 
 # -------------------------
 # Phase 2: Country Selection (STUB)
 # -------------------------
+@metrics.timed("run_phase_2")
 def run_phase_2() -> None:
     print("RISK: Global Power - Phase 2 (Country Selection - STUB)")
     log("PHASE 2 START")
@@ -86,238 +76,8 @@ def run_phase_2() -> None:
     ais = players.get("ais", [])
     seats_total = int(players.get("seats_total", len(humans) + len(ais)))
 
-    # 200+ country/territory pool as multiline text (no comma/quote misery)
-    COUNTRY_POOL_TEXT = """
-AFGHANISTAN
-ALBANIA
-ALGERIA
-ANDORRA
-ANGOLA
-ANTIGUA AND BARBUDA
-ARGENTINA
-ARMENIA
-AUSTRALIA
-AUSTRIA
-AZERBAIJAN
-BAHAMAS
-BAHRAIN
-BANGLADESH
-BARBADOS
-BELARUS
-BELGIUM
-BELIZE
-BENIN
-BHUTAN
-BOLIVIA
-BOSNIA AND HERZEGOVINA
-BOTSWANA
-BRAZIL
-BRUNEI
-BULGARIA
-BURKINA FASO
-BURUNDI
-CABO VERDE
-CAMBODIA
-CAMEROON
-CANADA
-CENTRAL AFRICAN REPUBLIC
-CHAD
-CHILE
-CHINA
-COLOMBIA
-COMOROS
-CONGO (REPUBLIC OF THE)
-CONGO (DEMOCRATIC REPUBLIC OF THE)
-COSTA RICA
-COTE D'IVOIRE
-CROATIA
-CUBA
-CYPRUS
-CZECHIA
-DENMARK
-DJIBOUTI
-DOMINICA
-DOMINICAN REPUBLIC
-ECUADOR
-EGYPT
-EL SALVADOR
-EQUATORIAL GUINEA
-ERITREA
-ESTONIA
-ESWATINI
-ETHIOPIA
-FIJI
-FINLAND
-FRANCE
-GABON
-GAMBIA
-GEORGIA
-GERMANY
-GHANA
-GREECE
-GRENADA
-GUATEMALA
-GUINEA
-GUINEA-BISSAU
-GUYANA
-HAITI
-HONDURAS
-HUNGARY
-ICELAND
-INDIA
-INDONESIA
-IRAN
-IRAQ
-IRELAND
-ISRAEL
-ITALY
-JAMAICA
-JAPAN
-JORDAN
-KAZAKHSTAN
-KENYA
-KIRIBATI
-KUWAIT
-KYRGYZSTAN
-LAOS
-LATVIA
-LEBANON
-LESOTHO
-LIBERIA
-LIBYA
-LIECHTENSTEIN
-LITHUANIA
-LUXEMBOURG
-MADAGASCAR
-MALAWI
-MALAYSIA
-MALDIVES
-MALI
-MALTA
-MARSHALL ISLANDS
-MAURITANIA
-MAURITIUS
-MEXICO
-MICRONESIA
-MOLDOVA
-MONACO
-MONGOLIA
-MONTENEGRO
-MOROCCO
-MOZAMBIQUE
-MYANMAR
-NAMIBIA
-NAURU
-NEPAL
-NETHERLANDS
-NEW ZEALAND
-NICARAGUA
-NIGER
-NIGERIA
-NORTH KOREA
-NORTH MACEDONIA
-NORWAY
-OMAN
-PAKISTAN
-PALAU
-PANAMA
-PAPUA NEW GUINEA
-PARAGUAY
-PERU
-PHILIPPINES
-POLAND
-PORTUGAL
-QATAR
-ROMANIA
-RUSSIA
-RWANDA
-SAINT KITTS AND NEVIS
-SAINT LUCIA
-SAINT VINCENT AND THE GRENADINES
-SAMOA
-SAN MARINO
-SAO TOME AND PRINCIPE
-SAUDI ARABIA
-SENEGAL
-SERBIA
-SEYCHELLES
-SIERRA LEONE
-SINGAPORE
-SLOVAKIA
-SLOVENIA
-SOLOMON ISLANDS
-SOMALIA
-SOUTH AFRICA
-SOUTH KOREA
-SOUTH SUDAN
-SPAIN
-SRI LANKA
-SUDAN
-SURINAME
-SWEDEN
-SWITZERLAND
-SYRIA
-TAJIKISTAN
-TANZANIA
-THAILAND
-TIMOR-LESTE
-TOGO
-TONGA
-TRINIDAD AND TOBAGO
-TUNISIA
-TURKEY
-TURKMENISTAN
-TUVALU
-UGANDA
-UKRAINE
-UNITED ARAB EMIRATES
-UNITED KINGDOM
-UNITED STATES
-URUGUAY
-UZBEKISTAN
-VANUATU
-VENEZUELA
-VIETNAM
-YEMEN
-ZAMBIA
-ZIMBABWE
-
-# Extras / territories / non-UN observers (pushes comfortably over 200)
-TAIWAN
-PALESTINE
-KOSOVO
-HONG KONG
-MACAO
-GREENLAND
-PUERTO RICO
-FAROE ISLANDS
-WESTERN SAHARA
-VATICAN CITY
-CURACAO
-ARUBA
-BONAIRE
-SINT MAARTEN
-SINT EUSTATIUS
-SABA
-GIBRALTAR
-BERMUDA
-CAYMAN ISLANDS
-BRITISH VIRGIN ISLANDS
-US VIRGIN ISLANDS
-GUAM
-AMERICAN SAMOA
-NORTHERN MARIANA ISLANDS
-FRENCH POLYNESIA
-NEW CALEDONIA
-WALLIS AND FUTUNA
-SAINT PIERRE AND MIQUELON
-MARTINIQUE
-GUADELOUPE
-REUNION
-MAYOTTE
-FRENCH GUIANA
-"""
-    country_pool = normalize_pool(COUNTRY_POOL_TEXT)
+    # 200+ country/territory pool: prebuilt catalog, loaded once per process
+    country_pool = list(load_catalog().names)
 
     # Make sure we have enough countries for all seats
     if len(country_pool) < seats_total:
@@ -325,7 +85,16 @@ FRENCH GUIANA
         log("PHASE 2 FAIL (POOL TOO SMALL)")
         return
 
-    random.shuffle(country_pool)
+    # Deterministic seed handling (shared with Phase 6)
+    seed = session.get("seed")
+    if seed is None:
+        seed = seed_from_text(session.get("created_utc") or utc_now())
+        session["seed"] = seed
+        log(f"PHASE 2 NOTE (SEED STORED) seed={seed}")
+    else:
+        log(f"PHASE 2 NOTE (SEED REUSED) seed={seed}")
+
+    RngService(int(seed)).for_phase(2).shuffle(country_pool)
     assigned = country_pool[:seats_total]
 
     # Map seat -> country
@@ -2,6 +2,8 @@ from pathlib import Path
 import json
 from datetime import datetime, timezone
 
+from engine import metrics
+
 ENGINE_ROOT = Path(__file__).resolve().parents[1]  # .../risk_engine
 STATE_DIR = ENGINE_ROOT / "state"
 LOG_DIR = ENGINE_ROOT / "logs"
@@ -25,13 +27,18 @@ def log(msg: str) -> None:
 
 
 def load_json(path: Path):
-    return json.loads(path.read_text(encoding="utf-8"))
+    with metrics.span("json.load"):
+        return json.loads(path.read_text(encoding="utf-8"))
 
 
 def save_json(path: Path, obj) -> None:
-    path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    with metrics.span("json.save"):
+        text = json.dumps(obj, indent=2)
+        path.write_text(text, encoding="utf-8")
+        metrics.count("bytes_written", len(text))  # ASCII-only JSON
 
 
+@metrics.timed("run_phase_3")
 def run_phase_3() -> None:
     print("RISK: Global Power — Phase 3 (Initial Resources — STRUCTURE ONLY)")
     log("PHASE 3 START")
@@ -1,8 +1,10 @@
 from pathlib import Path
 import json
-import random
 from datetime import datetime, timezone
 
+from engine import metrics
+from engine.rng import RngService, seed_from_text
+
 # ============================================================
 # Phase 6 — Turn Structure (STRUCTURE ONLY)
 # ============================================================
@@ -44,14 +46,19 @@ def log(msg: str) -> None:
     LOG_FILE.write_text(prev + f"[{utc_now()}] {msg}\n", encoding="utf-8")
 
 def load_json(path: Path):
-    return json.loads(path.read_text(encoding="utf-8"))
+    with metrics.span("json.load"):
+        return json.loads(path.read_text(encoding="utf-8"))
 
 def save_json(path: Path, obj) -> None:
-    path.write_text(json.dumps(obj, indent=2), encoding="utf-8")
+    with metrics.span("json.save"):
+        text = json.dumps(obj, indent=2)
+        path.write_text(text, encoding="utf-8")
+        metrics.count("bytes_written", len(text))  # ASCII-only JSON
 
 # -------------------------
 # Phase 6 Entry
 # -------------------------
+@metrics.timed("run_phase_6")
 def run_phase_6() -> None:
     print("RISK: Global Power — Phase 6 (Turn Order — STRUCTURE ONLY)")
     log("PHASE 6 START")
@@ -146,14 +153,14 @@ def run_phase_6() -> None:
     seed = session.get("seed")
     if seed is None:
         base = session.get("created_utc") or utc_now()
-        seed = abs(hash(base)) % (2**31)
+        seed = seed_from_text(base)
         session["seed"] = seed
         save_json(SESSION_FILE, session)
         log(f"PHASE 6 NOTE (SEED STORED) seed={seed}")
     else:
         log(f"PHASE 6 NOTE (SEED REUSED) seed={seed}")
 
-    rng = random.Random(int(seed))
+    rng = RngService(int(seed)).for_phase(6)
 
     # -------------------------
     # Build turn order
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 # -------------------------------------------------
@@ -23,7 +25,8 @@ from typing import Dict, List
 # -------------------------------------------------
 
 
-REPO_ROOT = Path(__file__).resolve().parents[1]
+# This file lives at <repo>/risk_gp/risk_gp/preflight.py
+REPO_ROOT = Path(__file__).resolve().parents[2]
 DOCS_DIR = REPO_ROOT / "docs"
 LOGS_DIR = REPO_ROOT / "logs"
 STATE_DIR = LOGS_DIR / "state"
@@ -31,9 +34,11 @@ STATE_DIR = LOGS_DIR / "state"
 SNAPSHOT_PATH = STATE_DIR / "preflight.json"
 LOG_PATH = LOGS_DIR / "preflight.log"
 
-
-def _read_text(path: Path) -> str:
-    return path.read_text(encoding="utf-8") if path.exists() else ""
+# Per-file hash cache, keyed by path and validated by (size, mtime_ns).
+# Not an artifact: it never feeds the fingerprint directly, only saves
+# re-reading unchanged docs.
+CACHE_PATH = STATE_DIR / "preflight_cache.json"
+HASH_WORKERS = min(8, (os.cpu_count() or 1) + 1)
 
 
 def _extract_status(md_text: str) -> str:
@@ -44,29 +49,78 @@ def _extract_status(md_text: str) -> str:
     return "UNKNOWN"
 
 
-def _discover_docs() -> List[Dict[str, str]]:
+def _load_cache() -> Dict[str, Dict]:
+    try:
+        cache = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_cache(cache: Dict[str, Dict]) -> None:
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    tmp.replace(CACHE_PATH)
+
+
+def _hash_doc(path: Path) -> Dict[str, str]:
+    # Newlines normalized as read_text() does, so a CRLF checkout
+    # fingerprints the same as an LF one
+    data = path.read_bytes().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return {
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "status": _extract_status(data.decode("utf-8")),
+    }
+
+
+def _discover_docs() -> Tuple[List[Dict[str, str]], int]:
+    """
+    Recursively discover docs; hash only files whose size/mtime changed.
+
+    Returns (docs sorted by path, number of files re-hashed).
+    """
     docs: List[Dict[str, str]] = []
     if not DOCS_DIR.exists():
-        return docs
+        return docs, 0
+
+    cache = _load_cache()
+    fresh: Dict[str, Dict] = {}
+    stale: List[Tuple[str, Path, os.stat_result]] = []
+
+    for path in DOCS_DIR.rglob("*.md"):
+        if not path.is_file():
+            continue
+        rel = path.relative_to(REPO_ROOT).as_posix()
+        st = path.stat()
+        hit = cache.get(rel)
+        if hit and hit.get("size") == st.st_size and hit.get("mtime_ns") == st.st_mtime_ns:
+            fresh[rel] = hit
+        else:
+            stale.append((rel, path, st))
+
+    if stale:
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            hashed = list(pool.map(_hash_doc, [p for _, p, _ in stale]))
+        for (rel, _, st), entry in zip(stale, hashed):
+            fresh[rel] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, **entry}
+
+    if fresh != cache:
+        _save_cache(fresh)
 
-    for path in sorted(DOCS_DIR.glob("*.md")):
-        txt = _read_text(path)
-        docs.append(
-            {
-                "path": path.relative_to(REPO_ROOT).as_posix(),
-                "status": _extract_status(txt),
-                "content": txt,
-            }
-        )
-    return docs
+    for rel in sorted(fresh):
+        docs.append({"path": rel, "status": fresh[rel]["status"], "sha256": fresh[rel]["sha256"]})
+    return docs, len(stale)
 
 
 def _fingerprint(docs: List[Dict[str, str]]) -> str:
+    # Combined from per-file digests, in path order: deterministic and
+    # independent of which files came from the cache.
     h = hashlib.sha256()
     for d in docs:
         h.update(d["path"].encode("utf-8"))
         h.update(b"\n")
-        h.update(d["content"].encode("utf-8"))
+        h.update(d["sha256"].encode("ascii"))
         h.update(b"\n---\n")
     return h.hexdigest()
 
@@ -85,8 +139,8 @@ def main() -> int:
     print("")
 
     print("STEP 1/4: Discover design artifacts")
-    docs = _discover_docs()
-    print(f"  - Found {len(docs)} doc(s) in /docs")
+    docs, rehashed = _discover_docs()
+    print(f"  - Found {len(docs)} doc(s) in /docs ({rehashed} re-hashed, {len(docs) - rehashed} cached)")
 
     print("STEP 2/4: Inspect STATUS lines")
     for d in docs:
@@ -100,12 +154,12 @@ def main() -> int:
 
     snapshot = {
         "artifact_kind": "preflight_snapshot",
-        "schema_version": "0.1",
+        "schema_version": "0.2",
         "mode": "orientation_only",
-        "docs": [{"path": d["path"], "status": d["status"]} for d in docs],
+        "docs": [{"path": d["path"], "status": d["status"], "sha256": d["sha256"]} for d in docs],
         "determinism": {
             "fingerprint_sha256": fp,
-            "note": "Derived only from doc paths + full contents. No timestamps.",
+            "note": "Derived only from doc paths + per-file SHA-256 of full contents. No timestamps.",
         },
         "policy": {
             "semantic_execution": False,
@@ -0,0 +1,216 @@
+# Shared packet runner: isolated pipeline runs, output hashing, timings
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# -------------------------------------------------
+# Packet contract (v0.1)
+#
+# Each run copies the engine (main.py, phases/, engine/, derived/) into
+# a fresh temporary root, seeds state/session.json and state/players.json
+# (the Phase 0 / Phase 1 outputs), then calls main.py once per pipeline
+# step until the session phase stops advancing.
+#
+# Output hash: sha256 over state/*.json in name order, parsed and
+# re-serialized with sort_keys and with VOLATILE_KEYS removed
+# (wall-clock stamps are not part of the deterministic contract).
+#
+# Runs never touch the repository's own state/; the only file written
+# under its logs/ is the packet report (logs/packets/<name>.json).
+# -------------------------------------------------
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+REPORT_DIR = REPO_ROOT / "logs" / "packets"
+
+ENGINE_PARTS = ("main.py", "phases", "engine", "derived")
+VOLATILE_KEYS = frozenset({"created_utc"})
+SCRUBBED_ENV = ("CI", "RISK_PROFILE", "RISK_METRICS")
+
+DEFAULT_SESSION: Dict[str, Any] = {
+    "phase": 1,
+    "mode": "SOLO",
+    "created_utc": "2026-01-01T00:00:00+00:00",
+}
+DEFAULT_PLAYERS: Dict[str, Any] = {
+    "mode": "SOLO",
+    "humans": ["P1"],
+    "ais": ["AI1", "AI2", "AI3", "AI4", "AI5", "AI6", "AI7"],
+    "seats_total": 8,
+}
+MAX_STEPS = 8
+
+
+# -------------------------
+# Isolated roots
+# -------------------------
+
+def make_root(
+    base: Path,
+    session: Optional[Dict[str, Any]] = None,
+    players: Optional[Dict[str, Any]] = None,
+) -> Path:
+    root = Path(base)
+    root.mkdir(parents=True, exist_ok=True)
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+    for part in ENGINE_PARTS:
+        src = REPO_ROOT / part
+        if src.is_dir():
+            shutil.copytree(src, root / part, ignore=ignore)
+        else:
+            shutil.copy2(src, root / part)
+    state = root / "state"
+    state.mkdir(parents=True, exist_ok=True)
+    (state / "session.json").write_text(json.dumps(session or DEFAULT_SESSION, indent=2), encoding="utf-8")
+    (state / "players.json").write_text(json.dumps(players or DEFAULT_PLAYERS, indent=2), encoding="utf-8")
+    return root
+
+
+def _env(run_mode: str) -> Dict[str, str]:
+    env = {k: v for k, v in os.environ.items() if k not in SCRUBBED_ENV}
+    env["RISK_RUN_MODE"] = run_mode
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return env
+
+
+def run_main(root: Path, run_mode: str = "normal") -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "main.py"],
+        cwd=root,
+        env=_env(run_mode),
+        capture_output=True,
+        text=True,
+    )
+
+
+def session_phase(root: Path) -> int:
+    session = json.loads((Path(root) / "state" / "session.json").read_text(encoding="utf-8"))
+    return int(session.get("phase", -1))
+
+
+def run_pipeline(root: Path) -> int:
+    """
+    Step main.py until the session phase stops advancing; returns steps run.
+    """
+    steps = 0
+    phase = session_phase(root)
+    while steps < MAX_STEPS:
+        proc = run_main(root)
+        if proc.returncode != 0:
+            raise RuntimeError(f"main.py failed at phase {phase}:\n{proc.stdout}{proc.stderr}")
+        steps += 1
+        nxt = session_phase(root)
+        if nxt == phase:
+            break
+        phase = nxt
+    return steps
+
+
+# -------------------------
+# Hashing / stats
+# -------------------------
+
+def _scrub(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {k: _scrub(v) for k, v in obj.items() if k not in VOLATILE_KEYS}
+    if isinstance(obj, list):
+        return [_scrub(v) for v in obj]
+    return obj
+
+
+def hash_outputs(root: Path) -> str:
+    h = hashlib.sha256()
+    for path in sorted((Path(root) / "state").glob("*.json")):
+        data = _scrub(json.loads(path.read_text(encoding="utf-8")))
+        h.update(path.name.encode("utf-8") + b"\0")
+        h.update(json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8") + b"\0")
+    return h.hexdigest()
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Nearest-rank percentile (q in 0..100).
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * q // 100))
+    return ordered[int(rank) - 1]
+
+
+# -------------------------
+# Packet execution
+# -------------------------
+
+Check = Callable[[Path], List[str]]
+
+
+def _one_run(check: Optional[Check]) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="risk_packet_") as tmp:
+        root = make_root(Path(tmp))
+        start = time.perf_counter()
+        steps = run_pipeline(root)
+        seconds = time.perf_counter() - start
+        problems = check(root) if check else []
+        return {"hash": hash_outputs(root), "seconds": seconds, "steps": steps, "problems": problems}
+
+
+def run_packet(name: str, *, runs: int, workers: int, check: Optional[Check] = None) -> Dict[str, Any]:
+    """
+    Run the pipeline `runs` times across `workers` threads (one subprocess
+    per step each) and summarize hashes, checks and timings.
+    """
+    if runs < 1:
+        raise ValueError("runs must be >= 1")
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(lambda _: _one_run(check), range(runs)))
+
+    hashes = sorted({r["hash"] for r in results})
+    problems = sorted({p for r in results for p in r["problems"]})
+    timings = [r["seconds"] for r in results]
+    return {
+        "packet": name,
+        "runs": runs,
+        "workers": workers,
+        "identical": len(hashes) == 1,
+        "hashes": hashes,
+        "problems": problems,
+        "steps": results[0]["steps"],
+        "p50_s": percentile(timings, 50),
+        "p95_s": percentile(timings, 95),
+        "max_s": max(timings),
+        "ok": len(hashes) == 1 and not problems,
+    }
+
+
+def packet_main(name: str, *, default_runs: int, check: Optional[Check] = None, argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=f"Run the {name} packet.")
+    parser.add_argument("--runs", type=int, default=default_runs)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--out", type=Path, default=REPORT_DIR / f"{name}.json")
+    args = parser.parse_args(argv)
+
+    report = run_packet(name, runs=args.runs, workers=min(args.workers, args.runs), check=check)
+    args.out.parent.mkdir(parents=True, exist_ok=True)
+    args.out.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    status = "OK" if report["ok"] else "FAIL"
+    print(
+        f"[{status}] packet={name} runs={report['runs']} identical={report['identical']} "
+        f"p50={report['p50_s'] * 1e3:.0f} ms p95={report['p95_s'] * 1e3:.0f} ms max={report['max_s'] * 1e3:.0f} ms"
+    )
+    for h in report["hashes"]:
+        print(f"  hash {h}")
+    for p in report["problems"]:
+        print(f"  problem: {p}")
+    return 0 if report["ok"] else 1
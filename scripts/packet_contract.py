@@ -0,0 +1,46 @@
+# Contract packet: artifact invariants and observer-only proof mode
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+from packet_common import DEFAULT_PLAYERS, make_root, packet_main, run_main
+
+
+def _load(root: Path, name: str):
+    return json.loads((root / "state" / name).read_text(encoding="utf-8"))
+
+
+def check(root: Path) -> List[str]:
+    problems: List[str] = []
+    seats = list(range(1, int(DEFAULT_PLAYERS["seats_total"]) + 1))
+
+    assignments = _load(root, "countries.json")["assignments"]
+    if [a["seat"] for a in assignments] != seats:
+        problems.append("countries: seats are not 1..N in order")
+    if len({a["country"] for a in assignments}) != len(assignments):
+        problems.append("countries: a country is assigned twice")
+
+    for row in _load(root, "resources.json")["resources_by_seat"]:
+        for kind, value in row["wallet"].items():
+            if type(value) is not int or value < 0:
+                problems.append(f"resources: seat {row['seat']} {kind} is not a non-negative integer")
+
+    if sorted(_load(root, "turn_order.json")["order"]) != seats:
+        problems.append("turn_order: order is not a permutation of seats")
+
+    # Proof mode is observer-only: a fresh root must come out unchanged
+    proof_root = make_root(root / "proof")
+    before = sorted(p.relative_to(proof_root) for p in proof_root.rglob("*"))
+    proc = run_main(proof_root, run_mode="proof")
+    after = sorted(p.relative_to(proof_root) for p in proof_root.rglob("*"))
+    if proc.returncode != 0 or before != after:
+        problems.append("proof mode changed the state root")
+
+    return problems
+
+
+if __name__ == "__main__":
+    sys.exit(packet_main("contract", default_runs=2, check=check))
@@ -0,0 +1,9 @@
+# Determinism packet: N parallel runs must produce byte-identical outputs
+from __future__ import annotations
+
+import sys
+
+from packet_common import packet_main
+
+if __name__ == "__main__":
+    sys.exit(packet_main("determinism", default_runs=8))
@@ -0,0 +1,22 @@
+# Smoke packet: the pipeline runs end to end and produces every artifact
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import List
+
+from packet_common import packet_main, session_phase
+
+EXPECTED = ("countries.json", "resources.json", "turn_order.json")
+FINAL_PHASE = 4
+
+
+def check(root: Path) -> List[str]:
+    problems = [f"missing state/{name}" for name in EXPECTED if not (root / "state" / name).exists()]
+    if session_phase(root) != FINAL_PHASE:
+        problems.append(f"session phase {session_phase(root)} != {FINAL_PHASE}")
+    return problems
+
+
+if __name__ == "__main__":
+    sys.exit(packet_main("smoke", default_runs=1, check=check))
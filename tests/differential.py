@@ -0,0 +1,211 @@
+"""
+Differential fuzz harness for extract_consequences.
+
+    python -m tests.differential --seeds 500
+
+Every registered engine must reproduce the reference extractor's output
+(tags, indices, signals, evidence) on seeded random event streams. The
+first diverging seed / engine / actor / field is reported. Drift of the
+stored goldens (tests/golden_generate.py) is reported too, but does not
+fail the run: the exit code tracks engine divergence only.
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from derived.consequence_extractor import extract_consequences
+from tests import golden_generate
+
+Engine = Callable[..., Dict[str, Any]]
+
+# name -> (engine, float tolerance); 0.0 means exact equality
+ENGINES: Dict[str, Tuple[Engine, float]] = {}
+
+REFERENCE = "reference"
+
+_FIELDS = ("turn", "actor", "ok", "cost", "delta", "magnitude")
+_VALUES = (-3.5, -2.0, -1.0, -0.5, 0.0, 0.5, 1.0, 2.0, 3.0, 4.0, 5.0)
+
+
+def register_engine(name: str, *, tolerance: float = 0.0) -> Callable[[Engine], Engine]:
+    """
+    Register an alternative engine with extract_consequences' signature.
+    """
+    def decorate(fn: Engine) -> Engine:
+        if name in ENGINES:
+            raise ValueError(f"engine already registered: {name}")
+        ENGINES[name] = (fn, tolerance)
+        return fn
+    return decorate
+
+
+register_engine(REFERENCE)(extract_consequences)
+
+@register_engine("lazy_evidence")
+def _lazy_evidence(events, *, current_turn, window=5):
+    return extract_consequences(events, current_turn=current_turn, window=window, lazy_evidence=True)
+
+
+# -------------------------
+# Stream generation
+# -------------------------
+
+@dataclass(frozen=True)
+class Case:
+    seed: int
+    events: List[Dict[str, Any]]
+    current_turn: int
+    window: int
+
+
+def random_case(seed: int) -> Case:
+    """
+    Seeded stream with missing / None fields, edge windows and ties.
+    """
+    rng = random.Random(seed)
+    current_turn = rng.randint(1, 12)
+    window = rng.choice([0, 1, 2, 3, 5, current_turn, current_turn + 3, 10])
+    actors = [f"X{i}" for i in range(rng.randint(1, 6))]
+
+    events: List[Dict[str, Any]] = []
+    for _ in range(rng.randint(0, 40)):
+        e: Dict[str, Any] = {
+            "turn": rng.randint(current_turn - window - 1, current_turn + 1),
+            "actor": rng.choice(actors + [" " + actors[0] + " ", ""]),
+            "ok": rng.choice([True, False, None, 1, 0]),
+            "cost": rng.choice(_VALUES[4:] + (None,)),
+            "delta": rng.choice(_VALUES + (None,)),
+            "magnitude": rng.choice(_VALUES + (None,)),
+        }
+        # turn is never None: the reference raises on int(None) by contract
+        for name in _FIELDS:
+            r = rng.random()
+            if r < 0.08 and name != "turn":
+                e[name] = None
+            elif r < 0.16:
+                del e[name]
+        events.append(e)
+
+    # Capacity ties: clone one actor's history under new names
+    if events and rng.random() < 0.5:
+        source = rng.choice(actors)
+        for k in range(rng.randint(1, 2)):
+            events.extend(dict(e, actor=f"TWIN{k}") for e in events if e.get("actor") == source)
+
+    rng.shuffle(events)
+    return Case(seed, events, current_turn, window)
+
+
+# -------------------------
+# Comparison
+# -------------------------
+
+@dataclass(frozen=True)
+class Divergence:
+    seed: int
+    engine: str
+    actor: str
+    field: str
+    expected: Any
+    observed: Any
+
+    def __str__(self) -> str:
+        return (
+            f"seed={self.seed} engine={self.engine} actor={self.actor!r} "
+            f"field={self.field}: expected {self.expected!r}, observed {self.observed!r}"
+        )
+
+
+def _flatten(obj: Any, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            yield from _flatten(v, f"{prefix}.{k}" if prefix else k)
+    elif isinstance(obj, (list, tuple)):
+        yield f"{prefix}.len", len(obj)
+        for i, v in enumerate(obj):
+            yield from _flatten(v, f"{prefix}[{i}]")
+    else:
+        yield prefix, obj
+
+
+def _same(a: Any, b: Any, tolerance: float) -> bool:
+    if tolerance and isinstance(a, float) and isinstance(b, float):
+        return math.isclose(a, b, rel_tol=tolerance, abs_tol=tolerance)
+    return type(a) is type(b) and a == b
+
+
+def _outcome(engine: Engine, case: Case) -> Any:
+    try:
+        results = engine(case.events, current_turn=case.current_turn, window=case.window)
+    except Exception as exc:  # a crash is an outcome; engines must crash alike
+        return f"raises {type(exc).__name__}"
+    return {actor: state.to_dict() for actor, state in results.items()}
+
+
+def first_divergence(name: str, case: Case, expected: Any) -> Optional[Divergence]:
+    engine, tolerance = ENGINES[name]
+    observed = _outcome(engine, case)
+    if isinstance(expected, str) or isinstance(observed, str):
+        if expected != observed:
+            return Divergence(case.seed, name, "*", "outcome", expected, observed)
+        return None
+
+    if list(expected) != list(observed):
+        return Divergence(case.seed, name, "*", "actors", list(expected), list(observed))
+    for actor, state in expected.items():
+        got = dict(_flatten(observed[actor]))
+        for field, value in _flatten(state):
+            if field not in got or not _same(value, got[field], tolerance):
+                return Divergence(case.seed, name, actor, field, value, got.get(field, "<missing>"))
+    return None
+
+
+def run(seeds: range, engines: Optional[List[str]] = None) -> List[Divergence]:
+    """
+    First divergence per engine over the given seeds (empty list: all agree).
+    """
+    names = [n for n in (engines or ENGINES) if n != REFERENCE]
+    found: Dict[str, Divergence] = {}
+    for seed in seeds:
+        case = random_case(seed)
+        expected = _outcome(extract_consequences, case)
+        for name in names:
+            if name in found:
+                continue
+            div = first_divergence(name, case, expected)
+            if div is not None:
+                found[name] = div
+        if len(found) == len(names):
+            break
+    return [found[n] for n in names if n in found]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seeds", type=int, default=500)
+    parser.add_argument("--start", type=int, default=0)
+    parser.add_argument("--engine", action="append", help="engine name (repeatable; default all)")
+    args = parser.parse_args(argv)
+
+    status = 0
+    drifted = golden_generate.check_goldens()
+    for window in drifted:
+        print(f"[GOLDEN DRIFT] window={window}: {golden_generate.golden_path_for(window)}")
+
+    seeds = range(args.start, args.start + args.seeds)
+    divergences = run(seeds, args.engine)
+    for div in divergences:
+        print(f"[DIVERGED] {div}")
+        status = 1
+
+    engines = [n for n in (args.engine or ENGINES) if n != REFERENCE]
+    print(f"{'[OK]' if not divergences else '[FAIL]'} {len(engines)} engine(s) x {len(seeds)} seeds")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
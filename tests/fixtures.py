@@ -17,3 +17,35 @@ def sample_events():
         {"turn": 9, "actor": "B", "ok": False, "delta": -2.5, "cost": 0.9},
         {"turn":10, "actor": "B", "ok": False, "delta": -3.5, "cost": 1.0},
     ]
+
+
+# Archetypes cycled across synthetic actors, extending the A / B patterns above
+_ARCHETYPES = ("strong", "declining")
+
+
+def synthetic_events(actors, turns, events_per_turn=1, seed=0):
+    """
+    Deterministic synthetic event stream at configurable scale.
+
+    Even-indexed actors follow actor A (mostly succeeding, positive delta),
+    odd-indexed actors follow actor B (mostly failing, worsening delta).
+    """
+    import random
+
+    rng = random.Random(seed)
+    events = []
+    for turn in range(1, turns + 1):
+        for i in range(actors):
+            actor = f"ACTOR_{i:06d}"
+            kind = _ARCHETYPES[i % len(_ARCHETYPES)]
+            for _ in range(events_per_turn):
+                if kind == "strong":
+                    ok = rng.random() < 0.8
+                    delta = round(rng.uniform(2.0, 5.0), 1) if ok else -1.0
+                    cost = round(rng.uniform(0.8, 1.5), 1)
+                else:
+                    ok = rng.random() < 0.2
+                    delta = 2.0 if ok else -round(rng.uniform(2.0, 3.5), 1)
+                    cost = round(rng.uniform(0.5, 1.0), 1)
+                events.append({"turn": turn, "actor": actor, "ok": ok, "delta": delta, "cost": cost})
+    return events
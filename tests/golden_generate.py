@@ -2,37 +2,63 @@ import argparse
 import json
 from pathlib import Path
 
-from main import load_json
-from phases.phase2 import run_phase_2
+from derived.consequence_extractor import extract_consequences
+from tests.fixtures import sample_events
 
 # Paths
-REPO_ROOT = Path(__file__).resolve().parents[2]
-GOLDEN_DIR = Path(__file__).parent
-SESSION_PATH = REPO_ROOT / "state" / "session.json"
+GOLDEN_DIR = Path(__file__).parent / "golden"
+GOLDEN_TURN = 10
+GOLDEN_WINDOWS = (3, 5, 10)
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--window", type=int, required=True)
-    args = parser.parse_args()
+def golden_path_for(window: int) -> Path:
+    # v0.1 golden name for window=5
+    if window == 5:
+        return GOLDEN_DIR / "consequences_turn_10.json"
+    return GOLDEN_DIR / f"consequences_turn_10_window_{window}.json"
+
+
+def golden_payload(window: int) -> dict:
+    results = extract_consequences(sample_events(), current_turn=GOLDEN_TURN, window=window)
+    return {actor: {"tags": state.tags} for actor, state in results.items()}
 
-    if not SESSION_PATH.exists():
-        raise FileNotFoundError(
-            f"Missing {SESSION_PATH}. Run main.py first and CONFIRM Phase 0."
-        )
 
-    session = load_json(SESSION_PATH)
+def check_goldens(windows=GOLDEN_WINDOWS) -> list:
+    """
+    Windows whose stored golden differs from (or is missing for) the reference.
+    """
+    drifted = []
+    for window in windows:
+        path = golden_path_for(window)
+        if not path.exists() or json.loads(path.read_text(encoding="utf-8")) != golden_payload(window):
+            drifted.append(window)
+    return drifted
 
-    consequences = run_phase_2(
-        session=session,
-        window=args.window,
-        record_consequences=True,
-    )
 
-    out_path = GOLDEN_DIR / f"consequences_turn_{args.window}.json"
-    out_path.write_text(json.dumps(consequences, indent=2), encoding="utf-8")
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate or check consequence goldens from tests.fixtures.")
+    parser.add_argument("--window", type=int, action="append", help="window size (repeatable; default 3, 5, 10)")
+    parser.add_argument("--check", action="store_true", help="compare only; exit non-zero on drift")
+    parser.add_argument("--force", action="store_true", help="overwrite existing goldens")
+    args = parser.parse_args()
+    windows = tuple(args.window or GOLDEN_WINDOWS)
+
+    if args.check:
+        drifted = check_goldens(windows)
+        for window in drifted:
+            print(f"[DRIFT] window={window}: {golden_path_for(window)}")
+        if drifted:
+            raise SystemExit(1)
+        print(f"[OK] goldens match for windows {list(windows)}")
+        return
 
-    print(f"[OK] wrote {out_path}")
+    for window in windows:
+        out_path = golden_path_for(window)
+        if out_path.exists() and not args.force:
+            print(f"[SKIP] {out_path} exists (use --force to overwrite)")
+            continue
+        out_path.write_text(json.dumps(golden_payload(window), indent=2) + "\n", encoding="utf-8")
+        print(f"[OK] wrote {out_path}")
 
 
 if __name__ == "__main__":
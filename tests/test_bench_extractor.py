@@ -0,0 +1,18 @@
+from benchmarks.bench_extractor import compare, run_grid
+from tests.fixtures import synthetic_events
+
+
+def test_synthetic_events_are_deterministic_and_sized():
+    a = synthetic_events(5, 4, 3, seed=7)
+    assert a == synthetic_events(5, 4, 3, seed=7)
+    assert len(a) == 5 * 4 * 3
+    assert {e["turn"] for e in a} == {1, 2, 3, 4}
+
+
+def test_compare_flags_regressions_over_tolerance():
+    results = run_grid({"actors": [2], "turns": [3], "events_per_turn": [1], "window": [2]}, repeat=1)
+    case = results[0]["case"]
+    fast = {"results": [{"case": case, "best_s": results[0]["best_s"] * 10}]}
+    slow = {"results": [{"case": case, "best_s": results[0]["best_s"] / 10}]}
+    assert compare(results, fast, 0.25) == []
+    assert [r["case"] for r in compare(results, slow, 0.25)] == [case]
@@ -0,0 +1,13 @@
+from benchmarks.bench_memory import BUDGETS, deep_sizeof, measure
+
+
+def test_deep_sizeof_counts_shared_objects_once():
+    shared = list(range(100))
+    assert deep_sizeof([shared, shared]) < 2 * deep_sizeof(shared)
+
+
+def test_small_state_map_is_within_budget():
+    r = measure(200)
+    assert r["actors"] == 200
+    assert r["evidence_per_actor"] > 0
+    assert r["over_budget"] == [], (r["per_actor"], BUDGETS)
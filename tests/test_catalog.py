@@ -0,0 +1,33 @@
+from engine.catalog import REGIONS, load_catalog
+
+
+def test_catalog_is_cached_dense_and_symmetric():
+    catalog = load_catalog()
+    assert load_catalog() is catalog
+    assert len(catalog) >= 200
+    assert set(catalog.regions) <= set(REGIONS)
+    assert catalog.region_of(catalog.id_of("Kenya")) == "AFRICA"
+
+    for a, b in catalog.edges():
+        assert a in catalog.neighbors(b) and b in catalog.neighbors(a)
+
+    islands = catalog.id_of("ICELAND")
+    assert catalog.degree(islands) == 0
+
+
+def test_distance_and_components_over_controlled_territory():
+    catalog = load_catalog()
+    ids = {n: catalog.id_of(n) for n in ("FRANCE", "GERMANY", "POLAND", "SPAIN", "PORTUGAL", "CHINA", "ICELAND")}
+
+    assert catalog.bfs_distance(ids["PORTUGAL"], ids["POLAND"]) == 4
+    assert catalog.distances_from(ids["PORTUGAL"])[ids["POLAND"]] == 4
+    assert catalog.bfs_distance(ids["FRANCE"], ids["ICELAND"]) == -1
+
+    controlled = [ids["PORTUGAL"], ids["SPAIN"], ids["FRANCE"], ids["POLAND"]]
+    assert catalog.bfs_distance(ids["PORTUGAL"], ids["POLAND"], allowed=controlled) == -1
+    assert catalog.components(controlled) == [
+        sorted([ids["FRANCE"], ids["PORTUGAL"], ids["SPAIN"]]),
+        [ids["POLAND"]],
+    ]
+    assert not catalog.is_contiguous(controlled)
+    assert catalog.is_contiguous(controlled + [ids["GERMANY"]])
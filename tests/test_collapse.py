@@ -0,0 +1,40 @@
+from engine.canon import PILLAR_INDEX
+from engine.collapse import CollapseRule, CollapseWatcher
+from engine.pillars import PillarStore
+
+
+def test_only_changed_seats_are_reevaluated_and_collapse_is_terminal():
+    store = PillarStore(4, initial=5)
+    watcher = CollapseWatcher(store, CollapseRule(min_failed=2, near_margin=1))
+    assert watcher.evaluations == 4
+
+    legit, force, elites = (PILLAR_INDEX[p] for p in ("legitimacy", "force", "elites"))
+
+    changed = store.apply_effects([(3, legit, -4), (3, force, -4)])
+    assert watcher.observe(1, changed) == []
+    assert watcher.evaluations == 5
+    assert watcher.near_collapse() == [3]
+
+    changed = store.apply_effects([(3, legit, -1), (3, force, -1), (2, elites, -5), (2, force, -5)])
+    events = watcher.observe(2, changed)
+
+    assert [(e.turn, e.seat, e.failed) for e in events] == [(2, 2, 2), (2, 3, 2)]
+    assert [ev.pillar for ev in events[1].evidence] == ["legitimacy", "force"]
+    assert watcher.near_collapse() == []
+
+    # Collapsed seats stay collapsed and are not re-evaluated
+    changed = store.apply_effects([(3, legit, 5)])
+    assert watcher.observe(3, changed) == []
+    assert watcher.is_collapsed(3)
+    assert watcher.evaluations == 7
+
+
+def test_seats_collapsed_at_start_are_reported_at_turn_zero():
+    store = PillarStore(3, initial=5)
+    legit, force = PILLAR_INDEX["legitimacy"], PILLAR_INDEX["force"]
+    store.apply_effects([(2, legit, -5), (2, force, -5)])
+
+    watcher = CollapseWatcher(store, CollapseRule(min_failed=2))
+    assert [(e.turn, e.seat, e.failed) for e in watcher.initial_events] == [(0, 2, 2)]
+    assert watcher.is_collapsed(2)
+    assert watcher.observe(1, store.apply_effects([(2, legit, -1)])) == []
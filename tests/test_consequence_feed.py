@@ -0,0 +1,46 @@
+import pytest
+
+from derived.consequence_extractor import extract_consequences
+from derived.consequence_feed import (
+    INDEX_MOVED,
+    TAG_ADDED,
+    ConsequenceFeed,
+    apply_message,
+    view_of,
+)
+from tests.fixtures import synthetic_events
+
+
+def _run(turns=12, actors=30):
+    events = synthetic_events(actors, turns, 1, seed=5)
+    return [(t, extract_consequences(events, current_turn=t, window=4)) for t in range(1, turns + 1)]
+
+
+def test_follower_tracks_results_within_epsilon():
+    eps = 0.01
+    feed = ConsequenceFeed(epsilon=eps, snapshot_every=5)
+    views = {}
+    feed.subscribe(lambda m: apply_message(views, m))
+
+    messages = []
+    for turn, results in _run():
+        messages.append(feed.publish(turn, results))
+        assert set(views) == set(results)
+        for actor, state in results.items():
+            expected = view_of(state)
+            assert views[actor]["tags"] == expected["tags"]
+            for f, v in expected["indices"].items():
+                assert abs(views[actor]["indices"][f] - v) <= eps
+
+    assert [m.turn for m in messages if m.snapshot] == [1, 6, 11]
+    kinds = {c.kind for m in messages for c in m.changes}
+    assert {TAG_ADDED, INDEX_MOVED} <= kinds
+
+
+def test_unchanged_turn_emits_no_changes_and_turns_must_increase():
+    feed = ConsequenceFeed(snapshot_every=10)
+    [(_, results)] = _run(turns=1, actors=5)
+    feed.publish(1, results)
+    assert feed.publish(2, results).changes == []
+    with pytest.raises(ValueError):
+        feed.publish(2, results)
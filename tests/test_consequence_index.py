@@ -0,0 +1,48 @@
+import pytest
+
+from derived.consequence_extractor import extract_consequences
+from derived.consequence_index import ConsequenceIndex
+from tests.fixtures import synthetic_events
+
+
+def _turns(n_turns=8, actors=60):
+    events = synthetic_events(actors, n_turns, 2, seed=3)
+    return {t: extract_consequences(events, current_turn=t, window=3) for t in range(1, n_turns + 1)}
+
+
+def test_queries_match_full_scan():
+    by_turn = _turns()
+    index = ConsequenceIndex()
+    for turn, results in by_turn.items():
+        index.add_turn(turn, results)
+
+    latest = by_turn[8]
+    assert index.with_tags("DECLINING", "UNSTABLE") == {
+        a for a, s in latest.items() if {"DECLINING", "UNSTABLE"} <= set(s.tags)
+    }
+    assert index.in_range("risk_index", 0.6, lo_inclusive=False) == sorted(
+        (a for a, s in latest.items() if s.indices.risk_index > 0.6),
+        key=lambda a: (latest[a].indices.risk_index, a),
+    )
+    assert index.in_range_over("risk_index", 0.6, last=5, lo_inclusive=False) == {
+        a for t in range(4, 9) for a, s in by_turn[t].items() if s.indices.risk_index > 0.6
+    }
+    assert index.with_tags_over("STRONG", last=3, every=True) == {
+        a for a in latest if all("STRONG" in by_turn[t][a].tags for t in (6, 7, 8))
+    }
+
+
+def test_retention_and_turn_order():
+    by_turn = _turns(n_turns=4, actors=4)
+    index = ConsequenceIndex(retain=2)
+    for turn, results in by_turn.items():
+        index.add_turn(turn, results)
+    assert index.turns() == [3, 4]
+    with pytest.raises(ValueError):
+        index.with_tags("STRONG", turn=1)
+    with pytest.raises(ValueError):
+        index.add_turn(4, by_turn[4])
+    with pytest.raises(ValueError):
+        index.with_tags_over("DECLINING", last=0)
+    with pytest.raises(ValueError):
+        index.in_range_over("risk_index", 0.0, 1.0, last=-1)
@@ -0,0 +1,26 @@
+from dataclasses import replace
+
+from derived.consequence_extractor import extract_consequences
+from tests.differential import ENGINES, main, random_case, register_engine, run
+
+
+def test_registered_engines_match_reference():
+    assert run(range(300)) == []
+    # Golden drift is reported, not fatal: the exit code gates engines only
+    assert main(["--seeds", "20"]) == 0
+
+
+def test_divergence_reports_first_actor_and_field():
+    @register_engine("drops_last_tag")
+    def _broken(events, *, current_turn, window=5):
+        out = extract_consequences(events, current_turn=current_turn, window=window)
+        return {a: replace(s, tags=s.tags[:-1]) if s.tags else s for a, s in out.items()}
+
+    try:
+        [div] = run(range(300), ["drops_last_tag"])
+    finally:
+        del ENGINES["drops_last_tag"]
+
+    assert div.field.startswith("tags")
+    case = random_case(div.seed)
+    assert div.actor in extract_consequences(case.events, current_turn=case.current_turn, window=case.window)
@@ -0,0 +1,72 @@
+import json
+import socket
+import subprocess
+import sys
+from pathlib import Path
+
+from engine.distributed import Coordinator
+from engine.sweep import grid, load_results, point_id, run_point
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _points():
+    return grid({"scenario": ["stable", "stressed", "collapse"], "seed": [1, 2, 3], "horizon": [40]})
+
+
+def test_workers_over_localhost_with_lease_redispatch(tmp_path):
+    points = _points()
+    with Coordinator(points, out_path=tmp_path / "sweep.jsonl", lease_s=0.5) as coord:
+        host, port = coord.address
+
+        # A worker that leases a unit, sends garbage and dies without reporting
+        with socket.create_connection((host, port)) as dead:
+            fh = dead.makefile("rwb")
+            fh.write(b'{"op": "lease", "worker": "dead"}\n')
+            fh.flush()
+            unit_id = json.loads(fh.readline())["unit_id"]
+            fh.write(json.dumps({"op": "result", "unit_id": unit_id, "summary": [1]}).encode() + b"\n")
+            fh.flush()
+            assert json.loads(fh.readline()) == {"op": "ack", "accepted": False}
+            fh.write(b'{"op": "lease", "worker": "dead"}\n')
+            fh.flush()
+            assert json.loads(fh.readline())["op"] == "unit"
+
+        workers = [
+            subprocess.Popen(
+                [sys.executable, "-m", "engine.distributed", "worker", "--host", host, "--port", str(port), "--id", f"w{i}"],
+                cwd=REPO_ROOT, stdout=subprocess.DEVNULL,
+            )
+            for i in range(3)
+        ]
+        try:
+            assert coord.wait(timeout=60)
+        finally:
+            for w in workers:
+                w.wait(timeout=30)
+
+    assert coord.redispatched >= 1
+    expected = [run_point(p) for p in points]
+    assert coord.ordered_results() == expected
+    assert sorted(r["point_id"] for r in load_results(tmp_path / "sweep.jsonl")) == sorted(point_id(p) for p in points)
+
+
+def test_duplicate_results_are_dropped_and_resume_skips_done_units(tmp_path):
+    points = _points()[:2]
+    out = tmp_path / "sweep.jsonl"
+    coord = Coordinator(points, out_path=out)
+    try:
+        first = coord.lease("a")
+        summary = run_point(first["params"])
+        assert coord.complete(first["unit_id"], summary) is True
+        assert coord.complete(first["unit_id"], summary) is False
+        assert coord.duplicates == 1
+    finally:
+        coord.close()
+
+    resumed = Coordinator(points, out_path=out)
+    try:
+        assert resumed.resumed == 1
+        assert resumed.lease("b")["unit_id"] == point_id(points[1])
+    finally:
+        resumed.close()
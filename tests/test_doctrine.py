@@ -0,0 +1,75 @@
+import time
+
+from engine.doctrine import DoctrineEvaluator
+from engine.legality import OK, LegalityTables
+from engine.wallets import WalletTable
+
+
+def _session(seats: int):
+    players = {"humans": ["P1"], "ais": [f"AI{i}" for i in range(1, seats)], "seats_total": seats}
+    resources = {
+        "resources_by_seat": [
+            {"seat": s, "wallet": {"budget": 10 + s % 7, "units": s % 3, "influence": 0}}
+            for s in range(1, seats + 1)
+        ]
+    }
+    return players, WalletTable.from_resources(resources)
+
+
+def test_choices_are_legal_and_reproducible_across_worker_counts():
+    players, wallets = _session(40)
+    with DoctrineEvaluator.from_players(players, seed=7, workers=1, budget_s=10.0) as one:
+        serial = one.evaluate_turn(3, wallets)
+    with DoctrineEvaluator.from_players(players, seed=7, workers=8, budget_s=10.0) as many:
+        parallel = many.evaluate_turn(3, wallets)
+        assert many.evaluate_turn(3, wallets).actions == parallel.actions
+
+    assert parallel.actions == serial.actions
+    assert [c.seat for c in parallel.choices] == list(range(2, 41))
+    assert parallel.fallbacks == []
+    assert parallel.cache_hits > 0
+
+    batch = LegalityTables.from_players(players).validate_batch(parallel.actions)
+    assert batch.codes.tolist() == [OK] * len(parallel.actions)
+    for a in parallel.actions:
+        if a["verb"] != "HOLD":
+            assert 0 < a["amount"] <= wallets.wallet(a["seat"])[a["resource"]]
+
+
+def test_over_budget_seats_fall_back_to_hold():
+    players, wallets = _session(12)
+
+    def slow(action, own, target):
+        time.sleep(0.01)
+        return 1.0
+
+    with DoctrineEvaluator.from_players(players, seed=7, doctrine=slow, workers=2, budget_s=0.05) as ev:
+        start = time.monotonic()
+        result = ev.evaluate_turn(1, wallets)
+        assert time.monotonic() - start < 1.0
+
+    assert result.fallbacks
+    for c in result.choices:
+        if c.fallback:
+            assert c.action == {"seat": c.seat, "verb": "HOLD"}
+            assert c.score is None
+
+
+def test_seats_scored_before_the_deadline_are_kept():
+    players = {"humans": ["P1"], "ais": [f"AI{i}" for i in range(1, 12)], "seats_total": 12}
+    wallets = WalletTable.from_resources({
+        "resources_by_seat": [{"seat": s, "wallet": {"budget": s}} for s in range(1, 13)]
+    })
+
+    def stalls_on_budget_6(action, own, target):
+        # Scores depend on wallets only; seat 6 is the one holding 6 budget
+        if own[0] == 6:
+            time.sleep(0.5)
+        return 0.0
+
+    # One worker: chunk [2, 6, 10] runs first and is still busy at the deadline
+    with DoctrineEvaluator.from_players(players, seed=1, doctrine=stalls_on_budget_6, workers=1, budget_s=0.2) as ev:
+        result = ev.evaluate_turn(1, wallets)
+
+    assert [c.seat for c in result.choices if not c.fallback] == [2]
+    assert len(result.fallbacks) == 10
@@ -0,0 +1,40 @@
+import pytest
+
+from derived.consequence_extractor import extract_consequences
+from engine.event_archive import ArchiveWriter, EventArchive, write_archive
+from tests.fixtures import sample_events, synthetic_events
+
+
+def test_window_extraction_matches_in_memory_events(tmp_path):
+    events = synthetic_events(25, 40, 2, seed=11) + [{"turn": 40, "actor": "  Z ", "delta": None, "magnitude": None}]
+    write_archive(tmp_path / "arc", events, partition_turns=8)
+
+    with EventArchive(tmp_path / "arc") as archive:
+        for turn, window in ((40, 5), (17, 10), (9, 3)):
+            from_archive = extract_consequences(archive.window_events(turn, window), current_turn=turn, window=window)
+            assert from_archive == extract_consequences(events, current_turn=turn, window=window)
+        assert [p.name for p in archive.partitions(38, 40)] == ["part_00000033_00000040"]
+        assert len(archive._open) == 4
+
+
+def test_sealed_partitions_are_final_and_sizes_checked(tmp_path):
+    with ArchiveWriter(tmp_path / "arc", partition_turns=5) as writer:
+        writer.add(sample_events())
+        with pytest.raises(ValueError):
+            writer.add([{"turn": 3, "actor": "A"}])
+
+    (tmp_path / "arc" / "part_00000006_00000010" / "cost.bin").write_bytes(b"\0" * 3)
+    with EventArchive(tmp_path / "arc") as archive:
+        with pytest.raises(ValueError):
+            archive.partitions(6, 10)
+
+
+def test_turns_at_or_below_zero_are_archived(tmp_path):
+    events = [{"turn": -3, "actor": "A", "delta": 1.0}, {"turn": 0, "actor": "A", "ok": True}, {"turn": 2, "actor": "B"}]
+    write_archive(tmp_path / "arc", events, partition_turns=5)
+
+    with EventArchive(tmp_path / "arc") as archive:
+        assert [p.from_turn for p in archive.partitions(-10, 10)] == [-4, 1]
+        window = archive.window_events(0, 4)
+        assert [e["turn"] for e in window] == [-3, 0]
+        assert extract_consequences(window, current_turn=0, window=4) == extract_consequences(events, current_turn=0, window=4)
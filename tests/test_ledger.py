@@ -0,0 +1,49 @@
+import pytest
+
+from engine.ledger import balance_at, compact_resources, history, verify_seat
+from engine.turn_executor import TurnExecutor
+from engine.wallets import WalletTable
+
+
+def _resources():
+    return {
+        "ruleset": {"starting_budget": 10, "starting_units": 0, "starting_influence": 0},
+        "resources_by_seat": [
+            {"seat": s, "country": f"C{s}", "wallet": {"budget": 10, "units": 0, "influence": 0}, "ledger": []}
+            for s in (1, 2)
+        ],
+    }
+
+
+def test_compaction_keeps_invariant_and_history(tmp_path):
+    resources = _resources()
+    ex = TurnExecutor({"seats_total": 2, "order": [1, 2]}, WalletTable.from_resources(resources))
+    for turn in range(1, 7):
+        ex.execute_turn(turn, [{"seat": 1, "verb": "TRANSFER", "resource": "budget", "amount": 1, "target": 2}])
+    ex.wallets.write_back(resources)
+
+    assert compact_resources(resources, tmp_path, cutoff_turn=4) == 8
+    seat1, seat2 = resources["resources_by_seat"]
+
+    assert [r["turn"] for r in seat1["ledger"]] == [5, 6]
+    assert seat1["ledger_checkpoint"]["balance"]["budget"] == 6
+    verify_seat(resources, seat1)
+    verify_seat(resources, seat2)
+
+    assert len(history(seat2, tmp_path)) == 6
+    assert [r["turn"] for r in history(seat2, tmp_path, from_turn=3, to_turn=5)] == [3, 4, 5]
+    assert balance_at(resources, seat2, tmp_path, 3)["budget"] == 13
+
+    # Second compaction appends a segment; history still complete
+    compact_resources(resources, tmp_path, cutoff_turn=6)
+    assert seat1["ledger"] == [] and len(seat1["ledger_checkpoint"]["segments"]) == 2
+    assert balance_at(resources, seat1, tmp_path, 6)["budget"] == 4
+
+
+def test_compaction_refuses_inconsistent_ledger(tmp_path):
+    resources = _resources()
+    resources["resources_by_seat"][0]["ledger"] = [{"turn": 1, "resource": "budget", "delta": -3}]
+
+    with pytest.raises(ValueError):
+        compact_resources(resources, tmp_path, cutoff_turn=1)
+    assert resources["resources_by_seat"][0]["ledger"] != []
@@ -0,0 +1,46 @@
+from engine.legality import (
+    OK,
+    REJECT_BAD_AMOUNT,
+    REJECT_BAD_TARGET,
+    REJECT_UNKNOWN_RESOURCE,
+    REJECT_UNKNOWN_SEAT,
+    REJECT_UNKNOWN_VERB,
+    REJECT_VERB_NOT_ALLOWED,
+    LegalityTables,
+    seat_classes_from_players,
+)
+
+
+def test_batch_validation_returns_per_action_codes():
+    tables = LegalityTables.from_players({"humans": ["P1"], "ais": ["AI1", "AI2"], "seats_total": 3})
+    actions = [
+        {"seat": 1, "verb": "HOLD"},
+        {"seat": 2, "verb": "SPEND", "resource": "units", "amount": 3},
+        {"seat": 3, "verb": "TRANSFER", "resource": "budget", "amount": 1, "target": 1},
+        {"seat": 4, "verb": "HOLD"},
+        {"seat": 1, "verb": "ANNEX"},
+        {"seat": 1, "verb": "SPEND", "resource": "gold", "amount": 1},
+        {"seat": 1, "verb": "HOLD", "resource": "budget"},
+        {"seat": 1, "verb": "SPEND", "resource": "budget", "amount": -1},
+        {"seat": 1, "verb": "SPEND", "resource": "budget", "amount": 1.5},
+        {"seat": 1, "verb": "TRANSFER", "resource": "budget", "amount": 1, "target": 1},
+        {"seat": True, "verb": "HOLD"},
+    ]
+
+    batch = tables.validate_batch(actions)
+
+    assert batch.codes.tolist() == [
+        OK,
+        OK,
+        OK,
+        REJECT_UNKNOWN_SEAT,
+        REJECT_UNKNOWN_VERB,
+        REJECT_UNKNOWN_RESOURCE,
+        REJECT_VERB_NOT_ALLOWED,
+        REJECT_BAD_AMOUNT,
+        REJECT_BAD_AMOUNT,
+        REJECT_BAD_TARGET,
+        REJECT_UNKNOWN_SEAT,
+    ]
+    assert batch.accepted() == [0, 1, 2]
+    assert seat_classes_from_players({"humans": ["P1"], "ais": ["AI1"]}) == ["HUMAN", "AI"]
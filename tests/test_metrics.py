@@ -0,0 +1,35 @@
+import json
+
+from derived.consequence_extractor import extract_consequences
+from engine import metrics
+from tests.fixtures import sample_events
+
+
+def test_disabled_metrics_record_nothing():
+    metrics.disable()
+    with metrics.span("x"):
+        metrics.count("n", 3)
+    assert metrics.summary() == {}
+    assert metrics.flush("unused") is None
+
+
+def test_enabled_metrics_capture_extractor_spans_and_counters(tmp_path):
+    metrics.enable(run_id="test")
+    try:
+        events = sample_events()
+        results = extract_consequences(events, current_turn=10, window=5)
+        path = metrics.flush(tmp_path)
+        data = metrics.summary()
+    finally:
+        metrics.disable()
+
+    span = data["spans"]["extract_consequences"]
+    assert span["calls"] == 1 and span["wall_s"] > 0
+    counters = data["counters"]
+    assert counters["events_scanned"] == len(events)
+    assert counters["events_in_window"] == len(events)
+    assert counters["actors_evaluated"] == len(results) > 0
+    assert counters["evidence_items"] == sum(len(cs.evidence) for cs in results.values()) > 0
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [r["type"] for r in lines] == ["span", "counters", "summary"]
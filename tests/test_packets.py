@@ -0,0 +1,20 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+
+from packet_common import percentile, run_packet  # noqa: E402
+
+
+def test_percentile_is_nearest_rank():
+    values = [5.0, 1.0, 3.0, 2.0, 4.0]
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == 5.0
+    assert percentile([], 50) == 0.0
+
+
+def test_parallel_runs_produce_identical_hashes():
+    report = run_packet("determinism", runs=2, workers=2)
+    assert report["ok"] and report["identical"]
+    assert report["steps"] >= 3
+    assert report["max_s"] >= report["p50_s"] > 0
@@ -0,0 +1,35 @@
+from engine.canon import PILLAR_INDEX
+from engine.pillars import N_PILLARS, PillarStore
+
+
+def test_bulk_effects_net_clamp_and_report_changed_cells():
+    store = PillarStore(3, initial=5)
+    legit = PILLAR_INDEX["legitimacy"]
+    force = PILLAR_INDEX["force"]
+
+    changed = store.apply_effects([
+        (1, legit, -2),
+        (1, legit, -1),
+        (2, force, -9),
+        (3, force, 2),
+        (3, force, -2),
+    ])
+
+    assert changed == [legit, N_PILLARS + force]
+    assert store.get(1, legit) == 2
+    assert store.get(2, force) == 0
+    assert store.get(3, force) == 5
+    assert store.totals()[force] == 10
+    assert store.minimums()[legit] == 2
+    assert store.count_at_or_below(force, 0) == 1
+
+
+def test_snapshot_restores_exact_state():
+    store = PillarStore(2, initial=[1, 2, 3, 4, 5, 6, 7])
+    snap = store.snapshot()
+    store.apply_effects([(2, 6, -7)])
+
+    assert store.row(2)["elites"] == 0
+    store.restore(snap)
+    assert store.row(2)["elites"] == 7
+    assert PillarStore.from_snapshot(2, snap).values == store.values
@@ -0,0 +1,49 @@
+from risk_gp.risk_gp import preflight
+
+
+def _point_at(monkeypatch, root):
+    monkeypatch.setattr(preflight, "REPO_ROOT", root)
+    monkeypatch.setattr(preflight, "DOCS_DIR", root / "docs")
+    monkeypatch.setattr(preflight, "CACHE_PATH", root / "logs" / "state" / "preflight_cache.json")
+
+
+def test_discovery_is_recursive_incremental_and_deterministic(tmp_path, monkeypatch):
+    _point_at(monkeypatch, tmp_path)
+    (tmp_path / "docs" / "docs").mkdir(parents=True)
+    (tmp_path / "docs" / "A.md").write_text("STATUS: ACTIVE\n", encoding="utf-8")
+    (tmp_path / "docs" / "docs" / "B.md").write_text("body\n", encoding="utf-8")
+
+    docs, rehashed = preflight._discover_docs()
+    assert [d["path"] for d in docs] == ["docs/A.md", "docs/docs/B.md"]
+    assert [d["status"] for d in docs] == ["ACTIVE", "UNKNOWN"]
+    assert rehashed == 2
+    fp = preflight._fingerprint(docs)
+
+    again, rehashed = preflight._discover_docs()
+    assert rehashed == 0
+    assert preflight._fingerprint(again) == fp
+
+    (tmp_path / "docs" / "docs" / "B.md").write_text("changed body\n", encoding="utf-8")
+    changed, rehashed = preflight._discover_docs()
+    assert rehashed == 1
+    assert preflight._fingerprint(changed) != fp
+
+    # A cold cache yields the same fingerprint as a warm one
+    preflight.CACHE_PATH.unlink()
+    cold, _ = preflight._discover_docs()
+    assert preflight._fingerprint(cold) == preflight._fingerprint(changed)
+
+
+def test_fingerprint_ignores_line_endings(tmp_path, monkeypatch):
+    _point_at(monkeypatch, tmp_path)
+    (tmp_path / "docs").mkdir()
+    doc = tmp_path / "docs" / "A.md"
+
+    doc.write_bytes(b"STATUS: ACTIVE\nbody\n")
+    lf, _ = preflight._discover_docs()
+
+    doc.write_bytes(b"STATUS: ACTIVE\r\nbody\r\n")
+    crlf, rehashed = preflight._discover_docs()
+    assert rehashed == 1
+    assert crlf == lf
+    assert preflight._fingerprint(crlf) == preflight._fingerprint(lf)
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from engine.profiling import profile_call
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_profile_call_writes_deterministic_artifacts(tmp_path):
+    written = profile_call("phaseX", lambda: sorted(range(1000), reverse=True), mode="mem", out_dir=tmp_path)
+    assert [p.name for p in written] == ["phaseX.pstats", "phaseX.top.txt", "phaseX.alloc.txt"]
+    assert all(p.stat().st_size > 0 for p in written)
+
+    with pytest.raises(ValueError):
+        profile_call("phaseX", lambda: None, mode="wall", out_dir=tmp_path)
+
+
+def test_profiling_cannot_be_enabled_in_ci(tmp_path):
+    sys.path.insert(0, str(REPO_ROOT / "scripts"))
+    from packet_common import make_root, session_phase
+
+    def run(root, **extra):
+        env = {k: v for k, v in os.environ.items() if k != "CI"}
+        env.update(RISK_RUN_MODE="normal", RISK_PROFILE="cpu", PYTHONDONTWRITEBYTECODE="1", **extra)
+        return subprocess.run([sys.executable, "main.py"], cwd=root, env=env, capture_output=True, text=True)
+
+    # Outside CI the same run profiles the phase it routes to
+    local = make_root(tmp_path / "local")
+    run(local)
+    assert session_phase(local) == 2
+    assert (local / "logs" / "profile" / "phase2.pstats").exists()
+
+    ci = make_root(tmp_path / "ci")
+    out = run(ci, CI="1")
+    assert "RISK_PROFILE ignored in CI." in out.stdout
+    assert session_phase(ci) == 2
+    assert not (ci / "logs" / "profile").exists()
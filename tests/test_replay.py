@@ -0,0 +1,28 @@
+import pytest
+
+from engine.pillars import PillarStore
+from engine.replay import ReplayIntegrityError, ReplayReader, ReplayWriter
+from engine.rng import RngService
+
+
+def test_seek_reconstructs_every_turn_and_detects_tampering(tmp_path):
+    store = PillarStore(5, initial=50)
+    rng = RngService(11).for_turn(0)
+    snapshots = [store.snapshot()]
+
+    with ReplayWriter(tmp_path, store.values, every=4) as writer:
+        for turn in range(1, 23):
+            effects = [(rng.randint(1, 5), rng.below(7), -rng.randint(0, 3)) for _ in range(3)]
+            changed = store.apply_effects(effects)
+            writer.record(turn, store.values, changed)
+            snapshots.append(store.snapshot())
+
+    reader = ReplayReader(tmp_path)
+    assert reader.last_turn == 22
+    assert len(reader.fingerprints()) == 23
+    for turn in (0, 3, 4, 7, 21, 22):
+        assert reader.seek(turn).tobytes() == snapshots[turn]
+
+    (tmp_path / "checkpoint_00000020.bin").write_bytes(snapshots[0])
+    with pytest.raises(ReplayIntegrityError):
+        reader.seek(21)
@@ -0,0 +1,55 @@
+from engine.rng import RngService, derive_seed, seed_from_text
+
+
+def test_streams_are_order_independent_and_reproducible():
+    rng = RngService(1234)
+
+    # Serial: seat 1 then seat 2
+    serial = {}
+    for seat in (1, 2):
+        stream = rng.for_seat(phase=7, seat=seat, turn=3)
+        serial[seat] = [stream.next_u64() for _ in range(4)]
+
+    # "Parallel": seat 2 first, fresh service instance
+    other = RngService(1234)
+    s2 = other.for_seat(phase=7, seat=2, turn=3)
+    s1 = other.for_seat(phase=7, seat=1, turn=3)
+    parallel = {2: [s2.next_u64() for _ in range(4)], 1: [s1.next_u64() for _ in range(4)]}
+
+    assert serial == parallel
+    assert serial[1] != serial[2]
+    assert rng.for_seat(phase=7, seat=1, turn=3).at(2) == serial[1][2]
+
+
+def test_shuffle_and_seeds_are_stable():
+    order = list(range(10))
+    RngService(7).for_phase(6).shuffle(order)
+    assert sorted(order) == list(range(10))
+
+    again = list(range(10))
+    RngService(7).for_phase(6).shuffle(again)
+    assert order == again
+
+    assert 0 <= seed_from_text("x") < 2**31
+    assert derive_seed(7, "phase", 2) != derive_seed(7, "phase", 6)
+
+
+def test_construction_is_pinned_across_processes():
+    # Known values: any change to the construction, or any dependence on
+    # per-process state (salted hash(), PYTHONHASHSEED), fails here
+    seed = seed_from_text("2026-01-20T04:02:58+00:00")
+    assert seed == 1647400172
+
+    stream = RngService(seed).for_phase(6)
+    assert [stream.next_u64() for _ in range(3)] == [
+        5847995039730829221,
+        16110551445097105205,
+        10715420545046198671,
+    ]
+    stream = RngService(seed).for_phase(6)
+    assert [stream.below(100) for _ in range(5)] == [21, 5, 71, 8, 91]
+
+    order = list(range(10))
+    RngService(7).for_phase(6).shuffle(order)
+    assert order == [2, 9, 8, 6, 1, 0, 5, 4, 3, 7]
+    assert derive_seed(7, "phase", 2) == 3417730822492214783
@@ -0,0 +1,45 @@
+from engine.scenario import ScenarioParams, run_scenario
+from engine.sweep import grid, load_results, point_id, run_sweep
+
+
+def test_scenarios_stop_at_collapse():
+    stable = run_scenario(ScenarioParams(scenario="stable", horizon=20))
+    assert stable["collapse_turn"] is None and stable["turns_run"] == 20
+
+    collapse = run_scenario(ScenarioParams(scenario="collapse", horizon=50, stress_rate=2, pillar_start=10))
+    assert collapse["collapse_turn"] == 5 and collapse["turns_run"] == 5
+
+    # Seats collapsed at the start are reported as turn 0
+    born = run_scenario(ScenarioParams(scenario="stable", pillar_start=0, horizon=5))
+    assert born["collapse_turn"] == 0 and born["turns_run"] == 0 and born["collapsed_seats"] == 8
+
+    stressed = ScenarioParams(scenario="stressed", seed=3, horizon=200, starting_budget=0)
+    assert run_scenario(stressed) == run_scenario(stressed)
+
+
+def test_sweep_resumes_without_redoing_points(tmp_path):
+    points = grid({"scenario": ["stable", "collapse"], "seed": [1, 2], "horizon": [30]})
+    out = tmp_path / "sweep.jsonl"
+
+    assert run_sweep(points[:3], out) == 3
+
+    # Simulate an interrupted write: torn trailing line
+    with out.open("a", encoding="utf-8") as fh:
+        fh.write('{"point_id": "torn')
+
+    assert run_sweep(points, out) == 1
+    assert run_sweep(points, out) == 0
+
+    results = load_results(out)
+    assert sorted(r["point_id"] for r in results) == sorted(point_id(p) for p in points)
+
+
+def test_parallel_sweep_matches_serial(tmp_path):
+    points = grid({"scenario": ["stressed"], "seed": [1, 2, 3], "starting_budget": [0, 5]})
+    run_sweep(points, tmp_path / "serial.jsonl", workers=0)
+    run_sweep(points, tmp_path / "parallel.jsonl", workers=2)
+
+    def by_id(name):
+        return {r["point_id"]: r for r in load_results(tmp_path / name)}
+
+    assert by_id("serial.jsonl") == by_id("parallel.jsonl")
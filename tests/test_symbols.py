@@ -0,0 +1,36 @@
+import subprocess
+import sys
+from pathlib import Path
+
+from engine.catalog import load_catalog
+from engine.symbols import SessionSymbols, SymbolTable
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_symbol_table_is_dense_and_stable():
+    table = SymbolTable(["A", "B"])
+    assert table.intern("B") == 1
+    assert table.intern("C") == 2
+    assert [table.name_of(i) for i in range(len(table))] == ["A", "B", "C"]
+    assert "C" in table and table.get("D") is None
+
+
+def test_session_symbols_use_catalog_ids_and_seat_order():
+    turn_order = {
+        "seats_total": 2,
+        "seat_to_country": {"1": "CONGO (DEMOCRATIC REPUBLIC OF THE)", "2": "JAPAN"},
+    }
+    symbols = SessionSymbols.from_turn_order(turn_order)
+
+    assert symbols.actor_of_seat(2) == 1
+    assert symbols.country_of_seat(1) == load_catalog().id_of("CONGO (DEMOCRATIC REPUBLIC OF THE)")
+    assert symbols.country_name(2) == "JAPAN"
+
+
+def test_derived_layer_does_not_load_the_catalog():
+    code = (
+        "import sys, derived.consequence_extractor, derived.window_index, engine.event_archive; "
+        "sys.exit('engine.catalog' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT).returncode == 0
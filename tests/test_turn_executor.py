@@ -0,0 +1,62 @@
+import time
+
+from derived.consequence_extractor import extract_consequences
+from engine.turn_executor import (
+    OK,
+    REJECT_BAD_TARGET,
+    REJECT_INSUFFICIENT,
+    REJECT_UNKNOWN_VERB,
+    TurnExecutor,
+)
+from engine.wallets import WalletTable
+
+
+def _executor(seats: int = 3, budget: int = 10) -> TurnExecutor:
+    resources = {
+        "resources_by_seat": [
+            {"seat": s, "country": f"C{s}", "wallet": {"budget": budget, "units": 0, "influence": 0}, "ledger": []}
+            for s in range(1, seats + 1)
+        ]
+    }
+    turn_order = {"seats_total": seats, "order": list(range(seats, 0, -1))}
+    return TurnExecutor(turn_order, WalletTable.from_resources(resources))
+
+
+def test_batch_resolves_in_turn_order_and_rejects_without_state_change():
+    ex = _executor()
+    actions = [
+        {"seat": 1, "verb": "SPEND", "resource": "budget", "amount": 4},
+        {"seat": 3, "verb": "TRANSFER", "resource": "budget", "amount": 10, "target": 1},
+        {"seat": 2, "verb": "SPEND", "resource": "budget", "amount": 11},
+        {"seat": 2, "verb": "FLY", "resource": "budget", "amount": 1},
+        {"seat": 2, "verb": "TRANSFER", "resource": "budget", "amount": 1, "target": 2},
+        {"seat": 1, "verb": "HOLD"},
+    ]
+    result = ex.execute_turn(1, actions)
+
+    assert result.codes == [OK, OK, REJECT_INSUFFICIENT, REJECT_UNKNOWN_VERB, REJECT_BAD_TARGET, OK]
+    assert ex.wallets.wallet(1)["budget"] == 16
+    assert ex.wallets.wallet(2)["budget"] == 10
+    assert ex.wallets.wallet(3)["budget"] == 0
+    assert [r["delta"] for r in ex.wallets.ledger[1]] == [10, -4]
+
+    # Events follow the extractor contract
+    states = extract_consequences(result.events, current_turn=1, window=1)
+    assert states["2"].signals.failures == 3
+    assert states["1"].signals.successes == 2
+
+
+def test_throughput_exceeds_10k_actions_per_second():
+    seats = 1000
+    ex = _executor(seats=seats, budget=10**9)
+    actions = [
+        {"seat": s, "verb": "TRANSFER", "resource": "budget", "amount": 1, "target": (s % seats) + 1}
+        for s in range(1, seats + 1)
+        for _ in range(20)
+    ]
+    start = time.perf_counter()
+    result = ex.execute_turn(1, actions)
+    elapsed = time.perf_counter() - start
+
+    assert result.applied == len(actions)
+    assert len(actions) / elapsed >= 10_000
@@ -0,0 +1,65 @@
+import time
+
+from engine.wallets import (
+    TRANSFER_BATCH_REJECTED,
+    TRANSFER_INSUFFICIENT,
+    TRANSFER_MALFORMED,
+    TRANSFER_OK,
+    WalletTable,
+)
+
+BUDGET, UNITS = 0, 1
+
+
+def _table(seats=3, budget=5):
+    table = WalletTable(seats)
+    for seat in range(1, seats + 1):
+        table.balances[table.index(seat, BUDGET)] = budget
+    return table
+
+
+def test_atomic_batch_nets_and_rejects_as_a_whole():
+    table = _table()
+    # Seat 1 overdraws alone, but is covered by the incoming transfer
+    codes = table.apply_transfers([(1, 2, BUDGET, 8), (3, 1, BUDGET, 4)], turn=1)
+    assert codes == [TRANSFER_OK, TRANSFER_OK]
+    assert [table.get(s, BUDGET) for s in (1, 2, 3)] == [1, 13, 1]
+
+    before = table.balances[:]
+    codes = table.apply_transfers([(2, 3, BUDGET, 1), (1, 0, BUDGET, 2)], turn=2)
+    assert codes == [TRANSFER_BATCH_REJECTED, TRANSFER_INSUFFICIENT]
+    assert table.balances == before
+
+    # One malformed entry rejects an otherwise covered batch
+    codes = table.apply_transfers([(2, 3, BUDGET, 1), (1, 1, BUDGET, 1)], turn=3)
+    assert codes == [TRANSFER_BATCH_REJECTED, TRANSFER_MALFORMED]
+    assert table.balances == before
+    assert [r["delta"] for r in table.ledger[1]] == [-8, 4]
+
+
+def test_per_entry_mode_rejects_only_overdrafts_in_order():
+    table = _table()
+    balances = table.balances
+    codes = table.apply_transfers(
+        [(1, 2, BUDGET, 4), (1, 0, BUDGET, 4), (2, 1, BUDGET, 9), (3, 2, UNITS, 1)],
+        turn=1,
+        atomic=False,
+    )
+    assert codes == [TRANSFER_OK, TRANSFER_INSUFFICIENT, TRANSFER_OK, TRANSFER_INSUFFICIENT]
+    assert [table.get(s, BUDGET) for s in (1, 2, 3)] == [10, 0, 5]
+    assert all(v >= 0 for v in table.balances)
+    # Committed in place: existing references see the new balances
+    assert table.balances is balances
+
+
+def test_bulk_batch_throughput():
+    seats = 2000
+    table = _table(seats=seats, budget=10**6)
+    transfers = [(s, (s % seats) + 1, BUDGET, 1) for s in range(1, seats + 1)] * 25
+
+    start = time.perf_counter()
+    codes = table.apply_transfers(transfers, turn=1)
+    elapsed = time.perf_counter() - start
+
+    assert codes.count(TRANSFER_OK) == len(transfers)
+    assert len(transfers) / elapsed >= 10_000
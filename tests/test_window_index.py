@@ -0,0 +1,32 @@
+from derived.consequence_extractor import extract_consequences
+from derived.window_index import TOLERANCE, WindowIndex
+from tests.fixtures import sample_events, synthetic_events
+
+
+def _close(a, b, scale):
+    return abs(a - b) <= TOLERANCE * (1.0 + scale)
+
+
+def test_window_signals_match_extractor_within_tolerance():
+    events = synthetic_events(40, 300, 2, seed=9)
+    index = WindowIndex.from_events(events)
+
+    for turn, window in ((300, 3), (300, 5), (150, 10), (20, 50)):
+        expected = extract_consequences(events, current_turn=turn, window=window)
+        observed = index.signals_window(turn, window)
+        assert set(observed) == set(expected)
+        for actor, state in expected.items():
+            got, want = observed[actor], state.signals
+            assert (got.attempts, got.successes, got.failures) == (want.attempts, want.successes, want.failures)
+            assert _close(got.net_delta, want.net_delta, 1e4)
+            assert _close(got.avg_cost, want.avg_cost, 1e4)
+            assert _close(got.outcome_variance, want.outcome_variance, 1e4)
+
+
+def test_point_queries_on_fixture():
+    index = WindowIndex.from_events(sample_events())
+    sig = index.signals("A", 6, 10)
+    assert (sig.attempts, sig.successes, sig.net_delta) == (5, 4, 15.0)
+    assert abs(sig.outcome_variance - 4.4) < 1e-12
+    assert index.signals("A", 1, 5) is None
+    assert index.turn_delta("B", 8) == -3.0 and index.turn_delta("B", 11) == 0.0